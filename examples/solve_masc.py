@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+# solve simple substitution with the aldegonde.solve engines instead of simanneal
+# IDEAS: steepest ascent (is practical? 28x27=756 evaluations)
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from aldegonde import masc
+from aldegonde.fitness import MascSwapFitness
+from aldegonde.solve import (
+    SolveResult,
+    StopCheck,
+    anneal_incremental,
+    masc_swap_proposal,
+    run_restarts,
+)
+from aldegonde.stats import compare
+from aldegonde.stats.ngrams import ngram_distribution
+
+CIPHERTEXT = """D LKCJ QPFW DJK PC D JDLDXO MDI MDI DADO PQ PE D BDIR QPFW MKI QGW IWTWLLPKC DLQGKUJG QGW BWDQG EQDI GDE TWWC BWEQIKOWB PFNWIPDL QIKKNE GDYW BIPYWC QGW IWTWL MKIZWE MIKF QGWPI GPBBWC TDEW DCB NUIEUWB QGWF DZIKEE QGW JDLDXO WYDBPCJ QGW BIWDBWB PFNWIPDL EQDIMLWWQ D JIKUN KM MIWWBKF MPJGQWIE LWB TO LURW EROADLRWI GDE WEQDTLPEGWB D CWA EWZIWQ TDEW KC QGW IWFKQW PZW AKILB KM GKQG QGW WYPL LKIB BDIQG YDBWI KTEWEEWB APQG MPCBPCJ OKUCJ EROADLRWI GDE BPENDQZGWB QGKUEDCBE KM IWFKQW NIKTWE PCQK QGW MDI IWDZGWE KM ENDZW"""
+
+AFFINE = """LREKMEPQOCPCBOYGYWPPEHFIWPFZYQGDZERGYPWFYWECYOJEQCMYEGFGYPWFCYMJ
+YFGFMFGWPQGDZERGPGFFZEYCIEDBCGPFEHFBEFFERQCPJEEPQRODFEXFWCPOWPEWLY
+ETERCBXGLLEREPFQGDZERFEHFBEFFERYXEDEPXGPSWPGFYDWYGFGWPGPFZEIEYYCSE"""
+
+S = """JTQTIRVRBOZNVLBOTGWYZSBAFVPYZRNJAPEPVFATNLROMROSBAGNJRBONEBWJRJNVUTQQNVYBOJAREWJROMJBJZTOTTLSBARJNQSATLZRJYZYBYX"""
+
+S2 = """Z XIAY NYBNXZQYP. Z XZFY WCY SCIIPCZQM PIVQN WCYO KBFY BP WCYO GXO RO.  NIVMXBP BNBKP"""
+
+S9 = """TQJYZRCKX JIGC VR CIXVCK RQ HQ I BQR QP RLVENX, OZR JQXR QP RLC RLVENX RLCU JIGC VR CIXVCK RQ HQ HQER ECCH RQ OC HQEC.  IEHU KQQECU"""
+
+alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+CT = "".join(c for c in CIPHERTEXT if c in alphabet)
+
+
+def startermapping(ciphertext: Sequence[str]) -> dict[str, str]:
+    """find a good starting point based on unigram distribution"""
+    dist: dict[str, int] = ngram_distribution(ciphertext, length=1)
+    # dist needs to be padded in case not all letters exist
+    for e in set(compare.unigrams.keys()) - set(dist.keys()):
+        dist[e] = 0
+
+    sorted_unigrams: list[tuple[str, int]] = sorted(
+        compare.unigrams.items(),
+        key=lambda x: x[1],
+    )
+    sorted_ngrams: list[tuple[str, int]] = sorted(dist.items(), key=lambda x: x[1])
+    assert len(sorted_unigrams) == len(sorted_ngrams)
+
+    key: dict[str, str] = {}
+    for (letter, _), (symbol, _) in zip(sorted_unigrams, sorted_ngrams):
+        key[letter] = symbol
+
+    return key
+
+
+def restart(*, seed: int, stop: StopCheck) -> SolveResult[np.ndarray]:
+    """
+    one annealing run from the frequency-matched key; swaps rescore only the
+    n-grams over the two swapped cipher letters
+    """
+    fitness = MascSwapFitness.from_text(CT, startermapping(CT), compare.quadgramscore)
+    return anneal_incremental(
+        fitness,
+        masc_swap_proposal(len(alphabet)),
+        steps=50000,
+        tmax=20.0,
+        seed=seed,
+        stop=stop,
+    )
+
+
+def solve_anneal() -> None:
+    index, result = run_restarts(restart, restarts=8)
+    key = {p: alphabet[c] for p, c in zip(alphabet, result.state.tolist())}
+    print(
+        f"restart {index}: {-result.energy:.2f}, {result.iterations_per_second:.0f} it/s"
+    )
+    print("".join(masc.masc_decrypt(CT, key)))
+
+
+if __name__ == "__main__":
+    solve_anneal()
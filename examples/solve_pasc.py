@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+# solve periodic ciphers with the aldegonde.solve engines instead of simanneal
+
+from aldegonde import pasc
+from aldegonde.fitness import PascPeriodicFitness
+from aldegonde.solve import (
+    PascKeywordMoves,
+    Problem,
+    QuagmireMoves,
+    SolveResult,
+    StopCheck,
+    anneal,
+    anneal_incremental,
+    parallel_tempering,
+    pasc_keyword_proposal,
+    run_restarts,
+)
+from aldegonde.stats import compare
+
+alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+PT = """ITWASTHEBESTOFTIMESITWASTHEWORSTOFTIMESITWASTHEAGEOFWISDOMITWASTHEAGEOF
+FOOLISHNESSITWASTHEEPOCHOFBELIEFITWASTHEEPOCHOFINCREDULITYITWASTHESEASONOFLIGHT
+ITWASTHESEASONOFDARKNESSITWASTHESPRINGOFHOPEITWASTHEWINTEROFDESPAIR"""
+
+TR = pasc.variantbeaufort_tr(alphabet)
+LEN = 10
+CT = "".join(
+    pasc.pasc_encrypt("".join(c for c in PT if c in alphabet), "FOUNDATION", TR)
+)
+
+
+def solve_incremental() -> None:
+    """
+    anneal on the incremental fitness: each move rescores one column only
+    """
+    fitness = PascPeriodicFitness.from_text(CT, "A" * LEN, TR, compare.quadgramscore)
+    result = anneal_incremental(
+        fitness, pasc_keyword_proposal(LEN, len(alphabet)), steps=20000, seed=1
+    )
+    keyword = [fitness.compiled.keys[k] for k in result.state]
+    print("".join(keyword), -result.energy, f"{result.iterations_per_second:.0f} it/s")
+    print("".join(pasc.pasc_decrypt(CT, keyword, TR)))
+
+
+def solve_tempering() -> None:
+    """
+    parallel tempering on the plain state/move/energy protocol
+    """
+
+    def energy(keyword: list[str]) -> float:
+        return -compare.quadgramscore("".join(pasc.pasc_decrypt(CT, keyword, TR)))
+
+    problem = Problem(PascKeywordMoves(alphabet, LEN), energy)
+    result = parallel_tempering(problem, steps=1000, seed=1)
+    print(
+        "".join(result.state),
+        -result.energy,
+        f"{result.iterations_per_second:.0f} it/s",
+    )
+
+
+def mixed_tr(mixed: list[str]) -> pasc.TR[str]:
+    """
+    one mixed cipher alphabet, shifted per keyword letter: row k maps the
+    j-th plaintext letter to mixed[j] moved on by the index of k
+
+    this covers vigenere, beaufort, variant beaufort and any shifted MASC
+    """
+    tr: pasc.TR[str] = {}
+    for i, k in enumerate(alphabet):
+        tr[k] = {
+            a: alphabet[(alphabet.index(m) + i) % len(alphabet)]
+            for a, m in zip(alphabet, mixed)
+        }
+    return tr
+
+
+def mixed_energy(state: tuple[list[str], list[str]]) -> float:
+    mixed, keyword = state
+    return -compare.quadgramscore(
+        "".join(pasc.pasc_decrypt(CT, keyword, mixed_tr(mixed)))
+    )
+
+
+def mixed_restart(
+    *, seed: int, stop: StopCheck
+) -> SolveResult[tuple[list[str], list[str]]]:
+    """
+    one annealing run over (mixed alphabet, keyword) pairs
+    """
+    problem = Problem(QuagmireMoves(alphabet, LEN), mixed_energy)
+    return anneal(problem, steps=20000, tmax=30.0, seed=seed, stop=stop)
+
+
+def solve_mixed() -> None:
+    """
+    unknown mixed alphabet and keyword: seeded restarts on a process pool
+    """
+    index, result = run_restarts(mixed_restart, restarts=4)
+    mixed, keyword = result.state
+    print("".join(mixed), "".join(keyword), -result.energy, f"restart {index}")
+    print("".join(pasc.pasc_decrypt(CT, keyword, mixed_tr(mixed))))
+
+
+if __name__ == "__main__":
+    solve_incremental()
+    solve_tempering()
+    solve_mixed()
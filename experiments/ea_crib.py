@@ -20,6 +20,7 @@ import sys
 from collections import Counter
 
 from aldegonde import c3301
+from aldegonde.lm import Transliterator
 
 DATA = "data/page0-58.txt"
 WORDS = "/usr/share/dict/words"
@@ -36,23 +37,15 @@ SINGLE = {"F": "ᚠ", "U": "ᚢ", "O": "ᚩ", "R": "ᚱ", "C": "ᚳ", "K": "ᚳ"
           "A": "ᚪ", "Y": "ᚣ", "Q": "ᚳ", "V": "ᚠ", "Z": "ᛋ"}
 
 
+TO_RUNEGLISH = Transliterator([*DIGRAPHS.items(), *SINGLE.items()])
+
+
 def to_runeglish(word: str) -> list[str] | None:
     """Encode an English word to a runeglish rune list, or None if it has a
     character outside the supported set."""
-    w = word.upper()
-    out: list[str] = []
-    i = 0
-    while i < len(w):
-        dg = w[i:i + 2]
-        if dg in DIGRAPHS:
-            out.append(DIGRAPHS[dg])
-            i += 2
-        elif w[i] in SINGLE:
-            out.append(SINGLE[w[i]])
-            i += 1
-        else:
-            return None
-    return out
+    if any(c not in SINGLE for c in word.upper()):
+        return None
+    return list(TO_RUNEGLISH(word))
 
 
 def parse_words(text: str) -> list[str]:
@@ -18,6 +18,7 @@ from collections import Counter, defaultdict
 sys.path.insert(0, "src")
 
 from aldegonde import c3301
+from aldegonde.corpus import load_corpus
 
 ALPHABET = c3301.CICADA_ALPHABET
 ENG = c3301.CICADA_ENGLISH_ALPHABET
@@ -28,8 +29,7 @@ def load(filepath: str = "data/page0-58.txt") -> tuple[list[int], str]:
     """Load as (index_stream, raw_text)."""
     with open(filepath) as f:
         raw = f.read()
-    indices = [c3301.r2i(c) for c in raw if c in ALPHABET]
-    return indices, raw
+    return load_corpus(filepath).runes.tolist(), raw
 
 
 def rune_pos_to_raw_pos(raw: str, rune_pos: int) -> int:
@@ -21,6 +21,7 @@ from collections import Counter
 sys.path.insert(0, "src")
 
 from aldegonde import c3301
+from aldegonde.corpus import load_corpus
 from aldegonde.stats.ioc import ioc as compute_ioc
 
 ALPHABET = c3301.CICADA_ALPHABET
@@ -38,9 +39,7 @@ PRIME_SET = set(GP_PRIMES)
 
 
 def load() -> list[int]:
-    with open("data/page0-58.txt") as f:
-        text = f.read()
-    return [c3301.r2i(c) for c in text if c in ALPHABET]
+    return load_corpus("data/page0-58.txt").runes.tolist()
 
 
 def ct_primes(ct_indices: list[int]) -> list[int]:
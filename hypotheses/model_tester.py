@@ -27,6 +27,7 @@ from itertools import product
 sys.path.insert(0, "src")
 
 from aldegonde import c3301
+from aldegonde.corpus import load_corpus
 from aldegonde.stats.ioc import ioc as compute_ioc
 
 ALPHABET = c3301.CICADA_ALPHABET
@@ -54,9 +55,7 @@ def mod_inv(a: int) -> int:
 
 def load_ciphertext(filepath: str = "data/page0-58.txt") -> list[int]:
     """Load ciphertext as a list of rune indices (0-28)."""
-    with open(filepath) as f:
-        raw = f.read()
-    return [c3301.r2i(c) for c in raw if c in ALPHABET]
+    return load_corpus(filepath).runes.tolist()
 
 
 # ---- Scoring ----
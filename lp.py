@@ -10,19 +10,15 @@ from functools import partial
 from scipy.stats import poisson
 
 from aldegonde import pasc, masc, auto, c3301
+from aldegonde.corpus import load_corpus
 from aldegonde.stats import print_ioc_statistics, print_kappa, kappa
-from aldegonde.stats import family_pvalue
+from aldegonde.stats import TextAnalysis, family_pvalue, kernels
 from aldegonde.stats import repeats, dist, ngrams, entropy, isomorph, position
 from aldegonde.grams import bigram_diagram
 from aldegonde.maths import factor, primes, totient, modular, moebius
 from aldegonde.analysis import friedman, kasiski, krakup, indepth, coincidence
 
 
-def runes_only(text: str) -> str:
-    """Keep only Cicada runes, dropping separators and Latin annotations."""
-    return "".join(ch for ch in text if ch in c3301.CICADA_ALPHABET)
-
-
 def deltastream(runes: list[int], skip: int = 1) -> list[int]:
     """
     deltastream mod MAX
@@ -41,25 +37,25 @@ def kappa_profile(runes: list[int], skips: list[int]) -> dict[int, float]:
 
 
 
-# with open("data/page54-55.txt") as f:
-with open("data/page0-56.txt") as f:
-    lp = f.read()
+# corpus = load_corpus("data/page54-55.txt")
+corpus = load_corpus("data/page0-56.txt")
 
-segments = lp.split("$")
-# segments = [lp]
-z = segments[0:10]
-# z = segments[0:1]
-# z = segments[9]
+segments = corpus.strings("segment", keep_empty=True)
+# segments = [corpus.text()]
+scope = slice(0, 10)
+# scope = slice(0, 1)
+# scope = slice(9, 10)
+z = segments[scope]
 y = ["".join(z)]
 
 
 print(f"{len(segments)} segments")
 
 # Structural units for in-depth and position tests, same scope as the analysis
-source = "".join(z)
-words = [w for w in (runes_only(w) for w in source.split("-")) if w]
-lines = [l for l in (runes_only(l) for l in source.split("/")) if l]
-sections = [s for s in (runes_only(s) for s in z) if s]
+start, stop = corpus.span("segment", scope.start, scope.stop)
+words = corpus.strings("word", start=start, stop=stop)
+lines = corpus.strings("line", start=start, stop=stop)
+sections = [s for s in z if s]
 
 # print("\n=== IN-DEPTH ALIGNMENT (shared keystream at unit boundaries) ===")
 # for units, name in ((words, "words"), (lines, "lines"), (sections, "sections")):
@@ -118,11 +114,13 @@ for i, s in enumerate(y):
         entropy.shannon_entropy(seg)
         runes = [c3301.r2i(ch) for ch in seg]
         null = c3301.low_doublet_null()
+        # shared n-gram counts, kappa spectra and suffix array for the diagnostics
+        analysis = TextAnalysis(seg)
         # IOC against the uniform null, then the same grid against the
         # low-doublet null. The latter preserves rune frequencies exactly, so
         # monographic IOC is invariant (z=0) and only multigraphic IOC carries
         # signal beyond frequencies and doublets.
-        print_ioc_statistics(seg, alphabetsize=29)
+        print_ioc_statistics(seg, alphabetsize=29, analysis=analysis)
         print_ioc_statistics(
             seg,
             alphabetsize=29,
@@ -132,9 +130,9 @@ for i, s in enumerate(y):
         )
         bigram_diagram.print_auto_bigram_diagram(seg, alphabet=c3301.CICADA_ALPHABET)
         # bigram_diagram.print_bigram_diagram(seg, aut, alphabet=c3301.CICADA_ALPHABET)
-        print_kappa(seg, trace=False)
-        print_kappa(seg, length=2, trace=False)  # digraphic kappa
-        print_kappa(seg, length=3, trace=False)  # trigraphic kappa
+        print_kappa(seg, trace=False, analysis=analysis)
+        print_kappa(seg, length=2, trace=False, analysis=analysis)  # digraphic kappa
+        print_kappa(seg, length=3, trace=False, analysis=analysis)  # trigraphic kappa
 
         # The same kappa table against the low-doublet null (rune frequencies and
         # doublet rate matched to the text): skip 1 now reads ~0 because the
@@ -150,7 +148,9 @@ for i, s in enumerate(y):
         )
         # Family-wise test of the strongest period, skip>=2.
         skips = list(range(1, 21))
-        profile = partial(kappa_profile, skips=skips)
+        profile = kernels.with_kernel(
+            partial(kappa_profile, skips=skips), kernels.kappa_values
+        )
         fam = family_pvalue(profile, null, runes, keys=skips[1:], trials=300, seed=0)
         print(
             f"  strongest period (skip>=2): skip={fam.key} "
@@ -175,7 +175,7 @@ for i, s in enumerate(y):
             print(f"  lag={lag:2d}: {parts}")
         friedman.friedman_test(seg, maxperiod=34)
         # friedman.friedman_test_with_interrupter(seg, alphabet=c3301.CICADA_ALPHABET, maxperiod=34)
-        repeats.print_repeat_statistics(seg, minimum=2)
+        repeats.print_repeat_statistics(seg, minimum=2, analysis=analysis)
         repeats.print_repeat_statistics(
             seg,
             minimum=2,
@@ -183,8 +183,8 @@ for i, s in enumerate(y):
             null_label="low-doublet null (rune frequencies and doublet rate matched to the text)",
             trials=300,
         )
-        repeats.print_repeat_positions(seg, minimum=5)
-        # isomorph.print_isomorph_statistics(seg)
+        repeats.print_repeat_positions(seg, minimum=5, analysis=analysis)
+        # isomorph.print_isomorph_statistics(seg, analysis=analysis)
 
         # KRAKUP: Cyclic phenomena in nonhomogeneous material
         # krakup.print_krakup_analysis(seg, min_period=2, max_period=40, window_size=100, step=10)
@@ -12,6 +12,7 @@ from aldegonde.analysis.indepth import AlignmentResult, alignment_coincidence
 from aldegonde.analysis.kasiski import (
     distance_spectrum,
     kasiski_examination,
+    kasiski_significance,
     print_kasiski_statistics,
     repeat_distances,
 )
@@ -45,6 +46,7 @@ __all__ = [
     # kasiski
     "distance_spectrum",
     "kasiski_examination",
+    "kasiski_significance",
     "print_kasiski_statistics",
     "repeat_distances",
     # split
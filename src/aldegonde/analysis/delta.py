@@ -5,8 +5,14 @@ Produces a derived sequence that can be fed back into the diagnostic functions.
 
 from collections.abc import Sequence
 from enum import Enum
+from typing import Any, TypeVar, overload
 
-from aldegonde.maths.modular import modDivide
+import numpy as np
+
+from aldegonde.maths.modular import modDivide, modInverse
+from aldegonde.stats.encoded import EncodedText
+
+T = TypeVar("T")
 
 
 class DeltaOp(Enum):
@@ -20,17 +26,66 @@ class DeltaOp(Enum):
     RDIV = "rdiv"  # c[i] / c[i+skip]; raises on a non-invertible divisor
 
 
+def _encoded_delta(text: EncodedText[T], skip: int, op: DeltaOp) -> EncodedText[T]:
+    """delta of a text encoded over the alphabet, as array arithmetic."""
+    modulus = text.alphabet.size
+    codes = text.codes.astype(np.int64)
+    a, b = codes[: max(len(codes) - skip, 0)], codes[skip:]
+    if op in (DeltaOp.DIV, DeltaOp.RDIV):
+        if op is DeltaOp.RDIV:
+            a, b = b, a
+        inverses = np.array([modInverse(x, modulus) for x in range(modulus)])
+        undefined = np.flatnonzero(inverses[a] == -1)
+        if len(undefined):
+            i = int(undefined[0])
+            msg = f"Division not defined {b[i]}/{a[i]}%{modulus}"
+            raise ValueError(msg)
+        values = b * inverses[a]
+    elif op is DeltaOp.SUB:
+        values = b - a
+    elif op is DeltaOp.RSUB:
+        values = a - b
+    elif op is DeltaOp.ADD:
+        values = b + a
+    else:  # DeltaOp.MUL
+        values = b * a
+    # the sequence path returns a list, so slices print as list slices
+    return EncodedText.from_codes(values % modulus, text.alphabet, container=list)
+
+
+@overload
+def delta(  # type: ignore[overload-overlap]
+    text: EncodedText[T],
+    alphabet: Sequence[object],
+    skip: int = 1,
+    op: DeltaOp = DeltaOp.SUB,
+) -> EncodedText[T]: ...
+
+
+@overload
+def delta(
+    text: Sequence[object],
+    alphabet: Sequence[object],
+    skip: int = 1,
+    op: DeltaOp = DeltaOp.SUB,
+) -> list[object]: ...
+
+
 def delta(
     text: Sequence[object],
     alphabet: Sequence[object],
     skip: int = 1,
     op: DeltaOp = DeltaOp.SUB,
-) -> list[object]:
+) -> list[object] | EncodedText[Any]:
     """Combine each symbol with the one `skip` positions later, modulo alphabet size.
 
     The result is a list of alphabet symbols, one shorter than the input by `skip`.
     DIV raises ValueError when the divisor symbol has no modular inverse.
+    An EncodedText over `alphabet` gives an EncodedText, so chained deltas
+    stay encoded.
     """
+    if isinstance(text, EncodedText) and text.alphabet.symbols == list(alphabet):
+        return _encoded_delta(text, skip, op)
     index = {symbol: i for i, symbol in enumerate(alphabet)}
     modulus = len(alphabet)
     result: list[object] = []
@@ -53,11 +108,29 @@ def delta(
     return result
 
 
+@overload
+def delta2(  # type: ignore[overload-overlap]
+    text: EncodedText[T],
+    alphabet: Sequence[object],
+    skip: int = 1,
+    op: DeltaOp = DeltaOp.SUB,
+) -> EncodedText[T]: ...
+
+
+@overload
+def delta2(
+    text: Sequence[object],
+    alphabet: Sequence[object],
+    skip: int = 1,
+    op: DeltaOp = DeltaOp.SUB,
+) -> list[object]: ...
+
+
 def delta2(
     text: Sequence[object],
     alphabet: Sequence[object],
     skip: int = 1,
     op: DeltaOp = DeltaOp.SUB,
-) -> list[object]:
+) -> list[object] | EncodedText[Any]:
     """Second-order delta: apply `delta` twice."""
     return delta(delta(text, alphabet, skip, op), alphabet, skip, op)
@@ -7,7 +7,7 @@ from typing import TypeVar
 from aldegonde.analysis.split import split_by_slice_interrupted
 from aldegonde.exceptions import InsufficientDataError
 from aldegonde.stats.ioc import ioc
-from aldegonde.stats.kappa import kappa
+from aldegonde.stats.kappa import kappa_spectrum
 
 T = TypeVar("T")
 
@@ -35,8 +35,9 @@ def friedman_test(
     if maxperiod > len(ciphertext):
         maxperiod = len(ciphertext) - 1
 
+    kappas = kappa_spectrum(ciphertext, max(maxperiod, 0)).kappa
     for period in range(minperiod, maxperiod + 1):
-        kscore = kappa(ciphertext, period)
+        kscore = float(kappas[period])
         iocs: list[float] = []
         for k in range(period):
             v = ciphertext[slice(k, len(ciphertext), period)]
@@ -95,6 +96,7 @@ def friedman_test_with_interrupter(
     # avgioc contains the key length as key. as value it's the avgioc
     # delta is the difference between the avgioc and the max of avgioc of all lower values
 
+    kappas = kappa_spectrum(ciphertext, max(maxperiod, 0)).kappa * len(alphabet)
     for i, interrupter in enumerate(alphabet):
         avgioc: dict[int, float] = {}
         medioc: dict[int, float] = {}
@@ -107,7 +109,7 @@ def friedman_test_with_interrupter(
             )
 
         for period in range(minperiod, maxperiod + 1):
-            kscore = kappa(ciphertext, period) * len(alphabet)
+            kscore = float(kappas[period])
             iocs: list[float] = []
             kv = split_by_slice_interrupted(
                 ciphertext,
@@ -4,7 +4,10 @@ Jens Guballa's algorithm using piecemeal bigram scoring to break PASC
 
 from typing import TypeVar
 
+import numpy as np
+
 from aldegonde import pasc
+from aldegonde.exceptions import InvalidInputError
 from aldegonde.stats import compare
 
 T = TypeVar("T")
@@ -60,26 +63,52 @@ def bigram_break_pasc(
     key: list[str] = []
 
     # take all keys of the second index, the first one may not have the full alphabet
-    alphabet = tabularecta[list(tabularecta.keys())[0]].keys()
-
-    rtr = pasc.reverse_tr(tabularecta)
+    alphabet = list(tabularecta[list(tabularecta.keys())[0]].keys())
+
+    compiled = pasc.compile_tr(tabularecta)
+    scorer = compare.bigramscore
+    size = len(scorer.alphabet)
+    # bigram log probabilities with a trailing floor row and column, so a
+    # plaintext symbol outside the scorer alphabet (index -1) scores the floor
+    bigram_log = np.full((size + 1, size + 1), scorer.floor)
+    bigram_log[:size, :size] = scorer.table.reshape(size, size)
+    to_scorer = np.array([scorer.index.get(str(s), -1) for s in compiled.symbols])
+    # -1 marks a symbol or cell the tabula recta lacks; fancy indexing would
+    # wrap it to the last row, so reject it as the dict lookups did
+    rows = compiled.encode_keyword(alphabet)
+    if (rows < 0).any():
+        missing = alphabet[int(np.argmax(rows < 0))]
+        msg = f"tabula recta has no row for key symbol '{missing}'"
+        raise InvalidInputError(msg, input_value=missing)
+    encoded = compiled.encode(ciphertext)
+    if (encoded < 0).any():
+        missing = ciphertext[int(np.argmax(encoded < 0))]
+        msg = f"ciphertext symbol '{missing}' is not in the tabula recta"
+        raise InvalidInputError(msg, input_value=missing)
+    inverse = compiled.inverse[rows]
+    undefined = inverse[:, encoded] < 0
+    if undefined.any():
+        key_at, text_at = np.unravel_index(int(np.argmax(undefined)), undefined.shape)
+        missing, key_symbol = ciphertext[int(text_at)], alphabet[int(key_at)]
+        msg = f"ciphertext symbol '{missing}' has no plaintext under key '{key_symbol}'"
+        raise InvalidInputError(msg, input_value=missing)
+    # plaintext symbol per (key symbol, ciphertext symbol)
+    clear = to_scorer[inverse]
 
     for key_idx in range(key_len):
         best_fitness: float = -10000000.0
         prev_best_score: float = best_fitness - 1.0
         prev_best_key_ch2: str = ""
-        for key_ch1 in alphabet:
-            for key_ch2 in alphabet:
-                fitness: float = 0.0
-                for text_idx in range(key_idx, len(ciphertext) - 1, key_len):
-                    clear_ch1 = rtr[key_ch1][ciphertext[text_idx]]
-                    clear_ch2 = rtr[key_ch2][ciphertext[text_idx + 1]]
-                    fitness = fitness + compare.bigramscore(clear_ch1 + clear_ch2)
-
-                if fitness > best_fitness:
-                    best_fitness = fitness
-                    best_key_ch1: str = key_ch1
-                    best_key_ch2: str = key_ch2
+        positions = np.arange(key_idx, len(ciphertext) - 1, key_len)
+        clear_ch1 = clear[:, encoded[positions]]
+        clear_ch2 = clear[:, encoded[positions + 1]]
+        # fitness[i, j]: bigram score of the column under key symbols i and j
+        fitness = bigram_log[clear_ch1[:, None, :], clear_ch2[None, :, :]].sum(axis=-1)
+        best = int(np.argmax(fitness))
+        if fitness.flat[best] > best_fitness:
+            best_fitness = float(fitness.flat[best])
+            best_key_ch1: str = alphabet[best // len(alphabet)]
+            best_key_ch2: str = alphabet[best % len(alphabet)]
 
         if key_idx == 0:
             best_score_0: float = best_fitness
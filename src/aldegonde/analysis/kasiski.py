@@ -15,15 +15,24 @@ equals the number of coincidences at shift d.
 All functions work on arbitrary alphabets (runes, integers, letters).
 """
 
-from collections import Counter, defaultdict
+from collections import Counter
 from collections.abc import Sequence
+from functools import partial
 from math import sqrt
 from typing import TypeVar
 
+import numpy as np
+
 from aldegonde.exceptions import InvalidInputError
-from aldegonde.stats.ngrams import iterngram_positions
-from aldegonde.stats.nulls import NullModel
-from aldegonde.stats.resample import monte_carlo_map
+from aldegonde.stats.kappa import _batch_lag_coincidences
+from aldegonde.stats.ngrams import _rolling_codes, _symbol_codes
+from aldegonde.stats.nulls import NullModel, shuffle_matrix
+from aldegonde.stats.resample import (
+    NullComparison,
+    batch_monte_carlo_map,
+    monte_carlo_map,
+)
+from aldegonde.stats.suffix import RepeatIndex
 from aldegonde.stats.zscore import z_score
 from aldegonde.validation import validate_positive_integer, validate_text_sequence
 
@@ -62,25 +71,12 @@ def repeat_distances(
     """
     validate_positive_integer(length, "length")
     validate_text_sequence(text, min_length=length + 1)
-    positions: dict[tuple[T, ...], list[int]] = defaultdict(list)
-    for index, gram in iterngram_positions(text, length=length, cut=cut):
-        positions[tuple(gram)].append(index)
-
-    out: dict[tuple[T, ...], list[int]] = {}
-    for gram, occurrences in positions.items():
-        if len(occurrences) < 2:
-            continue
-        distances: list[int] = []
-        # occurrences are ascending, so the inner loop can stop at the cap
-        for i, first in enumerate(occurrences):
-            for second in occurrences[i + 1 :]:
-                distance = second - first
-                if max_distance is not None and distance > max_distance:
-                    break
-                distances.append(distance)
-        if distances:
-            out[gram] = distances
-    return out
+    return {
+        tuple(text[positions[0] : positions[0] + length]): distances.tolist()
+        for positions, distances in RepeatIndex(text).pair_distances(
+            length, cut, max_distance
+        )
+    }
 
 
 def distance_spectrum(
@@ -109,15 +105,15 @@ def distance_spectrum(
         InvalidInputError: If length is not a positive integer
         InsufficientDataError: If text is shorter than length + 1
     """
-    spectrum: Counter[int] = Counter()
-    for distances in repeat_distances(
-        text,
-        length=length,
-        cut=cut,
-        max_distance=max_distance,
-    ).values():
-        spectrum.update(distances)
-    return spectrum
+    validate_positive_integer(length, "length")
+    validate_text_sequence(text, min_length=length + 1)
+    return _as_counter(RepeatIndex(text).distance_spectrum(length, cut, max_distance))
+
+
+def _as_counter(spectrum: np.ndarray) -> Counter[int]:
+    """The nonzero entries of a dense distance spectrum."""
+    distances = np.flatnonzero(spectrum)
+    return Counter(dict(zip(distances.tolist(), spectrum[distances].tolist())))
 
 
 def _validate_bounds(minimum: int, maximum: int, name: str) -> None:
@@ -134,30 +130,53 @@ def _collect_distances(
     min_length: int,
     max_length: int,
     max_distance: int | None,
-) -> Counter[int]:
-    """Pool repeat distances over all n-gram sizes in a range."""
+) -> np.ndarray:
+    """Pool repeat distances over all n-gram sizes in a range.
+
+    Returns:
+        Dense histogram: element d counts the repeated n-gram pairs at
+        distance d, over all sizes
+    """
     _validate_bounds(min_length, max_length, "length")
     validate_text_sequence(text, min_length=min_length + 1)
-    distances: Counter[int] = Counter()
+    return _pooled_spectrum(RepeatIndex(text), min_length, max_length, max_distance)
+
+
+def _pooled_spectrum(
+    index: RepeatIndex, min_length: int, max_length: int, max_distance: int | None
+) -> np.ndarray:
+    """Distance histogram of one indexed text, pooled over n-gram sizes."""
+    top = max(index.size - min_length, 0) if max_distance is None else max_distance
+    histogram = np.zeros(top + 1, dtype=np.int64)
     for length in range(min_length, max_length + 1):
-        if length + 1 > len(text):
+        if length + 1 > index.size:
             break
-        distances.update(
-            distance_spectrum(text, length=length, max_distance=max_distance),
-        )
-    return distances
+        histogram += index.distance_spectrum(length, max_distance=top)
+    return histogram
 
 
 def _count_divisible(
-    distances: Counter[int],
+    histogram: np.ndarray,
     min_period: int,
     max_period: int,
-) -> dict[int, int]:
-    """Count, for each candidate period, the distances it divides."""
-    return {
-        period: sum(c for d, c in distances.items() if d % period == 0)
-        for period in range(min_period, max_period + 1)
-    }
+) -> np.ndarray:
+    """Count, for each candidate period, the distances it divides.
+
+    A divisor sieve over the dense histogram: every distance adds its count
+    to each of its divisors in the period range, gathered per period as the
+    sum over its multiples, which is O(D log P) for D distances and P
+    periods. Works along the last axis, so a (K x D) stack of histograms
+    gives a (K x periods) matrix.
+
+    Returns:
+        counts[..., j]: the number of distances divisible by min_period + j
+    """
+    counts = np.zeros(
+        (*histogram.shape[:-1], max_period - min_period + 1), dtype=np.int64
+    )
+    for j, period in enumerate(range(min_period, max_period + 1)):
+        counts[..., j] = histogram[..., period::period].sum(axis=-1)
+    return counts
 
 
 def kasiski_examination(
@@ -198,16 +217,119 @@ def kasiski_examination(
         InsufficientDataError: If text is too short for min_length
     """
     _validate_bounds(min_period, max_period, "period")
-    distances = _collect_distances(text, min_length, max_length, max_distance)
-    total = sum(distances.values())
-    counts = _count_divisible(distances, min_period, max_period)
+    histogram = _collect_distances(text, min_length, max_length, max_distance)
+    total = int(histogram.sum())
+    counts = _count_divisible(histogram, min_period, max_period)
     scores = {
-        period: count * period / total if total > 0 else 0.0
-        for period, count in counts.items()
+        period: int(count) * period / total if total > 0 else 0.0
+        for period, count in zip(range(min_period, max_period + 1), counts)
     }
     return dict(sorted(scores.items(), key=lambda kv: kv[1], reverse=True))
 
 
+def _batch_pooled_spectrum(
+    batch: np.ndarray, min_length: int, max_length: int, max_distance: int | None
+) -> np.ndarray:
+    """_pooled_spectrum of every row of a (K x N) batch of symbol codes.
+
+    The n-gram ids of all rows are their base-|A| codes when those fit in
+    int64. Otherwise the rows are joined into one text with a distinct
+    separator after each, so a single RepeatIndex numbers the n-grams of all
+    rows; n-grams across a separator are unique and fall outside the rows.
+    The ids of each length are then lag-correlated per row in one pass.
+    """
+    rows, n = batch.shape
+    top = max(n - min_length, 0) if max_distance is None else max_distance
+    histograms = np.zeros((rows, top + 1), dtype=np.int64)
+    base = int(batch.max(initial=0)) + 1
+    index = None
+    if base**max_length >= 1 << 62:
+        separators = base + np.arange(rows)
+        index = RepeatIndex(np.column_stack((batch, separators)).ravel())
+    for length in range(min_length, max_length + 1):
+        if length + 1 > n:
+            break
+        if index is None:
+            grid = _rolling_codes(batch, length, base)
+        else:
+            ids = np.full(rows * (n + 1), -1, dtype=np.int64)
+            found = index.ngram_ids(length)
+            ids[: len(found)] = found
+            grid = ids.reshape(rows, n + 1)[:, : n - length + 1]
+        histograms[:, 1:] += _batch_lag_coincidences(grid, top)[:, 1:]
+    return histograms
+
+
+def _shuffle_counts(
+    min_length: int,
+    max_length: int,
+    max_distance: int | None,
+    min_period: int,
+    max_period: int,
+    batch: np.ndarray,
+) -> np.ndarray:
+    """Divisible distance counts per period for a (K x N) batch of texts."""
+    histograms = _batch_pooled_spectrum(batch, min_length, max_length, max_distance)
+    return _count_divisible(histograms, min_period, max_period)
+
+
+def kasiski_significance(
+    text: Sequence[T],
+    min_length: int = 1,
+    max_length: int = 5,
+    min_period: int = 2,
+    max_period: int = 20,
+    max_distance: int | None = None,
+    *,
+    trials: int = 200,
+    seed: int = 0,
+    batch_size: int = 100,
+) -> dict[int, NullComparison]:
+    """Significance of the Kasiski count of every period against a shuffle null.
+
+    The observed statistic is, per candidate period, the number of repeat
+    distances it divides, as in kasiski_examination. The null shuffles the
+    text, keeping the symbol frequencies but destroying any period. Each
+    batch of shuffles is indexed as one joined text, its distance histograms
+    are lag-correlated row by row in one pass, and one divisor sieve over
+    them yields the counts of all periods for all surrogates at once.
+
+    Args:
+        text: Sequence to analyze
+        min_length: Smallest n-gram size to examine
+        max_length: Largest n-gram size to examine
+        min_period: Smallest candidate period to score
+        max_period: Largest candidate period to score
+        max_distance: Ignore repeats further apart than this; None keeps all
+        trials: Number of shuffled surrogates
+        seed: Seed of the numpy generator drawing the shuffles
+        batch_size: Surrogates indexed and sieved per pass
+
+    Returns:
+        A NullComparison per period; p_upper is the chance that a shuffle
+        scores at least the observed count
+
+    Raises:
+        InvalidInputError: If length or period bounds are invalid
+        InsufficientDataError: If text is too short for min_length
+    """
+    _validate_bounds(min_period, max_period, "period")
+    _validate_bounds(min_length, max_length, "length")
+    validate_text_sequence(text, min_length=min_length + 1)
+    statistic = partial(
+        _shuffle_counts, min_length, max_length, max_distance, min_period, max_period
+    )
+    return batch_monte_carlo_map(
+        statistic,
+        shuffle_matrix,
+        _symbol_codes(text),
+        keys=list(range(min_period, max_period + 1)),
+        trials=trials,
+        seed=seed,
+        batch_size=batch_size,
+    )
+
+
 def print_kasiski_statistics(
     text: Sequence[T],
     min_length: int = 1,
@@ -229,8 +351,8 @@ def print_kasiski_statistics(
     closed-form Poisson standard score. Pass `null` (a resampler) to compare
     instead against a Monte Carlo null, for example one that preserves
     frequencies and the doublet rate; expected and z then come from that null,
-    and `null_label` names it in the header. The Monte Carlo path recomputes the
-    O(n^2) distance spectrum per surrogate, so it is costly on long texts; cap
+    and `null_label` names it in the header. The Monte Carlo path rebuilds the
+    repeat index and distance spectrum per surrogate, so on long texts cap
     trials and max_distance accordingly.
 
     Args:
@@ -250,14 +372,16 @@ def print_kasiski_statistics(
         InsufficientDataError: If text is too short for min_length
     """
     _validate_bounds(min_period, max_period, "period")
-    distances = _collect_distances(text, min_length, max_length, max_distance)
-    total = sum(distances.values())
+    histogram = _collect_distances(text, min_length, max_length, max_distance)
+    total = int(histogram.sum())
     if total == 0:
         print("kasiski: no repeated ngrams found")
         return
 
     periods = list(range(min_period, max_period + 1))
-    observed = _count_divisible(distances, min_period, max_period)
+    observed = dict(
+        zip(periods, _count_divisible(histogram, min_period, max_period).tolist())
+    )
 
     if null is None:
         print(
@@ -282,7 +406,7 @@ def print_kasiski_statistics(
     def statistic(sample: Sequence[object]) -> dict[int, float]:
         spectrum = _collect_distances(sample, min_length, max_length, max_distance)
         divisible = _count_divisible(spectrum, min_period, max_period)
-        return {period: float(divisible[period]) for period in periods}
+        return dict(zip(periods, divisible.astype(float).tolist()))
 
     observed_seq: Sequence[object] = text
     results = monte_carlo_map(
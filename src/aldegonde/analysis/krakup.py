@@ -19,15 +19,22 @@ The algorithm uses:
 4. Multi-resolution confirmation
 """
 
+import os
 from collections import Counter
 from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from math import log2
 from statistics import mean
 from typing import TypeVar
 
 import numpy as np
 
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.stats.ngrams import _symbol_codes
+from aldegonde.stats.resample import ExecutorKind
+
 T = TypeVar("T")
 
 
@@ -122,6 +129,85 @@ def differential_entropy_score(
     return 1.0
 
 
+SPECTROGRAM_CHUNK = 256
+"""Window positions evaluated together on the serial path."""
+
+
+def _residue_counts(segment: np.ndarray, period: int, alphabet: int) -> np.ndarray:
+    """Cumulative symbol counts along each residue class modulo `period`.
+
+    counts[k, r, a] is the number of positions q = r + i * period, i < k,
+    holding symbol a; the count over positions r + k0 * period up to (but
+    excluding) r + k1 * period is then counts[k1, r] - counts[k0, r].
+    """
+    rows = -(-len(segment) // period)
+    onehot = np.zeros((rows * period, alphabet), dtype=np.int32)
+    onehot[np.arange(len(segment)), segment] = 1
+    counts = np.zeros((rows + 1, period, alphabet), dtype=np.int32)
+    np.cumsum(onehot.reshape(rows, period, alphabet), axis=0, out=counts[1:])
+    return counts
+
+
+def _prefix_counts(values: np.ndarray, alphabet: int) -> np.ndarray:
+    """counts[t, a] is the number of positions before t holding value a."""
+    counts = np.zeros((len(values) + 1, alphabet), dtype=np.int32)
+    counts[np.arange(1, len(values) + 1), values] = 1
+    np.cumsum(counts, axis=0, out=counts)
+    return counts
+
+
+def _spectrogram_rows(
+    codes: np.ndarray,
+    numeric: np.ndarray,
+    min_period: int,
+    max_period: int,
+    window_size: int,
+    alphabet_size: int,
+    starts: np.ndarray,
+) -> np.ndarray:
+    """Spectrogram rows for the windows starting at `starts`, period by period.
+
+    Every score of a (window, period) cell is a difference of cumulative
+    counts: column symbol counts of `codes` per residue class, and matches at
+    the period lag and differences modulo the alphabet of `numeric` from
+    plain prefix sums. A whole column of the spectrogram is then array
+    arithmetic.
+    """
+    lo = int(starts[0])
+    stop = int(starts[-1]) + window_size
+    segment = numeric[lo:stop]
+    offsets = starts - lo
+    columns_segment = codes[lo:stop]
+    symbols = int(columns_segment.max()) + 1
+    rows = np.zeros((len(starts), max_period - min_period + 1))
+    for p_idx, p in enumerate(range(min_period, max_period + 1)):
+        if p >= window_size // 2:
+            continue
+        columns = np.arange(p)
+        heights = -(-(window_size - columns) // p)  # symbols per column
+        first = offsets[:, None] + columns[None, :]
+        counts = _residue_counts(columns_segment, p, symbols)
+        residues, k0 = first % p, first // p
+        column_counts = counts[k0 + heights, residues] - counts[k0, residues]
+        pairs = (column_counts * (column_counts - 1)).sum(axis=2)
+        ioc_score = (pairs / (heights * (heights - 1))).mean(axis=1)
+
+        lags = window_size - p
+        matches = np.concatenate(([0], np.cumsum(segment[p:] == segment[:-p])))
+        auto_score = (matches[offsets + lags] - matches[offsets]) / lags
+
+        diffs = (segment[p:] - segment[:-p]) % alphabet_size
+        diff_counts = _prefix_counts(diffs, alphabet_size)
+        freqs = (diff_counts[offsets + lags] - diff_counts[offsets]) / lags
+        logs = np.log2(freqs, out=np.zeros_like(freqs), where=freqs > 0)
+        entropy = -(freqs * logs).sum(axis=1)
+        max_entropy = log2(min(alphabet_size, lags))
+        diff_score = 1.0 - (entropy / max_entropy if max_entropy > 0 else 1.0)
+
+        rows[:, p_idx] = 0.4 * ioc_score + 0.3 * auto_score + 0.3 * diff_score
+    return rows
+
+
 def compute_spectrogram(
     text: Sequence[T],
     numeric: np.ndarray,
@@ -130,51 +216,87 @@ def compute_spectrogram(
     window_size: int,
     step: int,
     alphabet_size: int,
+    *,
+    executor: ExecutorKind = "serial",
+    workers: int | None = None,
 ) -> tuple[np.ndarray, list[tuple[int, int, float]]]:
     """
     Compute time-frequency spectrogram of periodicity.
 
+    Each cell combines the column IoC, the autocorrelation and the
+    differential entropy score of one window at one period, the same scores
+    as column_ioc, autocorrelation_score and differential_entropy_score, but
+    computed for all windows of a period at once from cumulative counts.
+    Blocks of windows can be spread over a thread or process pool.
+
+    Args:
+        text: Input text sequence; the column IoC counts its symbols
+        numeric: The text as returned by text_to_numeric, for the
+            autocorrelation and differential entropy scores
+        min_period: Minimum period to test
+        max_period: Maximum period to test
+        window_size: Size of sliding window
+        step: Step size for sliding window
+        alphabet_size: Modulus of the differences
+        executor: "serial", "thread" or "process"
+        workers: Pool size; None for os.cpu_count()
+
     Returns:
         spectrogram: 2D array [positions, periods] with strength values
         profile: List of (position, best_period, strength) tuples
+
+    Raises:
+        InvalidInputError: If numeric and text differ in length, or the
+            executor is unknown
     """
+    if len(numeric) != len(text):
+        msg = f"numeric has length {len(numeric)}, text has length {len(text)}"
+        raise InvalidInputError(msg, input_value=len(numeric))
     n_positions = (len(text) - window_size) // step + 1
     n_periods = max_period - min_period + 1
 
     if n_positions <= 0:
         return np.zeros((1, n_periods)), [(0, min_period, 0.0)]
 
-    spectrogram = np.zeros((n_positions, n_periods))
-    profile: list[tuple[int, int, float]] = []
-
-    for i in range(n_positions):
-        start = i * step
-        end = start + window_size
-        window_text = text[start:end]
-        window_numeric = numeric[start:end]
-
-        best_period = min_period
-        best_strength = 0.0
-
-        for p_idx, p in enumerate(range(min_period, max_period + 1)):
-            if p >= len(window_text) // 2:
-                continue
-
-            # Compute combined score for this period
-            ioc_score = column_ioc(window_text, p)
-            auto_score = autocorrelation_score(window_numeric, p)
-            diff_score = 1.0 - differential_entropy_score(
-                window_numeric, p, alphabet_size
-            )
-
-            strength = 0.4 * ioc_score + 0.3 * auto_score + 0.3 * diff_score
-            spectrogram[i, p_idx] = strength
-
-            if strength > best_strength:
-                best_strength = strength
-                best_period = p
-
-        profile.append((start, best_period, best_strength))
+    starts = np.arange(n_positions) * step
+    task = partial(
+        _spectrogram_rows,
+        _symbol_codes(text),
+        np.asarray(numeric, dtype=np.int64),
+        min_period,
+        max_period,
+        window_size,
+        alphabet_size,
+    )
+    if executor == "serial":
+        size = SPECTROGRAM_CHUNK
+    elif executor in ("thread", "process"):
+        size = max(1, -(-n_positions // (4 * (workers or os.cpu_count() or 1))))
+    else:
+        msg = f"executor must be 'serial', 'thread' or 'process', got {executor!r}"
+        raise InvalidInputError(msg, input_value=executor)
+    chunks = [starts[i : i + size] for i in range(0, n_positions, size)]
+    if executor == "serial":
+        blocks = [task(chunk) for chunk in chunks]
+    else:
+        pool: Executor = (
+            ThreadPoolExecutor(max_workers=workers)
+            if executor == "thread"
+            else ProcessPoolExecutor(max_workers=workers)
+        )
+        with pool:
+            blocks = list(pool.map(task, chunks))
+    spectrogram = np.concatenate(blocks)
+
+    # the first period reaching the highest positive strength, as a scan would
+    best = spectrogram.argmax(axis=1)
+    strengths = spectrogram[np.arange(n_positions), best]
+    profile: list[tuple[int, int, float]] = [
+        (int(start), min_period + int(b), float(v))
+        if v > 0
+        else (int(start), min_period, 0.0)
+        for start, b, v in zip(starts, best, strengths)
+    ]
 
     return spectrogram, profile
 
@@ -349,6 +471,9 @@ def krakup(
     window_size: int = 100,
     step: int = 10,
     alphabet_size: int | None = None,
+    *,
+    executor: ExecutorKind = "serial",
+    workers: int | None = None,
 ) -> KrakupResult:
     """
     KRAKUP: Detect cyclic phenomena in nonhomogeneous material.
@@ -360,6 +485,8 @@ def krakup(
         window_size: Size of sliding window for local analysis
         step: Step size for sliding window
         alphabet_size: Size of alphabet (auto-detected if None)
+        executor: "serial", "thread" or "process" for the spectrogram windows
+        workers: Pool size; None for os.cpu_count()
 
     Returns:
         KrakupResult with detected periods, phase slips, and analysis data
@@ -377,7 +504,15 @@ def krakup(
 
     # Compute spectrogram and profile
     spectrogram, profile = compute_spectrogram(
-        text, numeric, min_period, max_period, window_size, step, alphabet_size
+        text,
+        numeric,
+        min_period,
+        max_period,
+        window_size,
+        step,
+        alphabet_size,
+        executor=executor,
+        workers=workers,
     )
 
     # Find stable regions
@@ -413,9 +548,11 @@ def krakup(
     )
 
 
-def print_krakup_analysis(text: Sequence[T], **kwargs: int) -> KrakupResult:
+def print_krakup_analysis(
+    text: Sequence[T], **kwargs: int | str | None
+) -> KrakupResult:
     """Run KRAKUP analysis and print results."""
-    result = krakup(text, **kwargs)
+    result = krakup(text, **kwargs)  # type: ignore[arg-type]
 
     print("\n" + "=" * 70)
     print("KRAKUP: Cyclic Phenomena Analysis (Nonhomogeneous Material)")
@@ -3,11 +3,18 @@
 import random
 from collections import defaultdict
 from collections.abc import Iterator, Sequence
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 from aldegonde import pasc
 from aldegonde.maths.primes import primes
 from aldegonde.stats import compare, nulls
 
+if TYPE_CHECKING:
+    from aldegonde.stats.ngramscore import DenseNgramScorer
+
 CICADA_ALPHABET = [
     "ᚠ",
     "ᚢ",
@@ -73,12 +80,37 @@ CICADA_ENGLISH_ALPHABET = [
 ]
 
 
+CICADA_PRIMES = tuple(primes(110))
+"""The Gematria Primus value of each rune, in CICADA_ALPHABET order."""
+
+# Lookup tables for the scalar conversions, built once
+_RUNE_INDEX = MappingProxyType({rune: i for i, rune in enumerate(CICADA_ALPHABET)})
+_RUNE_VALUE = MappingProxyType(dict(zip(CICADA_ALPHABET, CICADA_PRIMES)))
+_VALUE_RUNE = MappingProxyType(dict(zip(CICADA_PRIMES, CICADA_ALPHABET)))
+_VALUE_INDEX = MappingProxyType({value: i for i, value in enumerate(CICADA_PRIMES)})
+
+# Bulk conversions: runes sit in the Runic block U+16A0..U+16FF, so a code
+# point minus the block start indexes _RUNE_TABLE, with NOT_A_RUNE for runes
+# outside the alphabet; indices go back to runes through str.translate on
+# chr(index)
+NOT_A_RUNE = 255
+"""The index code_points_to_indices gives anything but a Cicada rune."""
+
+_RUNIC_BLOCK = 0x16A0
+_RUNE_TABLE = np.full(0x60, NOT_A_RUNE, dtype=np.uint8)
+_RUNE_TABLE[[ord(rune) - _RUNIC_BLOCK for rune in CICADA_ALPHABET]] = np.arange(
+    len(CICADA_ALPHABET)
+)
+_INDEX_RUNES = str.maketrans(dict(enumerate(CICADA_ALPHABET)))
+_VALUE_TABLE = np.array(CICADA_PRIMES, dtype=np.int64)
+
+
 def r2i(rune: str) -> int:
     """Rune to index"""
-    for i, e in enumerate(CICADA_ALPHABET):
-        if rune == e:
-            return i
-    raise ValueError
+    try:
+        return _RUNE_INDEX[rune]
+    except KeyError:
+        raise ValueError(rune) from None
 
 
 def i2r(rune: int) -> str:
@@ -88,29 +120,79 @@ def i2r(rune: int) -> str:
 
 def r2v(rune: str) -> int:
     """Rune to (prime) value"""
-    primelist = primes(110)
-    for i, e in enumerate(CICADA_ALPHABET):
-        if rune == e:
-            return primelist[i]
-    raise ValueError
+    try:
+        return _RUNE_VALUE[rune]
+    except KeyError:
+        raise ValueError(rune) from None
 
 
 def v2r(value: int) -> str:
     """(prime) value to rune"""
-    primelist = primes(110)
-    for i, e in enumerate(primelist):
-        if value == e:
-            return CICADA_ALPHABET[i]
-    raise ValueError
+    try:
+        return _VALUE_RUNE[value]
+    except KeyError:
+        raise ValueError(value) from None
 
 
 def v2i(value: int) -> int:
     """(prime) value to index"""
-    primelist = primes(110)
-    for i, e in enumerate(primelist):
-        if value == e:
-            return i
-    raise ValueError
+    try:
+        return _VALUE_INDEX[value]
+    except KeyError:
+        raise ValueError(value) from None
+
+
+def code_points_to_indices(points: Sequence[int] | np.ndarray) -> np.ndarray:
+    """Index of the rune at every Unicode code point, as a uint8 array.
+
+    Code points that are not Cicada runes give NOT_A_RUNE.
+    """
+    offsets = np.asarray(points, dtype=np.int64) - _RUNIC_BLOCK
+    inside = (offsets >= 0) & (offsets < len(_RUNE_TABLE))
+    indices = np.full(offsets.shape, NOT_A_RUNE, dtype=np.uint8)
+    indices[inside] = _RUNE_TABLE[offsets[inside]]
+    return indices
+
+
+def runes_to_indices(runes: str) -> np.ndarray:
+    """Indices of a string of runes, as a uint8 array.
+
+    Raises:
+        ValueError: If the string contains anything but Cicada runes
+    """
+    points = np.frombuffer(runes.encode("utf-32-le"), dtype=np.uint32)
+    indices = code_points_to_indices(points)
+    if (indices == NOT_A_RUNE).any():
+        msg = "not a string of Cicada runes"
+        raise ValueError(msg)
+    return indices
+
+
+def indices_to_runes(indices: Sequence[int] | np.ndarray) -> str:
+    """String of the runes at the given indices.
+
+    Raises:
+        ValueError: If an index is outside 0..28
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    if len(indices) and (indices.min() < 0 or indices.max() >= len(CICADA_ALPHABET)):
+        msg = f"rune indices must lie in 0..{len(CICADA_ALPHABET) - 1}"
+        raise ValueError(msg)
+    return indices.astype(np.uint8).tobytes().decode("latin-1").translate(_INDEX_RUNES)
+
+
+def indices_to_values(indices: Sequence[int] | np.ndarray) -> np.ndarray:
+    """Gematria Primus values of the runes at the given indices.
+
+    Raises:
+        ValueError: If an index is outside 0..28
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    if len(indices) and (indices.min() < 0 or indices.max() >= len(CICADA_ALPHABET)):
+        msg = f"rune indices must lie in 0..{len(CICADA_ALPHABET) - 1}"
+        raise ValueError(msg)
+    values: np.ndarray = _VALUE_TABLE[indices]
+    return values
 
 
 def randomrunes(length: int, maximum: int = 29) -> list[int]:
@@ -145,12 +227,36 @@ def low_doublet_null() -> nulls.NullModel[int]:
         adjacent-doublet rate
     """
 
-    def model(data: Sequence[int], rng: random.Random) -> Sequence[int]:
-        rate = _observed_doublet_rate(data)
-        sampler: nulls.NullModel[int] = nulls.doublet_shuffle(rate)
-        return sampler(data, rng)
+    return _low_doublet_model
 
-    return model
+
+def _low_doublet_model(data: Sequence[int], rng: random.Random) -> Sequence[int]:
+    """low_doublet_null's model, kept at module level so it pickles."""
+    rate = _observed_doublet_rate(data)
+    sampler: nulls.NullModel[int] = nulls.doublet_shuffle(rate)
+    return sampler(data, rng)
+
+
+def low_doublet_null_matrix() -> nulls.MatrixNullModel:
+    """Array counterpart of low_doublet_null for integer-encoded runes.
+
+    Draws a whole (trials x N) batch of surrogates matching the observed rune
+    frequencies and adjacent-doublet rate, from the same law as
+    low_doublet_null, for the batch_ resampling harnesses.
+
+    Returns:
+        A matrix null model over encoded rune sequences
+    """
+    return _low_doublet_matrix_model
+
+
+def _low_doublet_matrix_model(
+    data: np.ndarray, trials: int, rng: np.random.Generator
+) -> np.ndarray:
+    """low_doublet_null_matrix's model, kept at module level so it pickles."""
+    data = np.asarray(data)
+    rate = float((data[1:] == data[:-1]).mean()) if len(data) > 1 else 0.0
+    return nulls.doublet_shuffle_matrix(rate)(data, trials, rng)
 
 
 def numberToBase(n: int, b: int) -> list[int]:
@@ -210,9 +316,8 @@ def print_english(runes: str, limit: int = 0) -> None:
         limit = len(runes)
 
     print("ENGLISH: ", end="")
-    for i in range(limit):
-        eng = CICADA_ENGLISH_ALPHABET[r2i(runes[i])]
-        print(f"{eng:>2} ", end="")
+    for i in runes_to_indices(runes[:limit]).tolist():
+        print(f"{CICADA_ENGLISH_ALPHABET[i]:>2} ", end="")
     print()
 
 
@@ -222,8 +327,8 @@ def print_rune_index(runes: str, limit: int = 0) -> None:
         limit = len(runes)
 
     print("RUNEIDX: ", end="")
-    for i in range(limit):
-        print(f"{r2i(runes[i]):02} ", end="")
+    for i in runes_to_indices(runes[:limit]).tolist():
+        print(f"{i:02} ", end="")
     print()
 
 
@@ -240,25 +345,57 @@ def print_rune(runes: str, limit: int = 0) -> None:
 
 def valueTR(t: str = "vigenere") -> pasc.TR[str]:
     """Funny TR that works by prime values"""
+    if t not in ("vigenere", "beaufort", "variantbeaufort"):
+        raise ValueError
     TR: pasc.TR[str] = defaultdict(dict)
-    for key in CICADA_ALPHABET:
-        for plaintext in CICADA_ALPHABET:
+    for key, value in _RUNE_VALUE.items():
+        for i, plaintext in enumerate(CICADA_ALPHABET):
             if t == "vigenere":
-                TR[key][plaintext] = i2r((r2i(plaintext) + r2v(key)) % 29)
+                TR[key][plaintext] = CICADA_ALPHABET[(i + value) % 29]
             elif t == "beaufort":
-                TR[key][plaintext] = i2r((r2v(key) - r2i(plaintext)) % 29)
-            elif t == "variantbeaufort":
-                TR[key][plaintext] = i2r((r2i(plaintext) - r2v(key)) % 29)
+                TR[key][plaintext] = CICADA_ALPHABET[(value - i) % 29]
             else:
-                raise ValueError
+                TR[key][plaintext] = CICADA_ALPHABET[(i - value) % 29]
     return TR
 
 
-unigrams = compare.loadgrams("aldegonde.data.ngrams.runeglish", "unigrams.txt")
-bigrams = compare.loadgrams("aldegonde.data.ngrams.runeglish", "bigrams.txt")
-trigrams = compare.loadgrams("aldegonde.data.ngrams.runeglish", "trigrams.txt")
-quadgrams = compare.loadgrams("aldegonde.data.ngrams.runeglish", "quadgrams.txt")
-
-quadgramscore = compare.NgramScorer(quadgrams)
-trigramscore = compare.NgramScorer(trigrams)
-bigramscore = compare.NgramScorer(bigrams)
+RUNEGLISH = "aldegonde.data.ngrams.runeglish"
+
+_GRAMS = {
+    "unigrams": "unigrams.txt",
+    "bigrams": "bigrams.txt",
+    "trigrams": "trigrams.txt",
+    "quadgrams": "quadgrams.txt",
+}
+_SCORERS = {
+    "bigramscore": "bigrams.txt",
+    "trigramscore": "trigrams.txt",
+    "quadgramscore": "quadgrams.txt",
+}
+
+if TYPE_CHECKING:
+    unigrams: dict[str, int]
+    bigrams: dict[str, int]
+    trigrams: dict[str, int]
+    quadgrams: dict[str, int]
+    bigramscore: DenseNgramScorer
+    trigramscore: DenseNgramScorer
+    quadgramscore: DenseNgramScorer
+
+
+def __getattr__(name: str) -> object:
+    """Load the runeglish language models on first access, as in stats.compare."""
+    value: object
+    try:
+        if name in _GRAMS:
+            value = compare.load_ngrams(RUNEGLISH, _GRAMS[name])
+        elif name in _SCORERS:
+            value = compare.load_scorer(RUNEGLISH, _SCORERS[name])
+        else:
+            msg = f"module {__name__!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+    except OSError as e:
+        msg = f"module {__name__!r} cannot load {name!r}: {e}"
+        raise AttributeError(msg) from e
+    globals()[name] = value
+    return value
@@ -0,0 +1,23 @@
+"""On-disk cache locations for compiled language models and parsed corpora."""
+
+import os
+from pathlib import Path
+
+CACHE_ENV = "ALDEGONDE_CACHE"
+"""Environment variable naming the cache root directory; empty disables it."""
+
+
+def cache_directory(name: str) -> Path | None:
+    """Cache subdirectory for one kind of data, None when caching is disabled.
+
+    The root is $ALDEGONDE_CACHE if set, else aldegonde under
+    $XDG_CACHE_HOME or ~/.cache.
+
+    Args:
+        name: Subdirectory, e.g. "ngrams" or "corpus"
+    """
+    configured = os.environ.get(CACHE_ENV)
+    if configured is not None:
+        return Path(configured) / name if configured else None
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "aldegonde" / name
@@ -0,0 +1,267 @@
+"""Memory-mapped loader for Liber Primus transcriptions.
+
+A transcription file is memory-mapped as bytes and parsed with array
+operations: every three-byte UTF-8 sequence in the Runic block is decoded and
+mapped through a translation table to its index in c3301.CICADA_ALPHABET, and
+the positions of the structural delimiters become boundary arrays over the
+rune stream. Nothing is decoded to str, so a large file costs little more
+than its own pages.
+
+The delimiters are those of the transcription format:
+
+    -   word        .   clause      &   paragraph   $   segment
+    §   chapter     /   line        %   page
+
+A unit also ends at every delimiter of a larger unit, so a clause ends at a
+paragraph mark and a word ends at a clause mark. Lines and pages are physical
+and do not end words.
+
+The parsed arrays are cached as .npy files under cache_directory("corpus"),
+keyed by the SHA-256 of the file together with CACHE_FORMAT, UNITS and the
+alphabet, and loaded back memory-mapped.
+
+Example:
+-------
+    >>> corpus = load_corpus("data/page0-56.txt")
+    >>> corpus.runes[:5]
+    memmap([15,  8, 18,  3,  6], dtype=uint8)
+    >>> len(corpus.units("segment"))
+    10
+"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+
+from aldegonde import c3301
+from aldegonde.cache import cache_directory
+from aldegonde.exceptions import InvalidInputError
+
+UNITS = {
+    "word": "-.&$§",
+    "clause": ".&$§",
+    "paragraph": "&$§",
+    "segment": "$§",
+    "chapter": "§",
+    "line": "/%",
+    "page": "%",
+}
+"""Delimiters ending each structural unit."""
+
+CACHE_FORMAT = 1
+"""Version of the cached arrays, part of the cache key; bump it whenever
+parse_corpus or the layout written by Corpus.save changes."""
+
+
+class Corpus:
+    """Runes of a transcription as indices, with its unit boundaries.
+
+    Attributes:
+        runes: Index in c3301.CICADA_ALPHABET of every rune, dtype uint8
+        offsets: Byte offset of every rune in the source file
+        boundaries: Per unit in UNITS, the rune position of every delimiter
+            ending that unit, in file order; consecutive delimiters repeat a
+            position, as empty units between them
+    """
+
+    runes: np.ndarray
+    offsets: np.ndarray
+    boundaries: dict[str, np.ndarray]
+
+    def __init__(
+        self,
+        runes: np.ndarray,
+        offsets: np.ndarray,
+        boundaries: dict[str, np.ndarray],
+    ) -> None:
+        self.runes = runes
+        self.offsets = offsets
+        self.boundaries = boundaries
+
+    def __len__(self) -> int:
+        return len(self.runes)
+
+    def units(
+        self,
+        unit: str,
+        *,
+        keep_empty: bool = False,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> list[np.ndarray]:
+        """The rune indices of every unit, as views of runes.
+
+        With keep_empty the result matches str.split on the unit's
+        delimiters, so there is one more unit than there are boundaries;
+        boundaries at start and stop count, giving empty units at the ends.
+
+        Args:
+            unit: One of UNITS
+            keep_empty: Whether to keep units without runes
+            start: First rune position to include
+            stop: Rune position to end at; None for the end of the corpus
+
+        Raises:
+            InvalidInputError: If unit is not one of UNITS
+        """
+        if unit not in self.boundaries:
+            msg = f"unknown unit '{unit}', expected one of {', '.join(UNITS)}"
+            raise InvalidInputError(msg, input_value=unit)
+        start, stop, _ = slice(start, stop).indices(len(self.runes))
+        boundaries = self.boundaries[unit]
+        inside = boundaries[(boundaries >= start) & (boundaries <= stop)]
+        parts = np.split(self.runes[start:stop], inside - start)
+        if keep_empty:
+            return parts
+        return [part for part in parts if len(part)]
+
+    def strings(
+        self,
+        unit: str,
+        *,
+        keep_empty: bool = False,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> list[str]:
+        """The runes of every unit as strings of Cicada runes, as in units()."""
+        return [
+            c3301.indices_to_runes(part)
+            for part in self.units(unit, keep_empty=keep_empty, start=start, stop=stop)
+        ]
+
+    def span(self, unit: str, first: int, last: int | None = None) -> tuple[int, int]:
+        """Rune positions (start, stop) covered by units first..last - 1.
+
+        Units are numbered as in units(unit, keep_empty=True), so the span of
+        a slice of that list can restrict another unit to the same runes.
+        """
+        edges = [0, *self.boundaries[unit].tolist(), len(self.runes)]
+        first, last, _ = slice(first, last).indices(len(edges) - 1)
+        return edges[first], edges[max(first, last)]
+
+    def text(self, start: int = 0, stop: int | None = None) -> str:
+        """The runes from start to stop as a string of Cicada runes."""
+        return c3301.indices_to_runes(self.runes[start:stop])
+
+    def save(self, directory: Path) -> None:
+        """Write the arrays as .npy files into a new directory.
+
+        The files are written to a temporary directory that is renamed into
+        place, so readers never see a partial cache entry; if another writer
+        got there first its entry is kept.
+        """
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        staging = directory.with_name(f"{directory.name}.{os.getpid()}.tmp")
+        staging.mkdir(exist_ok=True)
+        try:
+            np.save(staging / "runes.npy", self.runes)
+            np.save(staging / "offsets.npy", self.offsets)
+            for unit, positions in self.boundaries.items():
+                np.save(staging / f"{unit}.npy", positions)
+            os.replace(staging, directory)
+        except OSError:
+            if not directory.is_dir():
+                raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    @classmethod
+    def load(cls, directory: Path, *, mmap: bool = True) -> "Corpus":
+        """Read a corpus written by save(), memory-mapped read-only by default.
+
+        Raises:
+            OSError: If a file is missing or unreadable
+        """
+        mode: Literal["r"] | None = "r" if mmap else None
+        return cls(
+            np.load(directory / "runes.npy", mmap_mode=mode),
+            np.load(directory / "offsets.npy", mmap_mode=mode),
+            {
+                unit: np.load(directory / f"{unit}.npy", mmap_mode=mode)
+                for unit in UNITS
+            },
+        )
+
+
+def parse_corpus(data: bytes | np.ndarray) -> Corpus:
+    """Parse the UTF-8 bytes of a transcription.
+
+    Runes outside c3301.CICADA_ALPHABET and all other characters are skipped.
+
+    Args:
+        data: The file contents, as bytes or a uint8 array such as a memmap
+    """
+    raw = np.frombuffer(data, dtype=np.uint8) if isinstance(data, bytes) else data
+    # U+1680..U+16FF encode as E1 9A xx or E1 9B xx
+    leads = np.flatnonzero(raw[: max(len(raw) - 2, 0)] == 0xE1)
+    second = raw[leads + 1]
+    leads = leads[(second == 0x9A) | (second == 0x9B)]
+    high = (raw[leads + 1].astype(np.intp) & 0x3F) << 6
+    points = 0x1000 | high | (raw[leads + 2] & 0x3F)
+    codes = c3301.code_points_to_indices(points)
+    known = codes != c3301.NOT_A_RUNE
+    offsets = leads[known].astype(np.int64)
+
+    marks = {}
+    for delimiter in set("".join(UNITS.values())):
+        encoded = np.frombuffer(delimiter.encode(), dtype=np.uint8)
+        found = raw[: len(raw) - len(encoded) + 1] == encoded[0]
+        for i in range(1, len(encoded)):
+            found &= raw[i : len(raw) - len(encoded) + 1 + i] == encoded[i]
+        marks[delimiter] = np.flatnonzero(found)
+
+    boundaries = {}
+    for unit, delimiters in UNITS.items():
+        positions = np.sort(np.concatenate([marks[d] for d in delimiters]))
+        boundaries[unit] = np.searchsorted(offsets, positions).astype(np.int64)
+    return Corpus(np.ascontiguousarray(codes[known]), offsets, boundaries)
+
+
+def _digest(data: np.ndarray, chunk_size: int = 1 << 20) -> str:
+    """Cache key of a byte array: the SHA-256 of the parser's settings and
+    the bytes, hashed in bounded chunks."""
+    settings = (CACHE_FORMAT, sorted(UNITS.items()), c3301.CICADA_ALPHABET)
+    digest = hashlib.sha256(repr(settings).encode())
+    for start in range(0, len(data), chunk_size):
+        digest.update(data[start : start + chunk_size].tobytes())
+    return digest.hexdigest()
+
+
+def load_corpus(path: str | Path, *, cache: bool = True) -> Corpus:
+    """Parse a transcription file, through the on-disk cache when enabled.
+
+    The file is memory-mapped rather than read. With cache, the parsed arrays
+    are stored under cache_directory("corpus") by the SHA-256 of the file and
+    the parser settings, and later loads of the same contents map them
+    instead of parsing again.
+
+    Args:
+        path: The transcription file
+        cache: Whether to use the on-disk cache
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    path = Path(path)
+    if path.stat().st_size == 0:
+        return parse_corpus(b"")
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    directory = cache_directory("corpus") if cache else None
+    if directory is None:
+        return parse_corpus(data)
+
+    entry = directory / _digest(data)
+    try:
+        return Corpus.load(entry)
+    except (OSError, ValueError):
+        pass
+    corpus = parse_corpus(data)
+    try:
+        corpus.save(entry)
+    except OSError:
+        return corpus
+    return Corpus.load(entry)
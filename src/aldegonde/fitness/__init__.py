@@ -0,0 +1,21 @@
+"""Fitness functions for scoring candidate decryptions."""
+
+from aldegonde.fitness.batch import (
+    BatchFitness,
+    UnigramChiSquareFitness,
+    WeightedFitness,
+)
+from aldegonde.fitness.incremental import MascSwapFitness, PascPeriodicFitness
+from aldegonde.fitness.ioc import IocFitness
+
+__all__ = [
+    # batch
+    "BatchFitness",
+    "UnigramChiSquareFitness",
+    "WeightedFitness",
+    # incremental
+    "MascSwapFitness",
+    "PascPeriodicFitness",
+    # ioc
+    "IocFitness",
+]
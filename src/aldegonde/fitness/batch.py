@@ -0,0 +1,143 @@
+"""Batched fitness: one call scores a whole population of candidate plaintexts.
+
+A BatchFitness takes a (K x N) matrix of integer-encoded plaintexts, one
+candidate per row, and returns the K scores (higher is better) with no
+Python-level loop over the candidates, so the output of
+CompiledTR.decrypt_batch, or a population held by a solver, is evaluated in
+one pass. Symbols are indices into the fitness alphabet; -1 marks a symbol
+outside it, as produced by the encode() methods.
+
+    DenseNgramScorer         n-gram log-likelihood          (stats.ngramscore)
+    BackoffModel             smoothed n-gram log-likelihood (lm.model)
+    IocFitness               -sqrt(|IOC - target|)          (fitness.ioc)
+    UnigramChiSquareFitness  -chi-square against unigram frequencies
+    WeightedFitness          weighted sum of batch fitnesses
+
+Example:
+-------
+    >>> fitness = WeightedFitness([(1.0, quadgramscore), (50.0, IocFitness(ENGLISH))])
+    >>> plaintexts = compiled.decrypt_batch(ciphertext, keywords)
+    >>> best = keywords[np.argmax(fitness.score_batch(plaintexts))]
+"""
+
+from collections.abc import Sequence
+from typing import Protocol, runtime_checkable
+
+import numpy as np
+
+from aldegonde.exceptions import InvalidInputError
+
+
+@runtime_checkable
+class BatchFitness(Protocol):
+    """Scores every row of a (K x N) integer plaintext matrix at once."""
+
+    def score_batch(self, batch: np.ndarray) -> np.ndarray:
+        """K scores, higher is better, for a (K x N) batch."""
+        ...
+
+
+def _row_counts(batch: np.ndarray, size: int) -> np.ndarray:
+    """Symbol counts per row, shape (K, size); negative entries are skipped."""
+    rows = batch.shape[0]
+    valid = batch >= 0
+    cells = batch + size * np.arange(rows)[:, None]
+    counts: np.ndarray = np.bincount(cells[valid], minlength=rows * size)
+    return counts.reshape(rows, size)
+
+
+class UnigramChiSquareFitness:
+    """Negated chi-square statistic of symbol counts against unigram frequencies.
+
+    Example:
+    -------
+        >>> fitness = UnigramChiSquareFitness(english.unigrams)
+        >>> fitness.score_batch(fitness.encode_batch(["ETAOIN", "QZXJKV"]))
+
+    Attributes:
+        alphabet: The symbols, in index order
+        index: Symbol to index map
+        probabilities: Expected probability per symbol index
+    """
+
+    alphabet: list[str]
+    index: dict[str, int]
+    probabilities: np.ndarray
+
+    def __init__(
+        self,
+        frequency_map: dict[str, int],
+        alphabet: Sequence[str] | None = None,
+    ) -> None:
+        if not frequency_map:
+            msg = "frequency map must not be empty"
+            raise InvalidInputError(msg)
+        if alphabet is None:
+            alphabet = sorted(frequency_map)
+        self.alphabet = list(alphabet)
+        self.index = {symbol: i for i, symbol in enumerate(self.alphabet)}
+        total = sum(frequency_map.values())
+        # unseen symbols get the same 0.01 pseudo-count as DenseNgramScorer
+        self.probabilities = np.array(
+            [frequency_map.get(symbol, 0.01) / total for symbol in self.alphabet]
+        )
+
+    def encode(self, text: Sequence[str]) -> np.ndarray:
+        """Integer-encode a text over the alphabet, -1 for other symbols."""
+        return np.fromiter((self.index.get(e, -1) for e in text), dtype=np.intp)
+
+    def encode_batch(self, texts: Sequence[Sequence[str]]) -> np.ndarray:
+        """Integer-encode equal-length texts into a (K x N) matrix."""
+        return np.array([self.encode(text) for text in texts], dtype=np.intp)
+
+    def score_batch(self, batch: np.ndarray) -> np.ndarray:
+        """-sum((observed - expected) ** 2 / expected) per row of a (K x N) batch."""
+        counts = _row_counts(np.atleast_2d(batch), len(self.alphabet))
+        expected = counts.sum(axis=1, keepdims=True) * self.probabilities
+        chi2 = np.divide(
+            (counts - expected) ** 2,
+            expected,
+            out=np.zeros(counts.shape),
+            where=expected > 0,
+        )
+        scores: np.ndarray = -chi2.sum(axis=1)
+        return scores
+
+    def score(self, encoded: np.ndarray) -> float:
+        """Score of one integer-encoded text."""
+        return float(self.score_batch(encoded[None, :])[0])
+
+    def __call__(self, text: Sequence[str]) -> float:
+        return self.score(self.encode(text))
+
+
+class WeightedFitness:
+    """Weighted sum of batch fitnesses over the same encoding.
+
+    Attributes:
+        components: (weight, fitness) pairs
+    """
+
+    components: list[tuple[float, BatchFitness]]
+
+    def __init__(self, components: Sequence[tuple[float, BatchFitness]]) -> None:
+        if not components:
+            msg = "at least one component is required"
+            raise InvalidInputError(msg)
+        self.components = list(components)
+
+    def score_batch(self, batch: np.ndarray) -> np.ndarray:
+        """Sum of weight * component score per row of a (K x N) batch."""
+        batch = np.atleast_2d(batch)
+        scores: np.ndarray = sum(
+            (
+                weight * fitness.score_batch(batch)
+                for weight, fitness in self.components
+            ),
+            start=np.zeros(batch.shape[0]),
+        )
+        return scores
+
+    def score(self, encoded: np.ndarray) -> float:
+        """Score of one integer-encoded text."""
+        return float(self.score_batch(encoded[None, :])[0])
@@ -0,0 +1,315 @@
+"""Incremental n-gram fitness for local key moves.
+
+Hill climbing and annealing change the key a little at a time, yet rescoring
+the full decryption after every move costs O(N) per step. These objects keep
+the integer plaintext and the log probability of every n-gram window, and on a
+proposed move recompute only the windows whose symbols actually change. A
+move is proposed, its score delta inspected, and then accepted or rejected.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.pasc import TR, CompiledTR, compile_tr
+from aldegonde.stats.ngramscore import DenseNgramScorer
+
+
+def _touching_windows(positions: np.ndarray, length: int, count: int) -> np.ndarray:
+    """Start indices of all n-gram windows covering any of `positions`."""
+    starts = (positions[:, None] - np.arange(length)[None, :]).ravel()
+    return np.unique(starts[(starts >= 0) & (starts < count)])
+
+
+class MascSwapFitness:
+    """N-gram score of a MASC decryption, updated per two-symbol key swap.
+
+    The key follows the masc convention, mapping plaintext to ciphertext:
+    `key[p]` is the ciphertext index that plaintext index `p` encrypts to. A
+    swap of `key[a]` and `key[b]` only changes the plaintext at the positions
+    holding those two ciphertext symbols, so only the windows over those
+    positions are rescored.
+
+    Example:
+    -------
+        >>> fitness = MascSwapFitness.from_text(ciphertext, key, quadgramscore)
+        >>> delta = fitness.propose(4, 19)
+        >>> fitness.accept() if delta > 0 else fitness.reject()
+    """
+
+    scorer: DenseNgramScorer
+    ciphertext: np.ndarray
+    key: np.ndarray
+    plaintext: np.ndarray
+    contributions: np.ndarray
+    score: float
+
+    def __init__(
+        self,
+        ciphertext: np.ndarray,
+        key: np.ndarray,
+        scorer: DenseNgramScorer,
+    ) -> None:
+        size = len(scorer.alphabet)
+        self.ciphertext = np.asarray(ciphertext, dtype=np.intp)
+        self.key = np.array(key, dtype=np.intp)
+        if sorted(self.key.tolist()) != list(range(size)):
+            msg = f"key must be a permutation of range({size})"
+            raise InvalidInputError(msg, input_value=key)
+        if len(self.ciphertext) and (
+            self.ciphertext.min() < 0 or self.ciphertext.max() >= size
+        ):
+            msg = "ciphertext holds symbols outside the scorer alphabet"
+            raise InvalidInputError(msg)
+
+        self.scorer = scorer
+        count = max(len(self.ciphertext) - scorer.length + 1, 0)
+        self._positions = [np.flatnonzero(self.ciphertext == c) for c in range(size)]
+        self._windows = [
+            _touching_windows(positions, scorer.length, count)
+            for positions in self._positions
+        ]
+        self._seen = np.zeros(count, dtype=bool)
+        self._pending: tuple[int, int, np.ndarray, np.ndarray, float] | None = None
+        self.rescore()
+
+    @classmethod
+    def from_text(
+        cls,
+        ciphertext: Sequence[str],
+        key: dict[str, str],
+        scorer: DenseNgramScorer,
+    ) -> "MascSwapFitness":
+        """Build from a symbol ciphertext and a masc key dict over the scorer alphabet."""
+        index = scorer.index
+        return cls(
+            scorer.encode(ciphertext),
+            np.array([index[key[symbol]] for symbol in scorer.alphabet]),
+            scorer,
+        )
+
+    def snapshot(self) -> np.ndarray:
+        """A copy of the current key."""
+        return self.key.copy()
+
+    def rescore(self) -> float:
+        """Recompute the plaintext and every window from scratch."""
+        inverse = np.argsort(self.key)
+        self.plaintext = inverse[self.ciphertext]
+        self.contributions = self.scorer.ngram_scores(self.plaintext)
+        self.score = float(self.contributions.sum())
+        self._pending = None
+        return self.score
+
+    def _window_scores(self, windows: np.ndarray) -> np.ndarray:
+        """Log probability of the given windows of the current plaintext."""
+        codes = np.zeros(len(windows), dtype=np.int64)
+        for k in range(self.scorer.length):
+            codes *= len(self.scorer.alphabet)
+            codes += self.plaintext[windows + k]
+        scores: np.ndarray = self.scorer.table[codes]
+        return scores
+
+    def _union(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        """Windows in either set, without the sort np.union1d would do."""
+        self._seen[first] = True
+        extra = second[~self._seen[second]]
+        self._seen[first] = False
+        return np.concatenate((first, extra))
+
+    def propose(self, a: int, b: int) -> float:
+        """Tentatively swap `key[a]` and `key[b]` and return the score delta.
+
+        The swap stays pending until accept() or reject(); proposing again
+        first rejects an outstanding proposal.
+        """
+        if self._pending is not None:
+            self.reject()
+        ca, cb = self.key[a], self.key[b]
+        windows = self._union(self._windows[ca], self._windows[cb])
+        self.plaintext[self._positions[ca]] = b
+        self.plaintext[self._positions[cb]] = a
+        scores = self._window_scores(windows)
+        delta = float(scores.sum() - self.contributions[windows].sum())
+        self._pending = (a, b, windows, scores, delta)
+        return delta
+
+    def accept(self) -> float:
+        """Commit the pending swap and return the new score."""
+        if self._pending is None:
+            msg = "no pending move to accept"
+            raise InvalidInputError(msg)
+        a, b, windows, scores, delta = self._pending
+        self.key[a], self.key[b] = self.key[b], self.key[a]
+        self.contributions[windows] = scores
+        self.score += delta
+        self._pending = None
+        return self.score
+
+    def reject(self) -> None:
+        """Roll back the pending swap."""
+        if self._pending is None:
+            return
+        a, b = self._pending[0], self._pending[1]
+        self.plaintext[self._positions[self.key[a]]] = a
+        self.plaintext[self._positions[self.key[b]]] = b
+        self._pending = None
+
+
+class PascPeriodicFitness:
+    """N-gram score of a periodic PASC decryption, updated per keyword letter.
+
+    Changing keyword position `j` of a period-L keyword only changes the
+    plaintext at positions j, j+L, j+2L, ..., so only the windows overlapping
+    that column are rescored. The ciphertext is encoded over the symbols of
+    the compiled tabula recta and the keyword over its rows; the plaintext is
+    held over the scorer alphabet, with -1 where the TR leaves a cell undefined
+    or the symbol is not in the scorer alphabet. Windows over such positions
+    score the floor.
+
+    Example:
+    -------
+        >>> fitness = PascPeriodicFitness.from_text(ciphertext, "KEY", tr, quadgramscore)
+        >>> delta = fitness.propose(1, fitness.compiled.key_index["X"])
+        >>> fitness.accept() if delta > 0 else fitness.reject()
+    """
+
+    scorer: DenseNgramScorer
+    compiled: CompiledTR[str]
+    ciphertext: np.ndarray
+    keyword: np.ndarray
+    plaintext: np.ndarray
+    contributions: np.ndarray
+    score: float
+
+    def __init__(
+        self,
+        ciphertext: np.ndarray,
+        keyword: np.ndarray,
+        compiled: CompiledTR[str],
+        scorer: DenseNgramScorer,
+    ) -> None:
+        self.ciphertext = np.asarray(ciphertext, dtype=np.intp)
+        self.keyword = np.array(keyword, dtype=np.intp)
+        if len(self.keyword) == 0:
+            msg = "keyword must not be empty"
+            raise InvalidInputError(msg, input_value=keyword)
+        if self.keyword.min() < 0 or self.keyword.max() >= len(compiled.keys):
+            msg = "keyword holds rows outside the tabula recta"
+            raise InvalidInputError(msg, input_value=keyword)
+        if len(self.ciphertext) and (
+            self.ciphertext.min() < 0 or self.ciphertext.max() >= len(compiled.symbols)
+        ):
+            msg = "ciphertext holds symbols outside the tabula recta"
+            raise InvalidInputError(msg)
+
+        self.scorer = scorer
+        self.compiled = compiled
+        # TR symbol index to scorer index; the trailing -1 makes an undefined
+        # TR cell (-1) map to -1 as well
+        self._to_scorer = np.array(
+            [scorer.index.get(symbol, -1) for symbol in compiled.symbols] + [-1],
+            dtype=np.intp,
+        )
+        period = len(self.keyword)
+        count = max(len(self.ciphertext) - scorer.length + 1, 0)
+        self._columns = [
+            np.arange(j, len(self.ciphertext), period) for j in range(period)
+        ]
+        self._windows = [
+            _touching_windows(column, scorer.length, count) for column in self._columns
+        ]
+        self._pending: (
+            tuple[int, int, np.ndarray, np.ndarray, np.ndarray, float] | None
+        ) = None
+        self.rescore()
+
+    @classmethod
+    def from_text(
+        cls,
+        ciphertext: Sequence[str],
+        keyword: Sequence[str],
+        tr: TR[str] | CompiledTR[str],
+        scorer: DenseNgramScorer,
+    ) -> "PascPeriodicFitness":
+        """Build from symbol ciphertext and keyword and a (compiled) tabula recta."""
+        compiled = tr if isinstance(tr, CompiledTR) else compile_tr(tr)
+        return cls(
+            compiled.encode(ciphertext),
+            compiled.encode_keyword(keyword),
+            compiled,
+            scorer,
+        )
+
+    def _decrypt(self, rows: np.ndarray | int, positions: np.ndarray) -> np.ndarray:
+        """Scorer-alphabet plaintext at `positions` under the given key rows."""
+        plaintext: np.ndarray = self._to_scorer[
+            self.compiled.inverse[rows, self.ciphertext[positions]]
+        ]
+        return plaintext
+
+    def snapshot(self) -> np.ndarray:
+        """A copy of the current keyword."""
+        return self.keyword.copy()
+
+    def rescore(self) -> float:
+        """Recompute the plaintext and every window from scratch."""
+        positions = np.arange(len(self.ciphertext))
+        rows = self.keyword[positions % len(self.keyword)]
+        self.plaintext = self._decrypt(rows, positions)
+        self.contributions = self.scorer.ngram_scores(self.plaintext)
+        self.score = float(self.contributions.sum())
+        self._pending = None
+        return self.score
+
+    def _window_scores(self, windows: np.ndarray) -> np.ndarray:
+        """Log probability of the given windows of the current plaintext."""
+        codes = np.zeros(len(windows), dtype=np.int64)
+        unknown = np.zeros(len(windows), dtype=bool)
+        for k in range(self.scorer.length):
+            symbols = self.plaintext[windows + k]
+            unknown |= symbols < 0
+            codes *= len(self.scorer.alphabet)
+            codes += symbols
+        scores: np.ndarray = np.where(
+            unknown, self.scorer.floor, self.scorer.table[np.where(unknown, 0, codes)]
+        )
+        return scores
+
+    def propose(self, position: int, row: int) -> float:
+        """Tentatively set keyword `position` to TR row `row`; return the score delta.
+
+        The change stays pending until accept() or reject(); proposing again
+        first rejects an outstanding proposal.
+        """
+        if self._pending is not None:
+            self.reject()
+        column = self._columns[position]
+        windows = self._windows[position]
+        previous = self.plaintext[column]
+        self.plaintext[column] = self._decrypt(row, column)
+        scores = self._window_scores(windows)
+        delta = float(scores.sum() - self.contributions[windows].sum())
+        self._pending = (position, row, previous, windows, scores, delta)
+        return delta
+
+    def accept(self) -> float:
+        """Commit the pending keyword change and return the new score."""
+        if self._pending is None:
+            msg = "no pending move to accept"
+            raise InvalidInputError(msg)
+        position, row, _, windows, scores, delta = self._pending
+        self.keyword[position] = row
+        self.contributions[windows] = scores
+        self.score += delta
+        self._pending = None
+        return self.score
+
+    def reject(self) -> None:
+        """Roll back the pending keyword change."""
+        if self._pending is None:
+            return
+        position, previous = self._pending[0], self._pending[2]
+        self.plaintext[self._columns[position]] = previous
+        self._pending = None
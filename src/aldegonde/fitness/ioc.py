@@ -1,9 +1,13 @@
 """IOC Scoring Function."""
 
-from collections.abc import Callable, Sequence
+from collections.abc import Sequence
 from math import sqrt
 from typing import TypeVar
 
+import numpy as np
+
+from aldegonde.exceptions import InsufficientDataError
+from aldegonde.fitness.batch import _row_counts
 from aldegonde.stats.ioc import ioc as ioc_func
 
 T = TypeVar("T")
@@ -16,21 +20,50 @@ ITALIAN = 0.0738
 RUSSIAN = 0.0529
 
 
-def IocFitness(target_ioc: float) -> Callable[[Sequence[object]], float]:
-    """Score a text by evaluating its IOC score.
+class IocFitness:
+    """Score a text by the distance of its IOC to a target IOC.
 
     Example:
     -------
-        >>> fitness = IOCScore(ENGLISH)
-        >>> fitness("ABC")
-        -32.2
+        >>> fitness = IocFitness(ENGLISH)
+        >>> fitness("ABAB")
+        -0.5163655036244514
+        >>> fitness.score_batch(np.array([[0, 1, 0, 1], [0, 0, 0, 1]]))
+        array([-0.5163655 , -0.65825527])
 
-    Args:
-    ----
-        target_ioc (lfoat): symbol to frequency mapping of the distribution to compare with
+    Attributes:
+        target_ioc: IOC of the language expected in the plaintext
     """
 
-    def inner(text: Sequence[object]) -> float:
-        return -sqrt(abs(ioc_func(text) - target_ioc))
+    def __init__(self, target_ioc: float) -> None:
+        self.target_ioc = target_ioc
+
+    def __call__(self, text: Sequence[object]) -> float:
+        return -sqrt(abs(ioc_func(text) - self.target_ioc))
+
+    def score_batch(self, batch: np.ndarray) -> np.ndarray:
+        """Score every row of a (K x N) integer plaintext matrix.
+
+        Symbols are non-negative indices; -1 entries are left out of the
+        counts. Rows with fewer than two counted symbols have IOC 0.
 
-    return inner
+        Raises:
+            InsufficientDataError: If the rows are shorter than 2
+        """
+        batch = np.atleast_2d(batch)
+        if batch.shape[1] < 2:
+            msg = f"Text length {batch.shape[1]} is below minimum required 2"
+            raise InsufficientDataError(
+                msg, required_length=2, actual_length=batch.shape[1]
+            )
+        counts = _row_counts(batch, max(int(batch.max()) + 1, 1))
+        total = counts.sum(axis=1)
+        pairs = total * (total - 1)
+        ic = np.divide(
+            (counts * (counts - 1)).sum(axis=1),
+            pairs,
+            out=np.zeros(len(batch)),
+            where=pairs > 0,
+        )
+        scores: np.ndarray = -np.sqrt(np.abs(ic - self.target_ioc))
+        return scores
@@ -0,0 +1,24 @@
+"""Building and scoring n-gram language models from text corpora."""
+
+from aldegonde.lm.build import build_counts, read_chunks, write_frequency_file
+from aldegonde.lm.counts import NgramCounter, NgramCounts
+from aldegonde.lm.model import BackoffModel, kneser_ney, stupid_backoff
+from aldegonde.lm.transliterate import GEMATRIA_PRIMUS, RUNEGLISH, Transliterator
+
+__all__ = [
+    # build
+    "build_counts",
+    "read_chunks",
+    "write_frequency_file",
+    # counts
+    "NgramCounter",
+    "NgramCounts",
+    # model
+    "BackoffModel",
+    "kneser_ney",
+    "stupid_backoff",
+    # transliterate
+    "GEMATRIA_PRIMUS",
+    "RUNEGLISH",
+    "Transliterator",
+]
@@ -0,0 +1,5 @@
+"""python -m aldegonde.lm: build n-gram models from corpus files."""
+
+from aldegonde.lm.build import main
+
+main()
@@ -0,0 +1,139 @@
+"""Corpus to n-gram model pipeline.
+
+build_counts streams corpus files through a Transliterator into an
+NgramCounter, so a gigabyte corpus is read, converted and counted in chunks
+of bounded size. The counts can be written as a counts directory, as
+frequency files in the format of the packaged aldegonde.data.ngrams tables,
+or as DenseNgramScorer tables.
+
+Run as a module to build models from the command line:
+
+    python -m aldegonde.lm --alphabet runeglish --order 5 \\
+        --output runeglish-5 --frequency-files data/ corpus/*.txt
+"""
+
+import argparse
+import string
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+
+import numpy as np
+
+from aldegonde import c3301
+from aldegonde.lm.counts import DEFAULT_MAX_ENTRIES, NgramCounter, NgramCounts
+from aldegonde.lm.transliterate import RUNEGLISH, Transliterator
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+FREQUENCY_FILES = {
+    1: "unigrams.txt",
+    2: "bigrams.txt",
+    3: "trigrams.txt",
+    4: "quadgrams.txt",
+    5: "pentagrams.txt",
+    6: "hexagrams.txt",
+}
+
+
+def read_chunks(
+    path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = "utf-8"
+) -> Iterator[str]:
+    """The text of a file in chunks of up to chunk_size characters.
+
+    Undecodable bytes are skipped rather than aborting a long build.
+    """
+    with open(path, encoding=encoding, errors="ignore") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+def build_counts(
+    sources: Iterable[str | Path],
+    alphabet: Sequence[str],
+    max_order: int,
+    *,
+    transliterator: Transliterator | None = None,
+    output: Path | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+) -> NgramCounts:
+    """Count the n-grams of orders 1..max_order of corpus files.
+
+    Each file is a separate document: no n-gram spans two files.
+
+    Args:
+        sources: Paths of the corpus files
+        alphabet: The model symbols, in code order
+        max_order: The highest n-gram order
+        transliterator: Conversion of the raw text into the alphabet; None
+            keeps the alphabet's symbols, in any case, and drops the rest
+        output: Directory to stream the counts to; None keeps them in memory
+        chunk_size: Characters read at a time
+        max_entries: Budget of in-memory (code, count) entries
+
+    Returns:
+        The counts, memory-mapped from output when it is given
+    """
+    if transliterator is None:
+        transliterator = Transliterator.from_alphabet(alphabet)
+    counter = NgramCounter(alphabet, max_order, max_entries=max_entries)
+    try:
+        for source in sources:
+            chunks = read_chunks(source, chunk_size)
+            for text in transliterator.transliterate_stream(chunks):
+                counter.update(text)
+            counter.boundary()
+        if output is not None:
+            return counter.write(output)
+        return counter.counts()
+    finally:
+        counter.close()
+
+
+def write_frequency_file(counts: NgramCounts, order: int, path: Path) -> None:
+    """Write the counts of an order as "GRAM count" lines, most frequent first.
+
+    This is the format of the packaged tables read by compare.loadgrams.
+    """
+    frequencies = np.asarray(counts.counts(order))
+    order_by_count = np.lexsort((np.asarray(counts.codes(order)), -frequencies))
+    grams = counts.grams(order, np.asarray(counts.codes(order))[order_by_count])
+    with path.open("w", encoding="utf-8") as f:
+        for gram, count in zip(grams, frequencies[order_by_count].tolist()):
+            f.write(f"{gram} {count}\n")
+
+
+ALPHABETS = {
+    "english": (list(string.ascii_uppercase), None),
+    "runeglish": (c3301.CICADA_ALPHABET, RUNEGLISH),
+}
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sources", nargs="+", type=Path, help="corpus text files")
+    parser.add_argument("--alphabet", choices=sorted(ALPHABETS), default="english")
+    parser.add_argument("--order", type=int, default=4, help="highest n-gram order")
+    parser.add_argument("--output", type=Path, help="counts directory to write")
+    parser.add_argument(
+        "--frequency-files", type=Path, help="directory for <order>grams.txt files"
+    )
+    parser.add_argument("--max-entries", type=int, default=DEFAULT_MAX_ENTRIES)
+    args = parser.parse_args(argv)
+
+    alphabet, transliterator = ALPHABETS[args.alphabet]
+    counts = build_counts(
+        args.sources,
+        alphabet,
+        args.order,
+        transliterator=transliterator,
+        output=args.output,
+        max_entries=args.max_entries,
+    )
+    print(f"{counts.total(1)} symbols, {len(counts.codes(args.order))} distinct")
+    if args.frequency_files is not None:
+        args.frequency_files.mkdir(parents=True, exist_ok=True)
+        for order in range(1, args.order + 1):
+            filename = FREQUENCY_FILES.get(order, f"{order}grams.txt")
+            write_frequency_file(counts, order, args.frequency_files / filename)
@@ -0,0 +1,372 @@
+"""Bounded-memory n-gram counting over streamed text.
+
+An NgramCounter takes text in chunks and counts the n-grams of every order
+1..max_order, as base-|A| integer codes over a fixed alphabet. N-grams span
+chunk boundaries but never a symbol outside the alphabet, which acts as a
+break. Orders whose whole code space fits in the entry budget are counted
+in a dense array; higher orders are counted per chunk into sorted
+(code, count) runs, merged and spilled to disk whenever the budget is
+exceeded. The final merge reads the spilled runs memory-mapped, one code
+range at a time, so the memory used stays near the budget however large the
+corpus.
+
+The result is an NgramCounts: per order, the distinct codes in ascending
+order with their counts. It is stored as a directory of raw little-endian
+int64 arrays plus a JSON index, and loaded back memory-mapped.
+
+Example:
+-------
+    >>> counter = NgramCounter(CICADA_ALPHABET, 5)
+    >>> for chunk in RUNEGLISH.transliterate_stream(read_chunks("corpus.txt")):
+    ...     counter.update(chunk)
+    >>> counts = counter.write(Path("runeglish-5"))
+    >>> counter.close()
+    >>> counts.frequency_map(4)["ᚦᛖᚱᛖ"]
+"""
+
+import json
+import tempfile
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+import numpy as np
+
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.stats.ngrams import _rolling_codes
+from aldegonde.stats.ngramscore import DenseNgramScorer
+
+DEFAULT_MAX_ENTRIES = 1 << 22
+INDEX_FILE = "counts.json"
+
+_EMPTY = np.zeros(0, dtype=np.int64)
+
+
+def _merge_runs(
+    codes: Sequence[np.ndarray], counts: Sequence[np.ndarray]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Sum the counts of equal codes over several runs, codes ascending."""
+    if not codes:
+        return _EMPTY, _EMPTY
+    merged = np.concatenate(codes)
+    if not len(merged):
+        return _EMPTY, _EMPTY
+    order = np.argsort(merged, kind="stable")
+    merged = merged[order]
+    starts = np.flatnonzero(np.concatenate(([True], merged[1:] != merged[:-1])))
+    totals: np.ndarray = np.add.reduceat(np.concatenate(counts)[order], starts)
+    return merged[starts], totals
+
+
+def _array_files(path: Path, order: int) -> tuple[Path, Path]:
+    """The code and count files of one order in a counts directory."""
+    return path / f"{order}.codes.i8", path / f"{order}.counts.i8"
+
+
+class NgramCounts:
+    """Counts of the n-grams of orders 1..max_order over an alphabet.
+
+    Attributes:
+        alphabet: The symbols, in code order
+        max_order: The highest n-gram order
+    """
+
+    def __init__(
+        self,
+        alphabet: Sequence[str],
+        tables: dict[int, tuple[np.ndarray, np.ndarray]],
+    ) -> None:
+        """Wrap counted tables.
+
+        Args:
+            alphabet: The symbols, in code order
+            tables: Order to (ascending codes, counts)
+        """
+        self.alphabet = list(alphabet)
+        self.max_order = max(tables)
+        self._tables = tables
+
+    def codes(self, order: int) -> np.ndarray:
+        """The distinct n-gram codes of an order, ascending."""
+        return self._tables[order][0]
+
+    def counts(self, order: int) -> np.ndarray:
+        """The counts of the n-grams of an order, aligned with codes()."""
+        return self._tables[order][1]
+
+    def total(self, order: int) -> int:
+        """Number of n-grams of an order counted."""
+        return int(self.counts(order).sum())
+
+    def grams(self, order: int, codes: np.ndarray | None = None) -> list[str]:
+        """The n-grams of codes (by default all codes of the order) as strings."""
+        if codes is None:
+            codes = self.codes(order)
+        base = len(self.alphabet)
+        digits = np.empty((len(codes), order), dtype=np.int64)
+        rest = np.asarray(codes, dtype=np.int64)
+        for position in reversed(range(order)):
+            rest, digits[:, position] = np.divmod(rest, base)
+        symbols = np.array(self.alphabet)[digits]
+        if symbols.dtype.itemsize == np.dtype("U1").itemsize:
+            joined: list[str] = (
+                np.ascontiguousarray(symbols).view(f"U{order}").ravel().tolist()
+            )
+            return joined
+        return ["".join(row) for row in symbols.tolist()]
+
+    def frequency_map(self, order: int) -> dict[str, int]:
+        """The counts of an order as an n-gram to count map, as loadgrams gives."""
+        return dict(zip(self.grams(order), self.counts(order).tolist(), strict=True))
+
+    def scorer(self, order: int) -> DenseNgramScorer:
+        """A DenseNgramScorer of the n-grams of an order."""
+        return DenseNgramScorer.from_counts(
+            self.codes(order), self.counts(order), self.alphabet, order
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the counts to a directory, as NgramCounter.write does."""
+        path.mkdir(parents=True, exist_ok=True)
+        for order in range(1, self.max_order + 1):
+            codes_file, counts_file = _array_files(path, order)
+            self.codes(order).astype("<i8").tofile(codes_file)
+            self.counts(order).astype("<i8").tofile(counts_file)
+        _write_index(path, self.alphabet, self.max_order)
+
+    @classmethod
+    def load(cls, path: Path, *, mmap: bool = True) -> "NgramCounts":
+        """Read counts written by save() or NgramCounter.write.
+
+        Raises:
+            OSError: If a file is missing or unreadable
+            ValueError: If the files do not describe consistent tables
+        """
+        index = json.loads((path / INDEX_FILE).read_text())
+        tables: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        for order in range(1, int(index["max_order"]) + 1):
+            arrays: list[np.ndarray] = []
+            for file in _array_files(path, order):
+                if mmap and file.stat().st_size:
+                    arrays.append(np.memmap(file, dtype="<i8", mode="r"))
+                else:
+                    arrays.append(np.fromfile(file, dtype="<i8"))
+            if arrays[0].shape != arrays[1].shape:
+                msg = f"order {order} codes and counts in {path} differ in length"
+                raise ValueError(msg)
+            tables[order] = (arrays[0], arrays[1])
+        return cls(index["alphabet"], tables)
+
+
+def _write_index(path: Path, alphabet: Sequence[str], max_order: int) -> None:
+    """Write the JSON index of a counts directory, last, as its commit point."""
+    index = {"alphabet": list(alphabet), "max_order": max_order}
+    (path / INDEX_FILE).write_text(json.dumps(index, ensure_ascii=False))
+
+
+class NgramCounter:
+    """Streaming counter of the n-grams of orders 1..max_order.
+
+    Attributes:
+        alphabet: The symbols, in code order; each one character
+        max_order: The highest n-gram order
+        max_entries: Budget of in-memory (code, count) entries
+        symbols: Number of symbols counted so far
+    """
+
+    def __init__(
+        self,
+        alphabet: Sequence[str],
+        max_order: int,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        workdir: Path | None = None,
+    ) -> None:
+        """Start an empty count.
+
+        Args:
+            alphabet: The symbols, in code order; each one character
+            max_order: The highest n-gram order
+            max_entries: Budget of in-memory (code, count) entries
+            workdir: Directory for spilled runs; None for the system default
+
+        Raises:
+            InvalidInputError: If the order is below 1, the codes of an order
+                would overflow int64, or a symbol is not a single character
+        """
+        self.alphabet = list(alphabet)
+        base = len(self.alphabet)
+        if max_order < 1:
+            msg = "max_order must be at least 1"
+            raise InvalidInputError(msg, input_value=max_order)
+        if base**max_order > 2**63:
+            msg = f"{base} ** {max_order} n-gram codes overflow int64"
+            raise InvalidInputError(msg, input_value=max_order)
+        if not self.alphabet or any(len(symbol) != 1 for symbol in self.alphabet):
+            msg = "alphabet symbols must be single characters"
+            raise InvalidInputError(msg, input_value=alphabet)
+        self.max_order = max_order
+        self.max_entries = max_entries
+        self.symbols = 0
+        self._workdir = workdir
+        self._lookup = np.full(max(map(ord, self.alphabet)) + 1, -1, dtype=np.int64)
+        for i, symbol in enumerate(self.alphabet):
+            self._lookup[ord(symbol)] = i
+        self._carry = _EMPTY
+        self._dense: dict[int, np.ndarray] = {
+            order: np.zeros(base**order, dtype=np.int64)
+            for order in range(1, max_order + 1)
+            if base**order <= max_entries
+        }
+        self._pending: dict[int, list[tuple[np.ndarray, np.ndarray]]] = {
+            order: [] for order in range(1, max_order + 1) if order not in self._dense
+        }
+        self._pending_entries = 0
+        self._runs: dict[int, list[Path]] = {order: [] for order in self._pending}
+        self._tempdir: tempfile.TemporaryDirectory[str] | None = None
+
+    def close(self) -> None:
+        """Remove the spilled runs."""
+        if self._tempdir is not None:
+            self._tempdir.cleanup()
+            self._tempdir = None
+        for runs in self._runs.values():
+            runs.clear()
+
+    def encode(self, text: str) -> np.ndarray:
+        """Codes of the characters of a text, -1 outside the alphabet."""
+        points = np.frombuffer(text.encode("utf-32-le"), dtype="<u4")
+        codes = np.full(len(points), -1, dtype=np.int64)
+        known = points < len(self._lookup)
+        codes[known] = self._lookup[points[known]]
+        return codes
+
+    def update(self, text: str | np.ndarray) -> None:
+        """Count the n-grams of the next piece of text.
+
+        Args:
+            text: A string, or symbol codes with -1 for breaks
+        """
+        codes = self.encode(text) if isinstance(text, str) else np.asarray(text)
+        buffer = np.concatenate((self._carry, codes.astype(np.int64)))
+        base = len(self.alphabet)
+        for order in range(1, self.max_order + 1):
+            # only the n-grams ending in the new text; earlier ones are counted
+            window = buffer[max(len(self._carry) - order + 1, 0) :]
+            if len(window) < order:
+                continue
+            unknown = window < 0
+            grams = _rolling_codes(np.where(unknown, 0, window), order, base)
+            if unknown.any():
+                grams = grams[_rolling_codes(unknown.astype(np.int64), order, 2) == 0]
+            if order in self._dense:
+                self._dense[order] += np.bincount(grams, minlength=base**order)
+            else:
+                distinct, counts = np.unique(grams, return_counts=True)
+                self._pending[order].append((distinct, counts.astype(np.int64)))
+                self._pending_entries += len(distinct)
+        self._carry = buffer[len(buffer) - min(self.max_order - 1, len(buffer)) :]
+        self.symbols += int(np.count_nonzero(codes >= 0))
+        if self._pending_entries > self.max_entries:
+            self._spill()
+
+    def boundary(self) -> None:
+        """End a document: no n-gram spans the text before and after."""
+        self._carry = _EMPTY
+
+    def _spill(self) -> None:
+        """Merge the pending runs of every order and move them to disk."""
+        if self._tempdir is None:
+            self._tempdir = tempfile.TemporaryDirectory(
+                prefix="aldegonde-ngrams-", dir=self._workdir
+            )
+        for order, pending in self._pending.items():
+            if not pending:
+                continue
+            codes, counts = _merge_runs(*zip(*pending, strict=True))
+            path = Path(self._tempdir.name) / f"{order}-{len(self._runs[order])}"
+            np.save(path.with_name(path.name + ".codes.npy"), codes)
+            np.save(path.with_name(path.name + ".counts.npy"), counts)
+            self._runs[order].append(path)
+            pending.clear()
+        self._pending_entries = 0
+
+    def iter_counts(self, order: int) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """The (codes, counts) of an order in blocks of ascending codes.
+
+        Spilled runs are merged one code range at a time, each range holding
+        about max_entries entries across the runs.
+        """
+        if order in self._dense:
+            dense = self._dense[order]
+            codes = np.flatnonzero(dense)
+            yield codes, dense[codes]
+            return
+        runs = [
+            (
+                np.load(path.with_name(path.name + ".codes.npy"), mmap_mode="r"),
+                np.load(path.with_name(path.name + ".counts.npy"), mmap_mode="r"),
+            )
+            for path in self._runs[order]
+        ]
+        if self._pending[order]:
+            runs.append(_merge_runs(*zip(*self._pending[order], strict=True)))
+        entries = sum(len(codes) for codes, _ in runs)
+        blocks = -(-entries // self.max_entries)
+        if blocks <= 1:
+            merged = _merge_runs(
+                [np.asarray(c) for c, _ in runs], [np.asarray(n) for _, n in runs]
+            )
+            if len(merged[0]):
+                yield merged
+            return
+        # split the code space at quantiles of a sample of every run
+        sample = np.sort(
+            np.concatenate(
+                [codes[:: max(len(codes) // (64 * blocks), 1)] for codes, _ in runs]
+            )
+        )
+        cuts = np.unique(
+            sample[np.linspace(0, len(sample), blocks + 1)[1:-1].astype(int)]
+        )
+        edges = [0, *cuts.tolist(), None]
+        for low, high in zip(edges[:-1], edges[1:]):
+            pieces = [
+                (
+                    codes.searchsorted(low),
+                    len(codes) if high is None else codes.searchsorted(high),
+                )
+                for codes, _ in runs
+            ]
+            merged = _merge_runs(
+                [np.asarray(c[a:b]) for (c, _), (a, b) in zip(runs, pieces)],
+                [np.asarray(n[a:b]) for (_, n), (a, b) in zip(runs, pieces)],
+            )
+            if len(merged[0]):
+                yield merged
+
+    def counts(self) -> NgramCounts:
+        """The counts so far, in memory."""
+        tables: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        for order in range(1, self.max_order + 1):
+            blocks = list(self.iter_counts(order))
+            tables[order] = (
+                np.concatenate([codes for codes, _ in blocks]) if blocks else _EMPTY,
+                np.concatenate([counts for _, counts in blocks]) if blocks else _EMPTY,
+            )
+        return NgramCounts(self.alphabet, tables)
+
+    def write(self, path: Path) -> NgramCounts:
+        """Stream the counts so far to a directory and load them memory-mapped.
+
+        Merged blocks go straight to disk, so the full tables are never held
+        in memory.
+        """
+        path.mkdir(parents=True, exist_ok=True)
+        for order in range(1, self.max_order + 1):
+            codes_file, counts_file = _array_files(path, order)
+            with codes_file.open("wb") as codes_out, counts_file.open("wb") as out:
+                for codes, counts in self.iter_counts(order):
+                    codes.astype("<i8").tofile(codes_out)
+                    counts.astype("<i8").tofile(out)
+        _write_index(path, self.alphabet, self.max_order)
+        return NgramCounts.load(path)
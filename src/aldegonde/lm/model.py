@@ -0,0 +1,438 @@
+"""Smoothed backoff n-gram language models scored on integer-coded text.
+
+A BackoffModel holds, for every order 1..n, the sorted codes of the n-grams
+it knows with their log10 probabilities, and for the histories it knows a
+log10 backoff weight. The probability of a symbol after its history is read
+from the longest n-gram ending at the symbol that is in the model; every
+order skipped on the way down adds the backoff weight of its history. All
+lookups are binary searches over the code arrays for a whole text, or a
+(K x N) batch of texts, at once.
+
+Two estimators build one from NgramCounts:
+
+    kneser_ney      interpolated Kneser-Ney, normalized probabilities
+    stupid_backoff  relative frequencies with a fixed backoff penalty
+
+Unlike the single floor of DenseNgramScorer, an unseen n-gram is scored from
+its lower orders, so models of order 5 or 6 stay usable on texts far shorter
+than their table. A max_bytes budget drops the rarest higher-order n-grams
+(one count threshold over orders 2..n, which keeps every kept n-gram's
+history) until the tables fit.
+
+Example:
+-------
+    >>> counts = NgramCounts.load(Path("runeglish-6"))
+    >>> model = kneser_ney(counts, max_bytes=256 << 20)
+    >>> model.score_batch(model.encode_batch(candidates))
+"""
+
+from collections.abc import Sequence
+from math import log10
+
+import numpy as np
+
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.lm.counts import NgramCounts
+from aldegonde.stats.ngrams import _rolling_codes
+
+ENTRY_BYTES = 12
+"""Bytes per stored n-gram or history: an int64 code and a float32 value."""
+
+
+def _lookup(codes: np.ndarray, queries: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Positions of queries in a sorted code array, and whether they are there.
+
+    The queries are searched in sorted order, which keeps the binary searches
+    of neighbouring queries on the same cached part of the table.
+    """
+    if not len(codes):
+        return np.zeros(queries.shape, dtype=bool), np.zeros(queries.shape, np.intp)
+    order = np.argsort(queries)
+    index = np.empty(queries.shape, dtype=np.intp)
+    index[order] = np.searchsorted(codes, queries[order])
+    np.minimum(index, len(codes) - 1, out=index)
+    return codes[index] == queries, index
+
+
+class _CodeTable:
+    """Float values keyed by n-gram code, stored sparse or dense.
+
+    A table is kept as sorted codes with their values, or as one value per
+    possible code (NaN where absent) when that takes no more memory, which
+    turns the lookup into plain indexing.
+    """
+
+    def __init__(self, codes: np.ndarray, values: np.ndarray, cells: int) -> None:
+        self.size = len(codes)
+        if cells * 4 <= len(codes) * ENTRY_BYTES:
+            self.codes: np.ndarray | None = None
+            self.values = np.full(cells, np.nan, dtype=np.float32)
+            self.values[np.asarray(codes, dtype=np.int64)] = values
+        else:
+            self.codes = np.asarray(codes, dtype=np.int64)
+            self.values = np.asarray(values, dtype=np.float32)
+
+    @property
+    def nbytes(self) -> int:
+        codes = 0 if self.codes is None else self.codes.nbytes
+        return int(codes + self.values.nbytes)
+
+    def get(self, queries: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Whether each query is in the table, and the values of those that are."""
+        if self.codes is None:
+            values = self.values[queries]
+            found = ~np.isnan(values)
+            return found, values[found]
+        found, index = _lookup(self.codes, queries)
+        return found, self.values[index[found]]
+
+
+class BackoffModel:
+    """Backoff n-gram model over sorted code tables.
+
+    Attributes:
+        alphabet: The symbols, in code order
+        index: Symbol to code map
+        order: The highest n-gram order
+        floor: Log probability of a symbol outside the alphabet
+        default_backoff: Backoff weight of a history not in the model
+    """
+
+    def __init__(
+        self,
+        alphabet: Sequence[str],
+        grams: Sequence[tuple[np.ndarray, np.ndarray]],
+        histories: Sequence[tuple[np.ndarray, np.ndarray]],
+        *,
+        floor: float,
+        default_backoff: float = 0.0,
+    ) -> None:
+        """Wrap built tables.
+
+        Args:
+            alphabet: The symbols, in code order
+            grams: Per order 1..n, (sorted codes, log10 probabilities); the
+                unigram table covers every symbol
+            histories: Per order 1..n - 1, (sorted codes, log10 backoff
+                weights) of the histories with a weight of their own
+            floor: Log probability of a symbol outside the alphabet
+            default_backoff: Backoff weight of other histories
+        """
+        self.alphabet = list(alphabet)
+        self.index = {symbol: i for i, symbol in enumerate(self.alphabet)}
+        self.order = len(grams)
+        self.floor = floor
+        self.default_backoff = default_backoff
+        base = len(self.alphabet)
+        self._grams = [
+            _CodeTable(codes, values, base**order)
+            for order, (codes, values) in enumerate(grams, 1)
+        ]
+        self._histories = [
+            _CodeTable(codes, values, base**order)
+            for order, (codes, values) in enumerate(histories, 1)
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the code and value tables."""
+        return sum(table.nbytes for table in (*self._grams, *self._histories))
+
+    def entries(self, order: int) -> int:
+        """Number of n-grams of an order in the model."""
+        return self._grams[order - 1].size
+
+    def encode(self, text: Sequence[str]) -> np.ndarray:
+        """Integer-encode a text over the model alphabet, -1 for other symbols."""
+        return np.fromiter((self.index.get(e, -1) for e in text), dtype=np.intp)
+
+    def encode_batch(self, texts: Sequence[Sequence[str]]) -> np.ndarray:
+        """Integer-encode equal-length texts into a (K x N) matrix."""
+        return np.array([self.encode(text) for text in texts], dtype=np.intp)
+
+    def ngram_scores(self, encoded: np.ndarray) -> np.ndarray:
+        """Log10 probability of every symbol given the symbols before it.
+
+        The history of a symbol is cut at the start of the text and at any
+        symbol outside the alphabet.
+
+        Args:
+            encoded: Symbol indices, shape (N,) or (K, N); -1 marks symbols
+                outside the alphabet
+
+        Returns:
+            Per-symbol log probabilities, same shape as encoded
+        """
+        encoded = np.asarray(encoded, dtype=np.int64)
+        unknown = encoded < 0
+        symbols = np.where(unknown, 0, encoded)
+        scores = np.where(unknown, self.floor, 0.0)
+        pending = ~unknown
+        base = len(self.alphabet)
+        for order in range(min(self.order, encoded.shape[-1]), 0, -1):
+            grams = _rolling_codes(symbols, order, base)
+            # an n-gram ending at i sits at i - order + 1
+            target = pending[..., order - 1 :].copy()
+            if order > 1 and unknown.any():
+                target &= _rolling_codes(unknown.astype(np.int64), order, 2) == 0
+            queries = grams[target]
+            found, values = self._grams[order - 1].get(queries)
+            added = np.zeros(len(queries))
+            added[found] = values
+            if order > 1:
+                known, weights = self._histories[order - 2].get(queries[~found] // base)
+                backoff = np.full(len(known), self.default_backoff)
+                backoff[known] = weights
+                added[~found] = backoff
+            scores[..., order - 1 :][target] += added
+            pending[..., order - 1 :][target] = ~found
+        return scores
+
+    def score(self, encoded: np.ndarray) -> float:
+        """Total log probability of one integer-encoded text."""
+        return float(self.ngram_scores(encoded).sum())
+
+    def score_batch(self, encoded: np.ndarray) -> np.ndarray:
+        """Total log probability of every row of a (K x N) encoded batch."""
+        scores: np.ndarray = self.ngram_scores(np.atleast_2d(encoded)).sum(axis=-1)
+        return scores
+
+    def __call__(self, text: Sequence[str]) -> float:
+        return self.score(self.encode(text))
+
+
+def _model_order(counts: NgramCounts, order: int | None) -> int:
+    """The requested order, checked against the counted orders."""
+    if order is None:
+        return counts.max_order
+    if not 1 <= order <= counts.max_order:
+        msg = f"order must lie in 1..{counts.max_order}"
+        raise InvalidInputError(msg, input_value=order)
+    return order
+
+
+def _discount(counts: np.ndarray) -> float:
+    """Absolute discount n1 / (n1 + 2 n2) from the counts of counts."""
+    n1 = int(np.count_nonzero(counts == 1))
+    n2 = int(np.count_nonzero(counts == 2))
+    if n1 and n2:
+        return n1 / (n1 + 2 * n2)
+    return 0.5
+
+
+def _group_by_history(codes: np.ndarray, base: int) -> tuple[np.ndarray, np.ndarray]:
+    """Distinct histories of sorted n-gram codes and each code's history index."""
+    histories, inverse = np.unique(codes // base, return_inverse=True)
+    return histories, inverse
+
+
+def _prune(
+    counts: NgramCounts,
+    grams: list[tuple[np.ndarray, np.ndarray]],
+    histories: list[tuple[np.ndarray, np.ndarray]],
+    max_bytes: int,
+) -> None:
+    """Drop the n-grams and histories of order >= 2 below one count threshold.
+
+    The threshold is the smallest raw count that fits max_bytes; an n-gram
+    count never exceeds the count of its history, so kept n-grams keep their
+    histories.
+    """
+    raw: list[tuple[np.ndarray, np.ndarray]] = []
+    for order in range(2, len(grams) + 1):
+        codes, frequencies = counts.codes(order), counts.counts(order)
+        raw.append(
+            (
+                frequencies[_lookup(codes, grams[order - 1][0])[1]],
+                frequencies[_lookup(codes, histories[order - 1][0])[1]],
+            )
+        )
+    fixed = ENTRY_BYTES * (len(grams[0][0]) + len(histories[0][0]))
+    budget = max(max_bytes - fixed, 0) // ENTRY_BYTES
+    every = np.concatenate([np.concatenate(pair) for pair in raw])
+    if len(every) <= budget:
+        return
+    # one above the count of the first entry past the budget
+    threshold = int(np.sort(every)[::-1][budget]) + 1
+    for order, (gram_counts, history_counts) in zip(range(2, len(grams) + 1), raw):
+        keep = gram_counts >= threshold
+        grams[order - 1] = (grams[order - 1][0][keep], grams[order - 1][1][keep])
+        keep = history_counts >= threshold
+        histories[order - 1] = (
+            histories[order - 1][0][keep],
+            histories[order - 1][1][keep],
+        )
+
+
+def _log_probability(
+    grams: list[tuple[np.ndarray, np.ndarray]],
+    histories: list[tuple[np.ndarray, np.ndarray]],
+    codes: np.ndarray,
+    length: int,
+    base: int,
+) -> np.ndarray:
+    """Backoff log10 probability of the last symbol of codes of one length.
+
+    This is BackoffModel's lookup on the tables before they are wrapped, with
+    no cost for histories that have no weight.
+    """
+    table_codes, table_values = grams[length - 1]
+    found, index = _lookup(table_codes, codes)
+    result = np.zeros(len(codes))
+    result[found] = table_values[index[found]]
+    if length > 1 and not found.all():
+        missing = codes[~found]
+        history_codes, weights = histories[length - 2]
+        known, history_index = _lookup(history_codes, missing // base)
+        backoff = np.zeros(len(missing))
+        backoff[known] = weights[history_index[known]]
+        lower = _log_probability(
+            grams, histories, missing % base ** (length - 1), length - 1, base
+        )
+        result[~found] = backoff + lower
+    return result
+
+
+def _renormalize(
+    grams: list[tuple[np.ndarray, np.ndarray]],
+    histories: list[tuple[np.ndarray, np.ndarray]],
+    base: int,
+) -> None:
+    """Recompute the backoff weights of kept histories after pruning.
+
+    The weight of a history h is the probability mass left by its kept
+    n-grams over the mass the lower order gives the symbols that back off,
+    (1 - sum p(w|h)) / (1 - sum p_lower(w|h')) over the kept w, so the
+    probabilities after h sum to one again. Orders are done from the bottom
+    up, as a weight depends on the pruned lower orders.
+    """
+    for k in range(2, len(grams) + 1):
+        history_codes, weights = histories[k - 2]
+        if not len(history_codes):
+            continue
+        codes, values = grams[k - 1]
+        position = _lookup(history_codes, codes // base)[1]
+        lower = _log_probability(grams, histories, codes % base ** (k - 1), k - 1, base)
+        size = len(history_codes)
+        kept = np.bincount(position, weights=10.0**values, minlength=size)
+        covered = np.bincount(position, weights=10.0**lower, minlength=size)
+        left, backed_off = 1.0 - kept, 1.0 - covered
+        # a history that kept every symbol never backs off
+        usable = backed_off > 1e-12
+        weights = weights.copy()
+        weights[usable] = np.log10(
+            np.maximum(left[usable], 1e-300) / backed_off[usable]
+        )
+        histories[k - 2] = (history_codes, weights)
+
+
+def kneser_ney(
+    counts: NgramCounts, order: int | None = None, *, max_bytes: int | None = None
+) -> BackoffModel:
+    """Interpolated Kneser-Ney model of orders 1..order.
+
+    The highest order discounts raw counts, lower orders continuation counts
+    (the number of distinct symbols seen before an n-gram), each with the
+    discount n1 / (n1 + 2 n2) of its order; unigrams are interpolated with
+    the uniform distribution. Stored probabilities are the interpolated ones
+    and backoff weights the interpolation weights, so the probabilities of
+    all symbols after any history sum to one. After pruning the weights are
+    recomputed from the remaining mass, which keeps that property.
+
+    Args:
+        counts: N-gram counts of at least this order
+        order: Model order; None for the highest counted order
+        max_bytes: Table memory budget; None keeps every n-gram
+
+    Returns:
+        The model; unknown histories back off at no cost
+    """
+    order = _model_order(counts, order)
+    base = len(counts.alphabet)
+    effective: list[tuple[np.ndarray, np.ndarray]] = []
+    for k in range(1, order + 1):
+        if k == order:
+            effective.append(
+                (np.asarray(counts.codes(k)), np.asarray(counts.counts(k)))
+            )
+        else:
+            suffixes = np.asarray(counts.codes(k + 1)) % base**k
+            effective.append(np.unique(suffixes, return_counts=True))
+
+    codes, values = effective[0]
+    unigrams = np.zeros(base)
+    unigrams[codes] = values
+    discount = _discount(values)
+    total = unigrams.sum()
+    uniform = discount * len(codes) / total / base
+    probabilities = np.maximum(unigrams - discount, 0) / total + uniform
+    grams = [(np.arange(base), np.log10(probabilities))]
+    histories: list[tuple[np.ndarray, np.ndarray]] = []
+    for k in range(2, order + 1):
+        codes, values = effective[k - 1]
+        discount = _discount(values)
+        history_codes, inverse = _group_by_history(codes, base)
+        totals = np.bincount(inverse, weights=values)
+        weights = discount * np.bincount(inverse) / totals
+        lower_codes, lower_values = grams[k - 2]
+        lower = 10.0 ** lower_values[_lookup(lower_codes, codes % base ** (k - 1))[1]]
+        probabilities = (values - discount) / totals[inverse] + weights[inverse] * lower
+        grams.append((codes, np.log10(probabilities)))
+        histories.append((history_codes, np.log10(weights)))
+    histories.append((np.zeros(0, dtype=np.int64), np.zeros(0)))
+    if max_bytes is not None:
+        _prune(counts, grams, histories, max_bytes)
+        _renormalize(grams, histories, base)
+    return BackoffModel(
+        counts.alphabet,
+        grams,
+        histories[: order - 1],
+        floor=float(grams[0][1].min()),
+    )
+
+
+def stupid_backoff(
+    counts: NgramCounts,
+    order: int | None = None,
+    *,
+    alpha: float = 0.4,
+    max_bytes: int | None = None,
+) -> BackoffModel:
+    """Stupid backoff model of orders 1..order (Brants et al. 2007).
+
+    An n-gram scores its relative frequency after its history, and each
+    order backed off multiplies by alpha. Scores are not normalized, which
+    does not matter for ranking candidates. Unseen symbols score the
+    0.01-count floor of NgramScorer.
+
+    Args:
+        counts: N-gram counts of at least this order
+        order: Model order; None for the highest counted order
+        alpha: Backoff factor, in (0, 1]
+        max_bytes: Table memory budget; None keeps every n-gram
+    """
+    order = _model_order(counts, order)
+    if not 0 < alpha <= 1:
+        msg = "alpha must lie in (0, 1]"
+        raise InvalidInputError(msg, input_value=alpha)
+    base = len(counts.alphabet)
+    total = counts.total(1)
+    unigrams = np.full(base, 0.01)
+    unigrams[np.asarray(counts.codes(1))] = np.asarray(counts.counts(1))
+    grams = [(np.arange(base), np.log10(unigrams / total))]
+    for k in range(2, order + 1):
+        codes, values = np.asarray(counts.codes(k)), np.asarray(counts.counts(k))
+        lower_codes, lower_counts = counts.codes(k - 1), counts.counts(k - 1)
+        history = np.asarray(lower_counts)[_lookup(lower_codes, codes // base)[1]]
+        grams.append((codes, np.log10(values / history)))
+    empty = (np.zeros(0, dtype=np.int64), np.zeros(0))
+    histories = [empty for _ in range(order)]
+    if max_bytes is not None:
+        _prune(counts, grams, histories, max_bytes)
+    return BackoffModel(
+        counts.alphabet,
+        grams,
+        histories[: order - 1],
+        floor=log10(0.01 / total),
+        default_backoff=log10(alpha),
+    )
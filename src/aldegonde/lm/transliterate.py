@@ -0,0 +1,158 @@
+"""Rule-based transliteration of plain text into a model alphabet.
+
+A Transliterator rewrites text with an ordered list of (pattern, replacement)
+rules: at every position the first rule whose pattern matches is applied,
+and characters no rule matches are dropped. Listing digraphs before single
+letters gives the greedy conversion used for English to Gematria Primus
+runes (runeglish), and Transliterator.from_alphabet keeps just the symbols
+of an alphabet, e.g. uppercased A-Z for English models.
+
+Text can be fed in arbitrary chunks through transliterate_stream, which
+holds back the few characters at a chunk boundary that a longer rule could
+still claim, so the output does not depend on where the chunks split.
+
+Example:
+-------
+    >>> RUNEGLISH("The king")
+    'ᚦᛖᚳᛝ'
+    >>> "".join(RUNEGLISH.transliterate_stream(["The ki", "ng"]))
+    'ᚦᛖᚳᛝ'
+"""
+
+import re
+from collections.abc import Iterable, Iterator, Sequence
+
+from aldegonde.exceptions import InvalidInputError
+
+GEMATRIA_PRIMUS: list[tuple[str, str]] = [
+    ("ing", "ᛝ"),
+    ("ng", "ᛝ"),
+    ("th", "ᚦ"),
+    ("ea", "ᛠ"),
+    ("eo", "ᛇ"),
+    ("oe", "ᛟ"),
+    ("ae", "ᚫ"),
+    ("ia", "ᛡ"),
+    ("io", "ᛡ"),
+    ("f", "ᚠ"),
+    ("u", "ᚢ"),
+    ("v", "ᚢ"),
+    ("o", "ᚩ"),
+    ("r", "ᚱ"),
+    ("c", "ᚳ"),
+    ("k", "ᚳ"),
+    ("q", "ᚳ"),
+    ("g", "ᚷ"),
+    ("w", "ᚹ"),
+    ("h", "ᚻ"),
+    ("n", "ᚾ"),
+    ("i", "ᛁ"),
+    ("j", "ᛄ"),
+    ("p", "ᛈ"),
+    ("x", "ᛉ"),
+    ("s", "ᛋ"),
+    ("z", "ᛋ"),
+    ("t", "ᛏ"),
+    ("b", "ᛒ"),
+    ("e", "ᛖ"),
+    ("m", "ᛗ"),
+    ("l", "ᛚ"),
+    ("d", "ᛞ"),
+    ("a", "ᚪ"),
+    ("y", "ᚣ"),
+]
+"""English to Gematria Primus rules, digraphs first."""
+
+
+class Transliterator:
+    """Greedy first-match rewriting of text by ordered rules.
+
+    Attributes:
+        rules: (pattern, replacement) pairs in priority order
+        ignore_case: Whether patterns match regardless of case
+        width: Length of the longest pattern
+    """
+
+    def __init__(
+        self, rules: Sequence[tuple[str, str]], *, ignore_case: bool = True
+    ) -> None:
+        """Compile the rules.
+
+        Args:
+            rules: (pattern, replacement) pairs; earlier rules win
+            ignore_case: Match patterns regardless of case
+
+        Raises:
+            InvalidInputError: If there are no rules or a pattern is empty
+        """
+        if not rules:
+            msg = "at least one rule is required"
+            raise InvalidInputError(msg)
+        if any(not pattern for pattern, _ in rules):
+            msg = "rule patterns must not be empty"
+            raise InvalidInputError(msg, input_value=rules)
+        self.rules = list(rules)
+        self.ignore_case = ignore_case
+        self.width = max(len(pattern) for pattern, _ in self.rules)
+        self._replacements: dict[str, str] = {}
+        for pattern, replacement in reversed(self.rules):
+            self._replacements[self._fold(pattern)] = replacement
+        self._characters = frozenset("".join(self._replacements))
+        self._regex = re.compile(
+            "|".join(re.escape(self._fold(pattern)) for pattern, _ in self.rules)
+        )
+
+    @classmethod
+    def from_alphabet(
+        cls, alphabet: Iterable[str], *, ignore_case: bool = True
+    ) -> "Transliterator":
+        """Keep the symbols of an alphabet and drop everything else."""
+        return cls([(symbol, symbol) for symbol in alphabet], ignore_case=ignore_case)
+
+    def _fold(self, text: str) -> str:
+        return text.lower() if self.ignore_case else text
+
+    def _apply(self, folded: str) -> str:
+        """Transliterate case-folded text."""
+        return "".join(map(self._replacements.__getitem__, self._regex.findall(folded)))
+
+    def _final(self, buffer: str) -> int:
+        """Length of the prefix of a buffer whose transliteration is decided.
+
+        Matching never crosses a character that occurs in no pattern, so the
+        text before the last such character is final. Without one, a match
+        is final once every rule could be tried in full at its position.
+        """
+        limit = len(buffer) - self.width
+        for i in range(limit, max(limit - 64, -1), -1):
+            if buffer[i] not in self._characters:
+                return i + 1
+        resume = 0
+        for match in self._regex.finditer(buffer):
+            if match.start() > limit:
+                break
+            resume = match.end()
+        return max(resume, limit + 1)
+
+    def __call__(self, text: str) -> str:
+        """Transliterate a complete text."""
+        return self._apply(self._fold(text))
+
+    def transliterate_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Transliterate text arriving in chunks, yielding output per chunk.
+
+        The undecided tail of a chunk, at most a few characters, is carried
+        into the next.
+        """
+        carry = ""
+        for chunk in chunks:
+            buffer = carry + self._fold(chunk)
+            final = self._final(buffer)
+            carry = buffer[final:]
+            yield self._apply(buffer[:final])
+        if carry:
+            yield self._apply(carry)
+
+
+RUNEGLISH = Transliterator(GEMATRIA_PRIMUS)
+"""English to runeglish."""
@@ -7,10 +7,13 @@ All are polyalphabetic substitution ciphers with a fixed key length
 """
 
 import random
+import threading
 from collections import defaultdict
 from collections.abc import Generator, Iterable, Sequence
-from itertools import cycle
-from typing import Any, Protocol, TypeVar
+from functools import cached_property
+from typing import Any, Generic, Protocol, TypeVar
+
+import numpy as np
 
 from aldegonde import masc
 from aldegonde.exceptions import AldegondeKeyError, CipherError, InvalidInputError
@@ -40,17 +43,182 @@ TR = dict[T, dict[T, T]]
 KT = dict[int, dict[T, T]]
 
 
+def _require_dict(tr: object) -> None:
+    """Reject a tabula recta that is not a dict; callers are not type checked."""
+    if not isinstance(tr, dict):
+        msg = f"Tabula recta must be a dictionary, got {type(tr).__name__}"
+        raise InvalidInputError(msg, input_value=tr, expected_type=dict)
+
+
+class CompiledTR(Generic[T]):
+    """Integer-indexed form of a tabula recta, built once from any `TR[T]`.
+
+    Symbols are numbered in order of first appearance in the TR, keys in TR
+    order. `table[k, p]` holds the index of the ciphertext symbol for key index
+    `k` and plaintext index `p`, and `inverse[k, c]` the plaintext index for
+    ciphertext index `c`; cells the TR does not define hold -1. With both sides
+    integer-encoded, a whole text is enciphered by a single fancy-indexing
+    operation instead of two dict lookups per symbol.
+    """
+
+    symbols: list[T]
+    index: dict[T, int]
+    keys: list[T]
+    key_index: dict[T, int]
+    table: np.ndarray
+
+    def __init__(self, tr: TR[T]) -> None:
+        _require_dict(tr)
+        self.keys = list(tr)
+        self.key_index = {k: i for i, k in enumerate(self.keys)}
+        self.symbols = []
+        self.index = {}
+        for row in tr.values():
+            for e, c in row.items():
+                for symbol in (e, c):
+                    if symbol not in self.index:
+                        self.index[symbol] = len(self.symbols)
+                        self.symbols.append(symbol)
+
+        self.table = np.full((len(self.keys), len(self.symbols)), -1, dtype=np.intp)
+        for k, row in enumerate(tr.values()):
+            for e, c in row.items():
+                self.table[k, self.index[e]] = self.index[c]
+
+    @cached_property
+    def inverse(self) -> np.ndarray:
+        """Decryption table, the row-wise inverse of `table`.
+
+        Raises:
+            CipherError: If a row maps two plaintext symbols to the same output
+        """
+        inverse = np.full_like(self.table, -1)
+        for k, row in enumerate(self.table):
+            defined = np.flatnonzero(row >= 0)
+            if len(np.unique(row[defined])) != len(defined):
+                msg = f"Tabula recta is ambiguous for key '{self.keys[k]}' - contains duplicate values"
+                raise CipherError(msg, cipher_type="polyalphabetic")
+            inverse[k, row[defined]] = defined
+        return inverse
+
+    def encode(self, text: Iterable[T]) -> np.ndarray:
+        """Map symbols to their indices, -1 for symbols outside the TR."""
+        return np.fromiter((self.index.get(e, -1) for e in text), dtype=np.intp)
+
+    def encode_keyword(self, keyword: Iterable[T]) -> np.ndarray:
+        """Map keyword symbols to TR row indices, -1 for missing rows."""
+        return np.fromiter((self.key_index.get(k, -1) for k in keyword), dtype=np.intp)
+
+    def decode(self, indices: Iterable[int]) -> list[T]:
+        """Map symbol indices back to symbols."""
+        return [self.symbols[i] for i in indices]
+
+    def encrypt(self, plaintext: np.ndarray, keyword: np.ndarray) -> np.ndarray:
+        """Encrypt an integer-encoded text under an integer-encoded keyword.
+
+        No validation is done: every plaintext and keyword index must address a
+        defined cell, which is what solvers iterating over index arrays provide.
+        """
+        ciphertext: np.ndarray = self.table[
+            _key_stream(keyword, len(plaintext)), plaintext
+        ]
+        return ciphertext
+
+    def decrypt(self, ciphertext: np.ndarray, keyword: np.ndarray) -> np.ndarray:
+        """Decrypt an integer-encoded text under an integer-encoded keyword."""
+        plaintext: np.ndarray = self.inverse[
+            _key_stream(keyword, len(ciphertext)), ciphertext
+        ]
+        return plaintext
+
+    def decrypt_batch(self, ciphertext: np.ndarray, keywords: np.ndarray) -> np.ndarray:
+        """Decrypt one integer-encoded text under many keywords at once.
+
+        Args:
+            ciphertext: Ciphertext indices, shape (N,)
+            keywords: Keyword row indices, shape (K, L); one candidate per row
+
+        Returns:
+            Plaintext indices, shape (K, N); row i is the decryption under
+            keywords[i]
+        """
+        keywords = np.atleast_2d(keywords)
+        keys = keywords[:, np.arange(len(ciphertext)) % keywords.shape[1]]
+        plaintexts: np.ndarray = self.inverse[keys, ciphertext]
+        return plaintexts
+
+
+COMPILED_TR_CACHE_SIZE = 8
+"""Number of recently compiled tabula rectas kept by compile_tr."""
+
+_compiled_trs: dict[int, tuple[TR[Any], TR[Any], CompiledTR[Any]]] = {}
+_compiled_trs_lock = threading.Lock()
+
+
+def compile_tr(tr: TR[T] | CompiledTR[T]) -> CompiledTR[T]:
+    """Build the integer-indexed form of a tabula recta.
+
+    A CompiledTR is returned as is. The forms of the last few TRs are kept,
+    so enciphering repeatedly with the same TR compiles it once; a kept form
+    is only reused while its TR still equals a snapshot taken at compilation,
+    so a TR changed in place is compiled again.
+    """
+    if isinstance(tr, CompiledTR):
+        return tr
+    with _compiled_trs_lock:
+        entry = _compiled_trs.get(id(tr))
+    if entry is not None and entry[0] is tr and entry[1] == tr:
+        compiled: CompiledTR[T] = entry[2]
+        return compiled
+    compiled = CompiledTR(tr)
+    snapshot = {key: dict(row) for key, row in tr.items()}
+    with _compiled_trs_lock:
+        _compiled_trs.pop(id(tr), None)
+        while len(_compiled_trs) >= COMPILED_TR_CACHE_SIZE:
+            del _compiled_trs[next(iter(_compiled_trs))]
+        _compiled_trs[id(tr)] = (tr, snapshot, compiled)
+    return compiled
+
+
+def _key_stream(keyword: np.ndarray, length: int) -> np.ndarray:
+    """Repeat an integer keyword to cover `length` positions."""
+    return keyword[np.arange(length) % len(keyword)]
+
+
+def _transform(
+    text: Sequence[T],
+    keyword: Sequence[T],
+    compiled: CompiledTR[T],
+    table: np.ndarray,
+    role: str,
+) -> list[T]:
+    """Run text through `table`, reporting the first undefined cell in TR terms."""
+    symbols = compiled.encode(text)
+    keys = _key_stream(compiled.encode_keyword(keyword), len(symbols))
+    output = table[keys, symbols]
+    bad = (keys < 0) | (symbols < 0) | (output < 0)
+    if bad.any():
+        position = int(np.argmax(bad))
+        key = keyword[position % len(keyword)]
+        if keys[position] < 0:
+            msg = f"Key symbol '{key}' not found in tabula recta"
+            raise AldegondeKeyError(msg, key=key, cipher_type="polyalphabetic")
+        msg = f"{role} symbol '{text[position]}' not found in tabula recta for key '{key}'"
+        raise CipherError(msg, cipher_type="polyalphabetic")
+    return compiled.decode(output)
+
+
 def pasc_encrypt(
     plaintext: Iterable[T],
     keyword: Sequence[T],
-    tr: TR[T],
+    tr: TR[T] | CompiledTR[T],
 ) -> Generator[T, None, None]:
     """Polyalphabetic substitution.
 
     Args:
         plaintext: Text to encrypt
         keyword: Encryption key sequence
-        tr: Tabula recta for the cipher
+        tr: Tabula recta for the cipher, or its compile_tr form
 
     Yields:
         Encrypted characters
@@ -66,24 +234,8 @@ def pasc_encrypt(
     validate_text_sequence(plaintext_seq)
     validate_key_length(keyword)
 
-    try:
-        for e, k in zip(plaintext_seq, cycle(keyword)):
-            if k not in tr:
-                msg = f"Key symbol '{k}' not found in tabula recta"
-                raise AldegondeKeyError(
-                    msg,
-                    key=k,
-                    cipher_type="polyalphabetic",
-                )
-            if e not in tr[k]:
-                msg = f"Plaintext symbol '{e}' not found in tabula recta for key '{k}'"
-                raise CipherError(msg, cipher_type="polyalphabetic")
-            yield tr[k][e]
-    except Exception as exc:
-        if isinstance(exc, AldegondeKeyError | CipherError):
-            raise
-        msg = f"Encryption failed: {exc}"
-        raise CipherError(msg, cipher_type="polyalphabetic") from exc
+    compiled = compile_tr(tr)
+    yield from _transform(plaintext_seq, keyword, compiled, compiled.table, "Plaintext")
 
 
 def pasc_encrypt_interrupted(
@@ -162,10 +314,7 @@ def reverse_tr(tr: TR[T]) -> TR[T]:
     Raises:
         CipherError: If tabula recta is ambiguous
     """
-    if not isinstance(tr, dict):
-        msg = f"Tabula recta must be a dictionary, got {type(tr).__name__}"
-        raise InvalidInputError(msg, input_value=tr, expected_type=dict)
-
+    _require_dict(tr)
     output: TR[T] = defaultdict(dict)
     for keyword in tr:
         for k, v in tr[keyword].items():
@@ -181,14 +330,20 @@ def reverse_tr(tr: TR[T]) -> TR[T]:
 def pasc_decrypt(
     ciphertext: Iterable[T],
     keyword: Sequence[T],
-    tr: TR[T],
+    tr: TR[T] | CompiledTR[T],
 ) -> Generator[T, None, None]:
     """Polyalphabetic substitution
     NOTE: tr input is the same as for encryption, this function will reverse the key.
+    tr may also be its compile_tr form.
     """
-    reversed_tr: TR[T] = reverse_tr(tr)
-    for e, k in zip(ciphertext, cycle(keyword)):
-        yield reversed_tr[k][e]
+    ciphertext_seq = (
+        list(ciphertext) if not isinstance(ciphertext, Sequence) else ciphertext
+    )
+    validate_key_length(keyword)
+    compiled = compile_tr(tr)
+    yield from _transform(
+        ciphertext_seq, keyword, compiled, compiled.inverse, "Ciphertext"
+    )
 
 
 def pasc_decrypt_interrupted(
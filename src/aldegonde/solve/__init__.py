@@ -0,0 +1,55 @@
+"""Search engines for recovering keys: annealing, hill climbing, tempering."""
+
+from aldegonde.solve.anneal import anneal, anneal_incremental
+from aldegonde.solve.base import (
+    IncrementalFitness,
+    MoveSet,
+    Problem,
+    Proposal,
+    SolveResult,
+    StopCheck,
+    metropolis,
+)
+from aldegonde.solve.climb import hill_climb
+from aldegonde.solve.moves import (
+    AutokeyPrimerMoves,
+    MascKeyMoves,
+    MixedAlphabetMoves,
+    PascKeywordMoves,
+    QuagmireMoves,
+    masc_swap_proposal,
+    pasc_keyword_proposal,
+)
+from aldegonde.solve.pool import iter_restarts, run_restarts, stop_requested
+from aldegonde.solve.tempering import geometric_temperatures, parallel_tempering
+
+__all__ = [
+    # anneal
+    "anneal",
+    "anneal_incremental",
+    # base
+    "IncrementalFitness",
+    "MoveSet",
+    "Problem",
+    "Proposal",
+    "SolveResult",
+    "StopCheck",
+    "metropolis",
+    # climb
+    "hill_climb",
+    # moves
+    "AutokeyPrimerMoves",
+    "MascKeyMoves",
+    "MixedAlphabetMoves",
+    "PascKeywordMoves",
+    "QuagmireMoves",
+    "masc_swap_proposal",
+    "pasc_keyword_proposal",
+    # pool
+    "iter_restarts",
+    "run_restarts",
+    "stop_requested",
+    # tempering
+    "geometric_temperatures",
+    "parallel_tempering",
+]
@@ -0,0 +1,141 @@
+"""Simulated annealing with an exponential cooling schedule.
+
+The temperature falls geometrically from `tmax` to `tmin` over the run;
+a move raising the energy by d is accepted with probability exp(-d / T).
+Energies of n-gram fitness functions are sums of log10 probabilities, so
+useful temperatures are of the order of a few units per hundred symbols.
+"""
+
+import random
+import time
+from typing import TypeVar
+
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.solve.base import (
+    STOP_INTERVAL,
+    IncrementalFitness,
+    Problem,
+    Proposal,
+    SolveResult,
+    StopCheck,
+    metropolis,
+)
+
+S = TypeVar("S")
+
+
+def _check_schedule(steps: int, tmax: float, tmin: float) -> None:
+    if steps < 1:
+        msg = f"steps must be positive, got {steps}"
+        raise InvalidInputError(msg, input_value=steps)
+    if not tmax >= tmin > 0:
+        msg = f"need tmax >= tmin > 0, got tmax={tmax}, tmin={tmin}"
+        raise InvalidInputError(msg)
+
+
+def _temperature(step: int, steps: int, tmax: float, tmin: float) -> float:
+    return float(tmax * (tmin / tmax) ** (step / steps))
+
+
+def anneal(
+    problem: Problem[S],
+    *,
+    steps: int = 50_000,
+    tmax: float = 10.0,
+    tmin: float = 0.1,
+    seed: int | None = None,
+    initial: S | None = None,
+    stop: StopCheck | None = None,
+) -> SolveResult[S]:
+    """Minimize the energy of `problem` by simulated annealing.
+
+    Args:
+        problem: Move set and energy function
+        steps: Number of moves
+        tmax: Starting temperature
+        tmin: Final temperature
+        seed: Seed for the random source; None for a fresh one
+        initial: Starting state; a random one if None
+        stop: Polled every few hundred moves; the run ends when it returns True
+
+    Returns:
+        The best state seen over the run
+
+    Raises:
+        InvalidInputError: If the schedule is invalid
+    """
+    _check_schedule(steps, tmax, tmin)
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    state = problem.moves.random_state(rng) if initial is None else initial
+    energy = problem.energy(state)
+    best, best_energy = state, energy
+    step = 0
+    while step < steps:
+        if stop is not None and step % STOP_INTERVAL == 0 and stop():
+            break
+        candidate = problem.moves.move(state, rng)
+        candidate_energy = problem.energy(candidate)
+        if metropolis(
+            candidate_energy - energy, _temperature(step, steps, tmax, tmin), rng
+        ):
+            state, energy = candidate, candidate_energy
+            if energy < best_energy:
+                best, best_energy = state, energy
+        step += 1
+    return SolveResult(best, best_energy, step, time.perf_counter() - start)
+
+
+def anneal_incremental(
+    fitness: IncrementalFitness[S],
+    proposal: Proposal,
+    *,
+    steps: int = 50_000,
+    tmax: float = 10.0,
+    tmin: float = 0.1,
+    seed: int | None = None,
+    stop: StopCheck | None = None,
+) -> SolveResult[S]:
+    """Simulated annealing driving an incremental fitness object.
+
+    The fitness object holds the current key and is updated in place; each
+    step proposes the move drawn by `proposal`, and accepts or rejects it on
+    the score delta alone. The energy is the negated score.
+
+    Example:
+    -------
+        >>> fitness = MascSwapFitness.from_text(ciphertext, key, quadgramscore)
+        >>> result = anneal_incremental(fitness, masc_swap_proposal(26), seed=1)
+
+    Args:
+        fitness: Incremental fitness, starting at its current key
+        proposal: Draws the arguments of fitness.propose()
+        steps: Number of moves
+        tmax: Starting temperature
+        tmin: Final temperature
+        seed: Seed for the random source; None for a fresh one
+        stop: Polled every few hundred moves; the run ends when it returns True
+
+    Returns:
+        The best key seen, as returned by fitness.snapshot()
+
+    Raises:
+        InvalidInputError: If the schedule is invalid
+    """
+    _check_schedule(steps, tmax, tmin)
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    best, best_score = fitness.snapshot(), fitness.score
+    step = 0
+    while step < steps:
+        if stop is not None and step % STOP_INTERVAL == 0 and stop():
+            break
+        delta = fitness.propose(*proposal(rng))
+        if metropolis(-delta, _temperature(step, steps, tmax, tmin), rng):
+            fitness.accept()
+            if fitness.score > best_score:
+                best, best_score = fitness.snapshot(), fitness.score
+        else:
+            fitness.reject()
+        step += 1
+    return SolveResult(best, -best_score, step, time.perf_counter() - start)
@@ -0,0 +1,109 @@
+"""State/move/energy protocol and result type shared by the solvers.
+
+A search problem is a move set, which draws random starting states and random
+neighbours of a state, together with an energy function to minimize. Fitness
+functions return higher-is-better log probabilities, so the usual energy is
+the negated fitness of the decryption under the state.
+
+Solvers that drive an incremental fitness object (MascSwapFitness,
+PascPeriodicFitness) use the IncrementalFitness protocol instead: a move is
+proposed, its score delta inspected, and the move is then accepted or
+rejected without rescoring the whole text.
+"""
+
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from math import exp
+from typing import Generic, Protocol, TypeVar
+
+S = TypeVar("S")
+S_co = TypeVar("S_co", covariant=True)
+
+
+class MoveSet(Protocol[S]):
+    """Random starting states and random neighbours for a key space."""
+
+    def random_state(self, rng: random.Random) -> S:
+        """A uniformly random state."""
+        ...
+
+    def move(self, state: S, rng: random.Random) -> S:
+        """A random neighbour of `state`; `state` itself is not modified."""
+        ...
+
+
+class IncrementalFitness(Protocol[S_co]):
+    """A fitness object rescoring only what a proposed move changes."""
+
+    score: float
+
+    def propose(self, a: int, b: int) -> float:
+        """Tentatively apply a move and return the score delta."""
+        ...
+
+    def accept(self) -> float:
+        """Commit the pending move and return the new score."""
+        ...
+
+    def reject(self) -> None:
+        """Roll back the pending move."""
+        ...
+
+    def snapshot(self) -> S_co:
+        """A copy of the current key."""
+        ...
+
+
+Proposal = Callable[[random.Random], tuple[int, int]]
+"""Draws the arguments of a random IncrementalFitness.propose() call."""
+
+StopCheck = Callable[[], bool]
+"""Polled by a running solver; returning True ends the run early."""
+
+STOP_INTERVAL = 256
+"""Moves between polls of a solver's stop check."""
+
+
+@dataclass(frozen=True)
+class Problem(Generic[S]):
+    """A move set and the energy to minimize over its states.
+
+    Attributes:
+        moves: The move set
+        energy: State to energy, lower is better
+    """
+
+    moves: MoveSet[S]
+    energy: Callable[[S], float]
+
+
+@dataclass(frozen=True)
+class SolveResult(Generic[S]):
+    """Best state found by a solver run.
+
+    Attributes:
+        state: The lowest-energy state seen
+        energy: Its energy
+        iterations: Number of moves evaluated
+        seconds: Wall-clock duration of the run
+    """
+
+    state: S
+    energy: float
+    iterations: int
+    seconds: float
+
+    @property
+    def iterations_per_second(self) -> float:
+        """Moves evaluated per second of wall-clock time."""
+        return self.iterations / self.seconds if self.seconds > 0 else 0.0
+
+
+def metropolis(delta: float, temperature: float, rng: random.Random) -> bool:
+    """Metropolis criterion: accept an energy change of `delta` at `temperature`."""
+    if delta <= 0:
+        return True
+    if temperature <= 0:
+        return False
+    return rng.random() < exp(-delta / temperature)
@@ -0,0 +1,74 @@
+"""Hill climbing with random restarts.
+
+Each climb starts from a random state and takes any move that does not raise
+the energy, until `patience` consecutive moves fail to lower it. The best
+state over all restarts is returned. Accepting sideways moves lets a climb
+drift across the plateaus that n-gram fitness landscapes are full of.
+"""
+
+import random
+import time
+from typing import TypeVar
+
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.solve.base import STOP_INTERVAL, Problem, SolveResult, StopCheck
+
+S = TypeVar("S")
+
+
+def hill_climb(
+    problem: Problem[S],
+    *,
+    restarts: int = 10,
+    patience: int = 1_000,
+    seed: int | None = None,
+    stop: StopCheck | None = None,
+) -> SolveResult[S]:
+    """Minimize the energy of `problem` by restarted hill climbing.
+
+    Args:
+        problem: Move set and energy function
+        restarts: Number of climbs from fresh random states
+        patience: Consecutive non-improving moves that end a climb
+        seed: Seed for the random source; None for a fresh one
+        stop: Polled every few hundred moves; the run ends when it returns True
+
+    Returns:
+        The best state over all climbs
+
+    Raises:
+        InvalidInputError: If restarts or patience is not positive
+    """
+    if restarts < 1:
+        msg = f"restarts must be positive, got {restarts}"
+        raise InvalidInputError(msg, input_value=restarts)
+    if patience < 1:
+        msg = f"patience must be positive, got {patience}"
+        raise InvalidInputError(msg, input_value=patience)
+
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    iterations = 0
+    best: S | None = None
+    best_energy = float("inf")
+    stopped = False
+    for _ in range(restarts):
+        state = problem.moves.random_state(rng)
+        energy = problem.energy(state)
+        stale = 0
+        while stale < patience:
+            if stop is not None and iterations % STOP_INTERVAL == 0 and stop():
+                stopped = True
+                break
+            candidate = problem.moves.move(state, rng)
+            candidate_energy = problem.energy(candidate)
+            iterations += 1
+            stale = 0 if candidate_energy < energy else stale + 1
+            if candidate_energy <= energy:
+                state, energy = candidate, candidate_energy
+        if best is None or energy < best_energy:
+            best, best_energy = state, energy
+        if stopped:
+            break
+    assert best is not None
+    return SolveResult(best, best_energy, iterations, time.perf_counter() - start)
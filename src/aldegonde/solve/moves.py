@@ -0,0 +1,149 @@
+"""Ready-made move sets for common key spaces.
+
+Each move set draws random starting keys and random neighbours of a key from
+an injected random.Random, so a seeded solver run is reproducible. Moves
+return a new key and leave their argument untouched.
+"""
+
+import random
+from collections.abc import Sequence
+from typing import Generic, TypeVar
+
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.solve.base import Proposal
+
+T = TypeVar("T")
+
+
+class MascKeyMoves(Generic[T]):
+    """MASC keys as plaintext-to-ciphertext dicts; a move swaps two cipher symbols."""
+
+    def __init__(self, alphabet: Sequence[T]) -> None:
+        if len(alphabet) < 2:
+            msg = "alphabet needs at least two symbols"
+            raise InvalidInputError(msg, input_value=alphabet)
+        self.alphabet = list(alphabet)
+
+    def random_state(self, rng: random.Random) -> dict[T, T]:
+        return dict(
+            zip(
+                self.alphabet,
+                rng.sample(self.alphabet, len(self.alphabet)),
+                strict=True,
+            )
+        )
+
+    def move(self, state: dict[T, T], rng: random.Random) -> dict[T, T]:
+        a, b = rng.sample(self.alphabet, 2)
+        key = dict(state)
+        key[a], key[b] = key[b], key[a]
+        return key
+
+
+class PascKeywordMoves(Generic[T]):
+    """Periodic PASC keywords; a move changes one keyword letter."""
+
+    def __init__(self, keys: Sequence[T], period: int) -> None:
+        if len(keys) < 2:
+            msg = "keys need at least two symbols"
+            raise InvalidInputError(msg, input_value=keys)
+        if period < 1:
+            msg = f"period must be positive, got {period}"
+            raise InvalidInputError(msg, input_value=period)
+        self.keys = list(keys)
+        self.period = period
+
+    def random_state(self, rng: random.Random) -> list[T]:
+        return [rng.choice(self.keys) for _ in range(self.period)]
+
+    def move(self, state: list[T], rng: random.Random) -> list[T]:
+        keyword = list(state)
+        position = rng.randrange(len(keyword))
+        keyword[position] = rng.choice([k for k in self.keys if k != keyword[position]])
+        return keyword
+
+
+class AutokeyPrimerMoves(PascKeywordMoves[T]):
+    """Autokey primers; a move changes one primer letter.
+
+    A wrong primer letter garbles every position it feeds through the
+    autokey chain, so the same single-letter move as for periodic keywords
+    is used but the energy landscape is much rougher.
+    """
+
+    def __init__(self, keys: Sequence[T], length: int) -> None:
+        super().__init__(keys, length)
+
+
+class MixedAlphabetMoves(Generic[T]):
+    """Mixed alphabets as permutations of a list; a move swaps two entries."""
+
+    def __init__(self, alphabet: Sequence[T]) -> None:
+        if len(alphabet) < 2:
+            msg = "alphabet needs at least two symbols"
+            raise InvalidInputError(msg, input_value=alphabet)
+        self.alphabet = list(alphabet)
+
+    def random_state(self, rng: random.Random) -> list[T]:
+        return rng.sample(self.alphabet, len(self.alphabet))
+
+    def move(self, state: list[T], rng: random.Random) -> list[T]:
+        a, b = rng.sample(range(len(state)), 2)
+        mixed = list(state)
+        mixed[a], mixed[b] = mixed[b], mixed[a]
+        return mixed
+
+
+class QuagmireMoves(Generic[T]):
+    """Quagmire keys as (mixed alphabet, keyword) pairs.
+
+    A move either swaps two letters of the mixed alphabet or changes one
+    letter of the periodic keyword, the latter with probability
+    `keyword_rate`.
+    """
+
+    def __init__(
+        self,
+        alphabet: Sequence[T],
+        period: int,
+        keyword_rate: float = 0.5,
+    ) -> None:
+        if not 0.0 <= keyword_rate <= 1.0:
+            msg = f"keyword_rate must be in [0, 1], got {keyword_rate}"
+            raise InvalidInputError(msg, input_value=keyword_rate)
+        self.alphabet_moves = MixedAlphabetMoves(alphabet)
+        self.keyword_moves = PascKeywordMoves(alphabet, period)
+        self.keyword_rate = keyword_rate
+
+    def random_state(self, rng: random.Random) -> tuple[list[T], list[T]]:
+        return (
+            self.alphabet_moves.random_state(rng),
+            self.keyword_moves.random_state(rng),
+        )
+
+    def move(
+        self, state: tuple[list[T], list[T]], rng: random.Random
+    ) -> tuple[list[T], list[T]]:
+        mixed, keyword = state
+        if rng.random() < self.keyword_rate:
+            return (mixed, self.keyword_moves.move(keyword, rng))
+        return (self.alphabet_moves.move(mixed, rng), keyword)
+
+
+def masc_swap_proposal(size: int) -> Proposal:
+    """Random key swaps (a, b) for MascSwapFitness over `size` symbols."""
+
+    def inner(rng: random.Random) -> tuple[int, int]:
+        a, b = rng.sample(range(size), 2)
+        return a, b
+
+    return inner
+
+
+def pasc_keyword_proposal(period: int, rows: int) -> Proposal:
+    """Random (position, row) changes for PascPeriodicFitness."""
+
+    def inner(rng: random.Random) -> tuple[int, int]:
+        return rng.randrange(period), rng.randrange(rows)
+
+    return inner
@@ -0,0 +1,145 @@
+"""Independent seeded restarts fanned out over a process pool.
+
+Random-restart search is embarrassingly parallel: restart i runs the solver
+with seed + i, the same convention as stats.resample, so the set of results
+for a fixed base seed does not depend on the number of workers. Results are
+streamed back to the parent as restarts complete, and once one reaches the
+energy threshold the pending restarts are cancelled and the running ones are
+told to stop through a shared event that the solvers poll via `stop`.
+
+The solver is called as solver(seed=..., stop=...) in a worker process, so it
+must be picklable: a module-level function, or a functools.partial of one of
+the aldegonde.solve solvers over a picklable Problem.
+
+Example:
+-------
+    >>> solver = functools.partial(anneal, problem, steps=50_000)
+    >>> for index, result in iter_restarts(solver, 16, seed=0, threshold=-900):
+    ...     print(index, result.energy)
+"""
+
+import multiprocessing
+from collections.abc import Callable, Generator
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from multiprocessing.synchronize import Event
+from typing import TypeVar
+
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.solve.base import SolveResult, StopCheck
+
+S = TypeVar("S")
+
+RestartSolver = Callable[..., SolveResult[S]]
+"""A solver accepting `seed` and `stop` keyword arguments."""
+
+_stop_event: Event | None = None
+
+
+def _init_worker(event: Event) -> None:
+    global _stop_event
+    _stop_event = event
+
+
+def stop_requested() -> bool:
+    """True once the parent pool has asked its workers to stop."""
+    return _stop_event is not None and _stop_event.is_set()
+
+
+def _run(solver: RestartSolver[S], seed: int, stop: StopCheck) -> SolveResult[S]:
+    return solver(seed=seed, stop=stop)
+
+
+def iter_restarts(
+    solver: RestartSolver[S],
+    restarts: int,
+    *,
+    seed: int = 0,
+    workers: int | None = None,
+    threshold: float | None = None,
+) -> Generator[tuple[int, SolveResult[S]], None, None]:
+    """Run seeded restarts in parallel, yielding each new best as it arrives.
+
+    Restart i is run with seed + i. A result is yielded when it beats every
+    result received so far, on energy and then on restart index, so the
+    last yield of a complete run is the same for any worker count. Closing
+    the generator early cancels the outstanding restarts.
+
+    Args:
+        solver: Picklable solver, called as solver(seed=seed + i, stop=...)
+        restarts: Number of restarts
+        seed: Base seed
+        workers: Worker processes; None for os.cpu_count()
+        threshold: Stop all restarts once one reaches an energy at or below
+            this value; which restarts finish is then timing dependent
+
+    Yields:
+        (restart index, result) for every improvement on the best so far
+
+    Raises:
+        InvalidInputError: If restarts is not positive
+    """
+    if restarts < 1:
+        msg = f"restarts must be positive, got {restarts}"
+        raise InvalidInputError(msg, input_value=restarts)
+
+    context = multiprocessing.get_context()
+    event = context.Event()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(event,),
+    ) as pool:
+        futures: dict[Future[SolveResult[S]], int] = {
+            pool.submit(_run, solver, seed + i, stop_requested): i
+            for i in range(restarts)
+        }
+        try:
+            best: tuple[float, int] | None = None
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                index, result = futures[future], future.result()
+                if best is None or (result.energy, index) < best:
+                    best = (result.energy, index)
+                    yield index, result
+                if threshold is not None and result.energy <= threshold:
+                    break
+        finally:
+            event.set()
+            for future in futures:
+                future.cancel()
+
+
+def run_restarts(
+    solver: RestartSolver[S],
+    restarts: int,
+    *,
+    seed: int = 0,
+    workers: int | None = None,
+    threshold: float | None = None,
+) -> tuple[int, SolveResult[S]]:
+    """Run seeded restarts in parallel and return the best one.
+
+    Args:
+        solver: Picklable solver, called as solver(seed=seed + i, stop=...)
+        restarts: Number of restarts
+        seed: Base seed
+        workers: Worker processes; None for os.cpu_count()
+        threshold: Stop all restarts once one reaches an energy at or below
+            this value
+
+    Returns:
+        (restart index, result) of the lowest-energy restart, the lowest
+        index among ties
+
+    Raises:
+        InvalidInputError: If restarts is not positive
+    """
+    best: tuple[int, SolveResult[S]] | None = None
+    for improvement in iter_restarts(
+        solver, restarts, seed=seed, workers=workers, threshold=threshold
+    ):
+        best = improvement
+    assert best is not None
+    return best
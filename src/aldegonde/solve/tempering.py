@@ -0,0 +1,103 @@
+"""Parallel tempering (replica exchange).
+
+Several replicas of the search run side by side at fixed temperatures, each
+taking Metropolis moves. Every `swap_interval` steps neighbouring replicas
+offer to exchange states, accepted with probability
+min(1, exp((E_i - E_j) * (1/T_i - 1/T_j))). Hot replicas roam the key space
+and hand promising states down to the cold ones, which refine them, so the
+search escapes local optima that trap a single annealing run.
+"""
+
+import random
+import time
+from collections.abc import Sequence
+from math import exp
+from typing import TypeVar
+
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.solve.base import (
+    STOP_INTERVAL,
+    Problem,
+    SolveResult,
+    StopCheck,
+    metropolis,
+)
+
+S = TypeVar("S")
+
+
+def geometric_temperatures(tmax: float, tmin: float, replicas: int) -> list[float]:
+    """`replicas` temperatures spaced geometrically from tmax down to tmin."""
+    if replicas < 2:
+        return [tmin] * replicas
+    return [tmax * (tmin / tmax) ** (i / (replicas - 1)) for i in range(replicas)]
+
+
+def parallel_tempering(
+    problem: Problem[S],
+    *,
+    temperatures: Sequence[float] | None = None,
+    steps: int = 10_000,
+    swap_interval: int = 10,
+    seed: int | None = None,
+    stop: StopCheck | None = None,
+) -> SolveResult[S]:
+    """Minimize the energy of `problem` by parallel tempering.
+
+    Args:
+        problem: Move set and energy function
+        temperatures: One temperature per replica, hottest first; defaults to
+            8 replicas spaced geometrically from 10.0 to 0.1
+        steps: Moves per replica
+        swap_interval: Steps between exchange attempts
+        seed: Seed for the random source; None for a fresh one
+        stop: Polled every few hundred steps; the run ends when it returns True
+
+    Returns:
+        The best state seen by any replica; iterations counts the moves of
+        all replicas
+
+    Raises:
+        InvalidInputError: If temperatures, steps or swap_interval is invalid
+    """
+    temps = (
+        geometric_temperatures(10.0, 0.1, 8)
+        if temperatures is None
+        else list(temperatures)
+    )
+    if not temps or min(temps) <= 0:
+        msg = "need at least one temperature, all positive"
+        raise InvalidInputError(msg, input_value=temperatures)
+    if steps < 1 or swap_interval < 1:
+        msg = f"steps and swap_interval must be positive, got {steps}, {swap_interval}"
+        raise InvalidInputError(msg)
+
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    states = [problem.moves.random_state(rng) for _ in temps]
+    energies = [problem.energy(state) for state in states]
+    best_index = min(range(len(temps)), key=energies.__getitem__)
+    best, best_energy = states[best_index], energies[best_index]
+    done = 0
+    for step in range(1, steps + 1):
+        if stop is not None and done % STOP_INTERVAL == 0 and stop():
+            break
+        done += 1
+        for i, temperature in enumerate(temps):
+            candidate = problem.moves.move(states[i], rng)
+            candidate_energy = problem.energy(candidate)
+            if metropolis(candidate_energy - energies[i], temperature, rng):
+                states[i], energies[i] = candidate, candidate_energy
+                if candidate_energy < best_energy:
+                    best, best_energy = candidate, candidate_energy
+        if step % swap_interval == 0:
+            for i in range(len(temps) - 1):
+                exponent = (energies[i] - energies[i + 1]) * (
+                    1 / temps[i] - 1 / temps[i + 1]
+                )
+                if exponent >= 0 or rng.random() < exp(exponent):
+                    states[i], states[i + 1] = states[i + 1], states[i]
+                    energies[i], energies[i + 1] = energies[i + 1], energies[i]
+    return SolveResult(
+        best, best_energy, done * len(temps), time.perf_counter() - start
+    )
@@ -1,18 +1,22 @@
 """Statistical analysis tools for cryptanalysis."""
 
+from typing import TYPE_CHECKING
+
+from aldegonde.stats import compare
 from aldegonde.stats.compare import (
     NgramScorer,
-    bigramscore,
     chisquarescipy,
     frequency_to_probability,
     gtest,
+    load_ngrams,
+    load_scorer,
     loadgrams,
     logdist,
     mychisquare,
-    quadgramscore,
-    trigramscore,
 )
+from aldegonde.stats.context import CacheInfo, TextAnalysis
 from aldegonde.stats.dist import print_dist
+from aldegonde.stats.encoded import Alphabet, EncodedText
 from aldegonde.stats.entropy import shannon2_entropy, shannon_entropy
 from aldegonde.stats.hamming import hamming_distance
 from aldegonde.stats.ioc import (
@@ -33,13 +37,33 @@ from aldegonde.stats.isomorph import (
     print_isomorph_statistics,
     random_isomorph_statistics,
 )
-from aldegonde.stats.kappa import doublets, kappa, print_kappa, triplets
+from aldegonde.stats.kappa import (
+    KappaSpectrum,
+    doublets,
+    kappa,
+    kappa_spectrum,
+    print_kappa,
+    triplets,
+)
+from aldegonde.stats.kernels import (
+    isomorph_distincts,
+    isomorph_duplicates,
+    kappa_counts,
+    kappa_values,
+    nioc_grid,
+    repeat_counts,
+    with_kernel,
+)
 from aldegonde.stats.mioc import MiocTuple, mioc, nmioc, print_mioc_statistics
 from aldegonde.stats.ngrams import (
     bigrams,
+    decode_ngram,
     digraphs,
     iterngram_positions,
     iterngrams,
+    ngram_code_distribution,
+    ngram_codes,
+    ngram_counts,
     ngram_distribution,
     ngram_positions,
     ngrams,
@@ -49,10 +73,15 @@ from aldegonde.stats.ngrams import (
     trigraphs,
 )
 from aldegonde.stats.nulls import (
+    MatrixNullModel,
     NullModel,
     doublet_shuffle,
+    doublet_shuffle_matrix,
     no_doublet_shuffle,
+    no_doublet_shuffle_matrix,
     shuffle,
+    shuffle_matrix,
+    stacked,
 )
 from aldegonde.stats.position import PositionChiSquare, position_frequency_chi2
 from aldegonde.stats.repeats import (
@@ -65,10 +94,13 @@ from aldegonde.stats.repeats import (
 from aldegonde.stats.resample import (
     FamilyResult,
     NullComparison,
+    batch_monte_carlo,
+    batch_monte_carlo_map,
     family_pvalue,
     monte_carlo,
     monte_carlo_map,
 )
+from aldegonde.stats.suffix import RepeatIndex, suffix_array
 from aldegonde.stats.zscore import z_score
 
 __all__ = [
@@ -78,13 +110,21 @@ __all__ = [
     "chisquarescipy",
     "frequency_to_probability",
     "gtest",
+    "load_ngrams",
+    "load_scorer",
     "loadgrams",
     "logdist",
     "mychisquare",
     "quadgramscore",
     "trigramscore",
+    # context
+    "CacheInfo",
+    "TextAnalysis",
     # dist
     "print_dist",
+    # encoded
+    "Alphabet",
+    "EncodedText",
     # entropy
     "shannon_entropy",
     "shannon2_entropy",
@@ -107,10 +147,20 @@ __all__ = [
     "print_isomorph_statistics",
     "random_isomorph_statistics",
     # kappa
+    "KappaSpectrum",
     "doublets",
     "kappa",
+    "kappa_spectrum",
     "print_kappa",
     "triplets",
+    # kernels
+    "isomorph_distincts",
+    "isomorph_duplicates",
+    "kappa_counts",
+    "kappa_values",
+    "nioc_grid",
+    "repeat_counts",
+    "with_kernel",
     # mioc
     "MiocTuple",
     "mioc",
@@ -118,9 +168,13 @@ __all__ = [
     "print_mioc_statistics",
     # ngrams
     "bigrams",
+    "decode_ngram",
     "digraphs",
     "iterngram_positions",
     "iterngrams",
+    "ngram_code_distribution",
+    "ngram_codes",
+    "ngram_counts",
     "ngram_distribution",
     "ngram_positions",
     "ngrams",
@@ -129,10 +183,15 @@ __all__ = [
     "trigrams",
     "trigraphs",
     # nulls
+    "MatrixNullModel",
     "NullModel",
     "doublet_shuffle",
+    "doublet_shuffle_matrix",
     "no_doublet_shuffle",
+    "no_doublet_shuffle_matrix",
     "shuffle",
+    "shuffle_matrix",
+    "stacked",
     # position
     "PositionChiSquare",
     "position_frequency_chi2",
@@ -145,9 +204,25 @@ __all__ = [
     # resample
     "FamilyResult",
     "NullComparison",
+    "batch_monte_carlo",
+    "batch_monte_carlo_map",
     "family_pvalue",
     "monte_carlo",
     "monte_carlo_map",
+    # suffix
+    "RepeatIndex",
+    "suffix_array",
     # zscore
     "z_score",
 ]
+
+if TYPE_CHECKING:
+    from aldegonde.stats.compare import bigramscore, quadgramscore, trigramscore
+
+
+def __getattr__(name: str) -> object:
+    """Defer the English scorers to their lazy loading in stats.compare."""
+    if name in ("bigramscore", "trigramscore", "quadgramscore"):
+        return getattr(compare, name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -1,17 +1,55 @@
-"""Functions around comparing texts or distributions in texts."""
-
+"""Functions around comparing texts or distributions in texts.
+
+The English language models (unigrams, bigrams, trigrams and quadgrams, and
+the bigramscore, trigramscore and quadgramscore scorers) are module
+attributes loaded on first access rather than at import. Scorers come from
+load_scorer, which compiles each frequency file once into a memory-mapped
+table in the n-gram cache, so later processes skip parsing the text file.
+Set ALDEGONDE_CACHE to an empty value to keep the tables in memory only; an
+unwritable cache directory has the same effect.
+"""
+
+import contextlib
+import os
 from collections import defaultdict
 from collections.abc import Callable, Sequence
-from importlib.resources import files
+from functools import cache
+from importlib.resources import as_file, files
 from math import log10
-from typing import TypeVar
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
 
 from scipy.stats import chisquare, power_divergence
 
-from aldegonde.stats.ngrams import iterngrams, ngram_distribution
+from aldegonde.cache import cache_directory
+from aldegonde.stats.ngrams import ngram_distribution
+from aldegonde.stats.ngramscore import DenseNgramScorer
 
 T = TypeVar("T")
 
+ENGLISH = "aldegonde.data.ngrams.english"
+
+_GRAMS = {
+    "unigrams": "unigrams.txt",
+    "bigrams": "bigrams.txt",
+    "trigrams": "trigrams.txt",
+    "quadgrams": "quadgrams.txt",
+}
+_SCORERS = {
+    "bigramscore": "bigrams.txt",
+    "trigramscore": "trigrams.txt",
+    "quadgramscore": "quadgrams.txt",
+}
+
+if TYPE_CHECKING:
+    unigrams: dict[str, int]
+    bigrams: dict[str, int]
+    trigrams: dict[str, int]
+    quadgrams: dict[str, int]
+    bigramscore: DenseNgramScorer
+    trigramscore: DenseNgramScorer
+    quadgramscore: DenseNgramScorer
+
 
 def loadgrams(module: str, filename: str) -> dict[str, int]:
     """Load quadgrams from text file"""
@@ -54,10 +92,61 @@ def frequency_to_probability(
     )
 
 
-unigrams = loadgrams("aldegonde.data.ngrams.english", "unigrams.txt")
-bigrams = loadgrams("aldegonde.data.ngrams.english", "bigrams.txt")
-trigrams = loadgrams("aldegonde.data.ngrams.english", "trigrams.txt")
-quadgrams = loadgrams("aldegonde.data.ngrams.english", "quadgrams.txt")
+@cache
+def load_ngrams(module: str, filename: str) -> dict[str, int]:
+    """loadgrams() of a packaged n-gram file, parsed once per process."""
+    return loadgrams(module, filename)
+
+
+@cache
+def load_scorer(module: str, filename: str) -> DenseNgramScorer:
+    """The DenseNgramScorer of a packaged n-gram file, through the n-gram cache.
+
+    The compiled table is stored in cache_directory("ngrams") under a name tied to the
+    size and modification time of the source file, and memory-mapped from
+    there on later calls, also by other processes. Without a usable cache
+    directory the table is compiled in memory.
+    """
+    directory = cache_directory("ngrams")
+    if directory is None:
+        return DenseNgramScorer(load_ngrams(module, filename))
+    with as_file(files(module).joinpath(filename)) as source:
+        stat = os.stat(source)
+    name = f"{module}.{Path(filename).stem}-{stat.st_size}-{stat.st_mtime_ns}"
+    path = directory / name
+    try:
+        return DenseNgramScorer.load(path)
+    except (OSError, ValueError, KeyError):
+        pass
+    scorer = DenseNgramScorer(load_ngrams(module, filename))
+    # a read-only cache only costs the compilation on every start
+    with contextlib.suppress(OSError):
+        scorer.save(path)
+    return scorer
+
+
+def __getattr__(name: str) -> object:
+    """Load the English language models on first access.
+
+    Raises:
+        AttributeError: For other names, and when a data file cannot be
+            read, chained to the OSError
+    """
+    value: object
+    try:
+        if name in _GRAMS:
+            value = load_ngrams(ENGLISH, _GRAMS[name])
+        elif name in _SCORERS:
+            value = load_scorer(ENGLISH, _SCORERS[name])
+        else:
+            msg = f"module {__name__!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+    except OSError as e:
+        # hasattr() and getattr() with a default only handle AttributeError
+        msg = f"module {__name__!r} cannot load {name!r}: {e}"
+        raise AttributeError(msg) from e
+    globals()[name] = value
+    return value
 
 
 # use scipy.stats.chisquare?
@@ -108,14 +197,14 @@ def logdist(text1: Sequence[T], text2: Sequence[T], length: int = 1) -> float:
 def chisquarescipy(text: Sequence[object], length: int = 4) -> float:
     """ """
     floor = 0.01
-    frequency_map = quadgrams
+    frequency_map = load_ngrams(ENGLISH, "quadgrams.txt")
     ngrams = frequency_to_probability(frequency_map)
     d1 = ngram_distribution(text, length=length)
     d2 = [ngrams.get(ngram, floor) for ngram in d1]
     return float(chisquare(f_obs=d1, f_exp=d2).statistic)
 
 
-def NgramScorer(frequency_map: dict[str, int]) -> Callable[[str], float]:
+def NgramScorer(frequency_map: dict[str, int]) -> DenseNgramScorer:
     """Compute the score of a text by using the frequencies of ngrams.
 
     Example:
@@ -126,23 +215,10 @@ def NgramScorer(frequency_map: dict[str, int]) -> Callable[[str], float]:
     Args:
         frequency_map (dict): ngram to frequency mapping
 
+    The frequencies are compiled into a dense log-probability table, see
+    `aldegonde.stats.ngramscore`; the returned scorer also scores encoded texts
+    and batches of texts.
+
     http://practicalcryptography.com/media/cryptanalysis/files/ngram_score_1.py
     """
-    length = len(next(iter(frequency_map)))
-    # 0.01 is a magic number. Needs to be better than that.
-    floor: float = log10(0.01 / sum(frequency_map.values()))
-    ngrams: dict[str, float] = defaultdict(
-        lambda: floor,
-        frequency_to_probability(frequency_map, decorator=log10),
-    )
-
-    def inner(text: str) -> float:
-        gen = [ngrams[str(ngram)] for ngram in iterngrams(text, length)]
-        return sum(gen)
-
-    return inner
-
-
-quadgramscore = NgramScorer(quadgrams)
-trigramscore = NgramScorer(trigrams)
-bigramscore = NgramScorer(bigrams)
+    return DenseNgramScorer(frequency_map)
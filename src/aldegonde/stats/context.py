@@ -0,0 +1,220 @@
+"""Per-text analysis context sharing derived structures across diagnostics.
+
+A battery of diagnostics over one text (IOC grid, kappa tables, repeat and
+isomorph statistics) keeps rebuilding the same structures: the encoded text,
+n-gram distributions, the suffix array, doublet positions and the kappa
+spectrum. A TextAnalysis computes each of them on first use and keeps it in a
+bounded LRU cache, so later diagnostics reuse the work. The cache is capped
+in (estimated) bytes; the least recently used structures are evicted first,
+and cache_info() reports hits, misses and current memory use.
+
+The print_* diagnostics accept the context as their `analysis` argument.
+
+Example:
+-------
+    >>> analysis = TextAnalysis(ciphertext)
+    >>> print_ioc_statistics(ciphertext, 29, analysis=analysis)
+    >>> print_kappa(ciphertext, analysis=analysis)
+    >>> print_repeat_statistics(ciphertext, analysis=analysis)
+    >>> analysis.cache_info()
+    CacheInfo(hits=..., misses=..., entries=..., nbytes=..., max_bytes=...)
+"""
+
+import sys
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from typing import NamedTuple, TypeVar
+
+import numpy as np
+
+from aldegonde.stats.encoded import EncodedText
+from aldegonde.stats.ioc import IocResult, _nioc_result
+from aldegonde.stats.isomorph import isomorph_distribution
+from aldegonde.stats.kappa import KappaSpectrum, doublets, kappa_spectrum
+from aldegonde.stats.ngrams import _encoded_ngram_counts, ngram_distribution
+from aldegonde.stats.suffix import RepeatIndex
+
+V = TypeVar("V")
+
+DEFAULT_MAX_BYTES = 64 << 20
+
+
+class CacheInfo(NamedTuple):
+    """Usage of a TextAnalysis cache."""
+
+    hits: int
+    misses: int
+    entries: int
+    nbytes: int
+    max_bytes: int
+
+
+def _nbytes(value: object) -> int:
+    """Estimated memory held by a cached structure."""
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, EncodedText):
+        return int(value.codes.nbytes)
+    if isinstance(value, RepeatIndex):
+        return int(value.suffixes.nbytes + value.lcp.nbytes)
+    if isinstance(value, tuple):
+        return sys.getsizeof(value) + sum(_nbytes(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items()
+        )
+    if isinstance(value, list):
+        return sys.getsizeof(value) + sum(sys.getsizeof(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class TextAnalysis:
+    """Lazily computed, LRU-cached structures derived from one text.
+
+    Attributes:
+        max_bytes: Memory cap of the cache in bytes
+        hits: Number of lookups served from the cache
+        misses: Number of lookups that computed their structure
+    """
+
+    def __init__(
+        self, text: Sequence[object], max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        """Start an empty context for a text.
+
+        Args:
+            text: Sequence to analyze
+            max_bytes: Memory cap of the cache in bytes
+        """
+        self._text = text
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[tuple[Hashable, ...], tuple[object, int]] = (
+            OrderedDict()
+        )
+        self._nbytes = 0
+
+    @property
+    def text(self) -> Sequence[object]:
+        """The analyzed text; assigning a new one invalidates the cache."""
+        return self._text
+
+    @text.setter
+    def text(self, text: Sequence[object]) -> None:
+        self._text = text
+        self.invalidate()
+
+    def __len__(self) -> int:
+        return len(self._text)
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory held by the cached structures."""
+        return self._nbytes
+
+    def cache_info(self) -> CacheInfo:
+        """Hits, misses, number of entries and memory use of the cache."""
+        return CacheInfo(
+            self.hits, self.misses, len(self._cache), self._nbytes, self.max_bytes
+        )
+
+    def invalidate(self, kind: str | None = None) -> None:
+        """Drop cached structures: all of them, or those of one kind.
+
+        Args:
+            kind: Method name of the structures to drop (e.g. "repeat_index");
+                None drops everything
+        """
+        for key in list(self._cache):
+            if kind is None or key[0] == kind:
+                self._drop(key)
+
+    def _drop(self, key: tuple[Hashable, ...]) -> None:
+        """Remove one cached structure, if present."""
+        if key in self._cache:
+            self._nbytes -= self._cache.pop(key)[1]
+
+    def _cached(self, key: tuple[Hashable, ...], compute: Callable[[], V]) -> V:
+        """The structure under key, computed and cached on a miss."""
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            value: V = self._cache[key][0]  # type: ignore[assignment]
+            return value
+        self.misses += 1
+        value = compute()
+        size = _nbytes(value)
+        if size <= self.max_bytes:
+            self._cache[key] = (value, size)
+            self._nbytes += size
+            while self._nbytes > self.max_bytes:
+                _, (_, evicted) = self._cache.popitem(last=False)
+                self._nbytes -= evicted
+        return value
+
+    def encoded(self) -> EncodedText[object]:
+        """The text as an EncodedText, symbols numbered by first appearance."""
+        if isinstance(self._text, EncodedText):
+            return self._text
+        return self._cached(("encoded",), lambda: EncodedText(self._text))
+
+    def ngram_distribution(self, length: int = 1, cut: int = 0) -> dict[str, int]:
+        """ngrams.ngram_distribution of the text."""
+        return self._cached(
+            ("ngram_distribution", length, cut),
+            lambda: ngram_distribution(self.encoded(), length, cut),
+        )
+
+    def ngram_counts(self, length: int = 1, cut: int = 0) -> np.ndarray:
+        """Occurrence count of each distinct n-gram."""
+        return self._cached(
+            ("ngram_counts", length, cut),
+            lambda: _encoded_ngram_counts(self.encoded(), length, cut),
+        )
+
+    def nioc(self, alphabetsize: int, length: int = 1, cut: int = 0) -> IocResult:
+        """ioc.nioc of the text, from the cached n-gram counts."""
+        counts = self.ngram_counts(length, cut).astype(np.int64)
+        freqsum = int((counts * (counts - 1)).sum())
+        return _nioc_result(int(counts.sum()), freqsum, alphabetsize, length)
+
+    def repeat_index(self) -> RepeatIndex:
+        """Suffix array index of the repeats of the text."""
+        return self._cached(("repeat_index",), lambda: RepeatIndex(self.encoded()))
+
+    def doublets(self, skip: int = 1, length: int = 1) -> list[int]:
+        """Positions of kappa.doublets of the text at a skip."""
+        return self._cached(
+            ("doublets", skip, length),
+            lambda: doublets(self.encoded(), skip, length)[0],
+        )
+
+    def kappa_spectrum(
+        self, max_skip: int | None = None, length: int = 1
+    ) -> KappaSpectrum:
+        """kappa.kappa_spectrum of the text.
+
+        One spectrum is kept per n-gram length, and a request for fewer skips
+        than it covers is answered from it.
+        """
+        key = ("kappa_spectrum", length)
+        top = max(len(self._text) - length, 0) if max_skip is None else max_skip
+        cached = self._cache.get(key)
+        if cached is not None:
+            spectrum: KappaSpectrum = cached[0]  # type: ignore[assignment]
+            if len(spectrum.counts) > top:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return KappaSpectrum(
+                    spectrum.counts[: top + 1], spectrum.comparisons[: top + 1]
+                )
+            self._drop(key)
+        return self._cached(key, lambda: kappa_spectrum(self.encoded(), top, length))
+
+    def isomorph_distribution(self, length: int) -> dict[str, int]:
+        """isomorph.isomorph_distribution of the text."""
+        return self._cached(
+            ("isomorph_distribution", length),
+            lambda: isomorph_distribution(self.encoded(), length),
+        )
@@ -0,0 +1,199 @@
+"""Integer-encoded texts shared across the statistics.
+
+Most statistics accept any Sequence and rediscover symbol identity on every
+call, through str() keys, tuple slices or a Counter. An EncodedText holds a
+text once as a compact uint8 or uint16 buffer of symbol indices over an
+Alphabet, so the encoding cost is paid once per text instead of once per
+statistic. The hot functions (ioc, nioc, kappa, ngram_distribution, mioc,
+shannon_entropy, isomorph, isomorph_distribution and delta) take an array
+fast path when given one.
+
+An EncodedText is itself a Sequence of the original symbols, and slicing it
+gives an EncodedText again, so it can be passed to any function of the
+library; str() of a slice is the str() of the same slice of a str, tuple or
+list source text (of a list for any other sequence), which keeps n-gram keys
+identical on both paths.
+
+Example:
+-------
+    >>> text = EncodedText("ATTACKATDAWN")
+    >>> text.alphabet.symbols
+    ['A', 'T', 'C', 'K', 'D', 'W', 'N']
+    >>> text.codes[:6].tolist()
+    [0, 1, 1, 0, 2, 3]
+    >>> str(text[6:8])
+    'AT'
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Generic, TypeVar, overload
+
+import numpy as np
+
+from aldegonde.exceptions import AlphabetError
+
+T = TypeVar("T")
+
+MAX_ALPHABET = 1 << 16
+
+CONTAINERS: tuple[type, ...] = (str, tuple, list)
+"""Source types whose slices EncodedText reproduces in str()."""
+
+
+class Alphabet(Generic[T]):
+    """An ordered set of symbols numbered 0..size - 1.
+
+    Attributes:
+        symbols: The symbols in index order
+        index: Symbol to index
+        dtype: Smallest unsigned NumPy type holding every index
+    """
+
+    def __init__(self, symbols: Iterable[T]) -> None:
+        self.symbols: list[T] = list(dict.fromkeys(symbols))
+        if len(self.symbols) > MAX_ALPHABET:
+            msg = f"Alphabet of {len(self.symbols)} symbols exceeds {MAX_ALPHABET}"
+            raise AlphabetError(msg, expected_size=MAX_ALPHABET)
+        self.index: dict[T, int] = {s: i for i, s in enumerate(self.symbols)}
+        self.dtype: type[np.unsignedinteger] = (
+            np.uint8 if len(self.symbols) <= 256 else np.uint16
+        )
+
+    @property
+    def size(self) -> int:
+        """Number of symbols."""
+        return len(self.symbols)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Alphabet):
+            return NotImplemented
+        return self.symbols == other.symbols
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.symbols))
+
+    def __repr__(self) -> str:
+        return f"Alphabet({self.symbols!r})"
+
+    def encode(self, text: Iterable[T]) -> np.ndarray:
+        """Indices of the symbols of a text.
+
+        Raises:
+            AlphabetError: If the text holds a symbol outside the alphabet
+        """
+        try:
+            return np.fromiter((self.index[s] for s in text), dtype=self.dtype)
+        except KeyError as exc:
+            msg = f"Symbol {exc.args[0]!r} is not in the alphabet"
+            raise AlphabetError(msg, alphabet=self.symbols) from exc
+
+    def decode(self, codes: Iterable[int] | np.ndarray) -> list[T]:
+        """Symbols of a sequence of indices."""
+        if isinstance(codes, np.ndarray):
+            codes = codes.tolist()
+        return [self.symbols[c] for c in codes]
+
+
+class EncodedText(Sequence[T]):
+    """A text stored once as symbol indices over an Alphabet.
+
+    Attributes:
+        codes: 1-D array of symbol indices, of the alphabet's dtype
+        alphabet: The alphabet the codes index
+        container: The type of the source text, one of CONTAINERS (list for
+            any other sequence); str() spells the symbols as a slice of it
+    """
+
+    def __init__(
+        self, text: Sequence[T], alphabet: Alphabet[T] | Iterable[T] | None = None
+    ) -> None:
+        """Encode a text.
+
+        Args:
+            text: Sequence of symbols
+            alphabet: Alphabet or symbols in index order; None numbers the
+                symbols of the text in order of first appearance
+        """
+        if alphabet is None:
+            alphabet = Alphabet(text)
+        elif not isinstance(alphabet, Alphabet):
+            alphabet = Alphabet(alphabet)
+        self.alphabet: Alphabet[T] = alphabet
+        self.codes: np.ndarray = alphabet.encode(text)
+        self.container: type = _container(text)
+
+    @classmethod
+    def from_codes(
+        cls, codes: np.ndarray, alphabet: Alphabet[T], *, container: type = list
+    ) -> "EncodedText[T]":
+        """Wrap existing indices without re-encoding.
+
+        Raises:
+            AlphabetError: If an index falls outside the alphabet
+        """
+        codes = np.asarray(codes)
+        if codes.size and (codes.min() < 0 or codes.max() >= alphabet.size):
+            msg = f"Codes must lie in 0..{alphabet.size - 1}"
+            raise AlphabetError(msg, alphabet=alphabet.symbols)
+        text: EncodedText[T] = cls.__new__(cls)
+        text.alphabet = alphabet
+        text.codes = codes.astype(alphabet.dtype, copy=False)
+        text.container = container
+        return text
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "EncodedText[T]": ...
+
+    def __getitem__(self, index: int | slice) -> "T | EncodedText[T]":
+        if isinstance(index, slice):
+            return EncodedText.from_codes(
+                self.codes[index], self.alphabet, container=self.container
+            )
+        symbol: T = self.alphabet.symbols[self.codes[index]]
+        return symbol
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.decode())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EncodedText):
+            return NotImplemented
+        return self.alphabet == other.alphabet and np.array_equal(
+            self.codes, other.codes
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __str__(self) -> str:
+        symbols = self.decode()
+        if self.container is str:
+            return "".join(str(s) for s in symbols)
+        if self.container is tuple:
+            return str(tuple(symbols))
+        return str(symbols)
+
+    def __repr__(self) -> str:
+        return f"EncodedText({str(self)!r})"
+
+    def decode(self) -> list[T]:
+        """The symbols of the text."""
+        return self.alphabet.decode(self.codes)
+
+
+def _container(text: Sequence[object]) -> type:
+    """The type of one of CONTAINERS whose slices match those of text."""
+    if isinstance(text, EncodedText):
+        return text.container
+    for container in CONTAINERS:
+        if isinstance(text, container):
+            return container
+    return list
@@ -5,15 +5,23 @@ from collections import Counter
 from collections.abc import Sequence
 from typing import TypeVar
 
+import numpy as np
+
+from aldegonde.stats.encoded import EncodedText
+
 T = TypeVar("T")
 
 
 def shannon_entropy(ciphertext: Sequence[object], base: int = 2) -> float:
     """Shannon entropy. by default in bits."""
-    f = Counter(ciphertext)
     N = len(ciphertext)
     H: float = 0.0
-    for v in f.values():
+    if isinstance(ciphertext, EncodedText):
+        counts = np.bincount(ciphertext.codes)
+        frequencies = counts[counts > 0].tolist()
+    else:
+        frequencies = list(Counter(ciphertext).values())
+    for v in frequencies:
         H = H - v / N * math.log(v / N, base)
     print(f"Shannon Entropy = {H:.3f} bits (size={N})")
     return H
@@ -1,20 +1,32 @@
 """IOC calculation."""
 
 from collections.abc import Sequence
+from functools import partial
 from math import log, sqrt
-from typing import NamedTuple
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
 
 from aldegonde.exceptions import (
     InsufficientDataError,
     InvalidInputError,
     StatisticalAnalysisError,
 )
-from aldegonde.stats.ngrams import ngram_distribution
+from aldegonde.stats.encoded import EncodedText
+from aldegonde.stats.kernels import _ngram_ids, nioc_grid, with_kernel
+from aldegonde.stats.ngrams import (
+    _encoded_ngram_counts,
+    _symbol_codes,
+    ngram_distribution,
+)
 from aldegonde.stats.nulls import NullModel
 from aldegonde.stats.resample import monte_carlo_map
 from aldegonde.stats.zscore import z_score
 from aldegonde.validation import validate_positive_integer, validate_text_sequence
 
+if TYPE_CHECKING:
+    from aldegonde.stats.context import TextAnalysis
+
 
 class IocResult(NamedTuple):
     """Result of normalized IOC calculation."""
@@ -24,6 +36,15 @@ class IocResult(NamedTuple):
     z_score: float
 
 
+def _coincidence_sums(text: Sequence[object], length: int, cut: int) -> tuple[int, int]:
+    """Number of n-grams L and sum of v * (v - 1) over the n-gram counts v."""
+    if isinstance(text, EncodedText):
+        counts = _encoded_ngram_counts(text, length, cut).astype(np.int64)
+        return int(counts.sum()), int((counts * (counts - 1)).sum())
+    freqs: dict[str, int] = ngram_distribution(text, length=length, cut=cut)
+    return sum(freqs.values()), sum(v * (v - 1) for v in freqs.values())
+
+
 def ioc(text: Sequence[object], length: int = 1, cut: int = 0) -> float:
     """Multigraphic Index of Coincidence: ΔIC
 
@@ -52,8 +73,7 @@ def ioc(text: Sequence[object], length: int = 1, cut: int = 0) -> float:
         raise InvalidInputError(msg)
 
     try:
-        freqs: dict[str, int] = ngram_distribution(text, length=length, cut=cut)
-        L: int = sum(x for x in freqs.values())
+        L, freqsum = _coincidence_sums(text, length, cut)
 
         if L < 2:
             msg = f"Insufficient n-grams ({L}) for IOC calculation"
@@ -64,7 +84,6 @@ def ioc(text: Sequence[object], length: int = 1, cut: int = 0) -> float:
                 analysis_type="IOC",
             )
 
-        freqsum: float = sum(v * (v - 1) for v in freqs.values())
         return freqsum / (L * (L - 1))
 
     except Exception as exc:
@@ -86,11 +105,14 @@ def nioc(
     normalized to alphabet size, and the signed number of standard
     deviations away from random data.
     """
-    freqs: dict[str, int] = ngram_distribution(text, length=length, cut=cut)
-    L: int = sum(x for x in freqs.values())
+    L, freqsum = _coincidence_sums(text, length, cut)
+    return _nioc_result(L, freqsum, alphabetsize, length)
+
+
+def _nioc_result(L: int, freqsum: int, alphabetsize: int, length: int) -> IocResult:
+    """nioc() from the n-gram total and the sum of v * (v - 1) over counts v."""
     if L < 2:
         return IocResult(ioc=0.0, nioc=0.0, z_score=0.0)
-    freqsum: float = sum(v * (v - 1) for v in freqs.values())
     ic = freqsum / (L * (L - 1))
     C = pow(alphabetsize, length)  # size of alphabet
     nic = C * ic
@@ -119,6 +141,7 @@ def _nioc_grid_against_null(
             for index, (length, cut) in enumerate(cells)
         }
 
+    with_kernel(statistic, partial(nioc_grid, cells=cells, alphabetsize=alphabetsize))
     results = monte_carlo_map(
         statistic, null, text, keys=list(range(len(cells))), trials=trials, seed=seed
     )
@@ -136,6 +159,7 @@ def print_ioc_statistics(
     null_label: str | None = None,
     trials: int = 1000,
     seed: int = 0,
+    analysis: "TextAnalysis | None" = None,
 ) -> None:
     """Print the multigraphic IOC grid with z-scores against a null hypothesis.
 
@@ -145,6 +169,8 @@ def print_ioc_statistics(
     z is then standard deviations from that null's distribution, and `null_label`
     names it in the header. A frequency-preserving null leaves monographic IOC
     invariant (z = 0), so only multigraphic IOC carries signal against it.
+    Pass `analysis`, a TextAnalysis of the text, to reuse its cached n-gram
+    counts.
     """
     cells = [
         (length, cut)
@@ -160,7 +186,11 @@ def print_ioc_statistics(
         )
         scored = {}
         for length, cut in cells:
-            result = nioc(text, alphabetsize=alphabetsize, length=length, cut=cut)
+            result = (
+                nioc(text, alphabetsize=alphabetsize, length=length, cut=cut)
+                if analysis is None
+                else analysis.nioc(alphabetsize, length, cut)
+            )
             scored[(length, cut)] = (result.nioc, result.z_score)
     else:
         print(
@@ -177,22 +207,61 @@ def print_ioc_statistics(
         print()
 
 
+def _sliding_pair_sums(ids: np.ndarray, width: int) -> np.ndarray:
+    """sum(v * (v - 1)) over the id counts of every window of `width` ids.
+
+    The running-sum update of a streaming count table, evaluated in bulk:
+    sliding one place drops the pairs of the leaving id with its equals in
+    the window and adds those of the entering id, so each step changes the
+    sum by 2 * (equals of the entering id - equals of the leaving id), both
+    counted by binary search in the ids sorted by (id, position).
+    """
+    positions = np.arange(len(ids))
+    order = np.lexsort((positions, ids))
+    keys = ids[order] * (len(ids) + width) + order
+    rank = np.empty(len(ids), dtype=np.int64)
+    rank[order] = positions
+    own = ids * (len(ids) + width) + positions
+    # equals within the `width - 1` places after / before each position
+    ahead = np.searchsorted(keys, own + width - 1, side="right") - rank - 1
+    behind = rank - np.searchsorted(keys, own - (width - 1), side="left")
+
+    windows = len(ids) - width + 1
+    _, counts = np.unique(ids[:width], return_counts=True)
+    sums = np.empty(windows, dtype=np.int64)
+    sums[0] = int((counts * (counts - 1)).sum())
+    steps = 2 * (behind[width:] - ahead[: windows - 1])
+    np.cumsum(steps, out=sums[1:])
+    sums[1:] += sums[0]
+    return sums
+
+
 def sliding_window_ioc(
     text: Sequence[object],
     length: int = 1,
     cut: int = 0,
     window: int = 100,
-) -> list[float]:
+    step: int = 1,
+) -> np.ndarray:
     """Calculate sliding window IOC of a large data set.
 
+    Element k is ioc(text[k * step : k * step + window], length, cut). The
+    whole profile takes O(N log N) rather than a fresh count per window: the
+    n-grams are numbered once and the sum of v * (v - 1) over their counts is
+    carried from window to window, adding the entering n-gram and removing
+    the leaving one. With cut > 0 the n-gram grid moves with the window, so
+    windows are grouped by their alignment modulo `length`, each group
+    sliding over its own stream of non-overlapping n-grams.
+
     Args:
         text: Sequence to analyze
         length: size of ngram
         cut: where to start ngrams
         window: size of sliding window
+        step: distance between the starts of consecutive windows
 
     Returns:
-        List of IOC values for each window position
+        Array of IOC values for each window position
 
     Raises:
         InvalidInputError: If parameters are invalid
@@ -201,6 +270,7 @@ def sliding_window_ioc(
     validate_text_sequence(text, min_length=window + length)
     validate_positive_integer(length, "length")
     validate_positive_integer(window, "window")
+    validate_positive_integer(step, "step")
 
     if len(text) < window + length:
         msg = f"Text length {len(text)} is insufficient for window size {window} with n-gram length {length}"
@@ -210,11 +280,37 @@ def sliding_window_ioc(
             actual_length=len(text),
             analysis_type="sliding window IOC",
         )
+    if cut < 0 or cut > length:
+        msg = f"Cut value {cut} must be between 0 and {length}"
+        raise InvalidInputError(msg)
+
+    ids = _ngram_ids(_symbol_codes(text)[None, :], length)[0]
+    starts = np.arange(0, len(text) - window + 1, step)
+    if cut == 0:
+        width = window - length + 1
+        phases = np.zeros(len(starts), dtype=np.int64)
+        offsets = starts
+    else:
+        # window i holds the n-grams at i + cut - 1, i + cut - 1 + length, ...
+        width = (window - length - cut + 1) // length + 1
+        first = starts + cut - 1
+        phases, offsets = first % length, first // length
+    if width < 2:
+        msg = f"Insufficient n-grams ({max(width, 0)}) for IOC calculation"
+        raise InsufficientDataError(
+            msg,
+            required_length=2,
+            actual_length=max(width, 0),
+            analysis_type="IOC",
+        )
 
-    output: list[float] = []
-    for i in range(len(text) - window + 1):
-        output.append(ioc(text[i : i + window], length=length, cut=cut))
-    return output
+    sums = np.empty(len(starts), dtype=np.int64)
+    for phase in np.unique(phases):
+        stream = ids if cut == 0 else ids[phase::length]
+        selected = phases == phase
+        sums[selected] = _sliding_pair_sums(stream, width)[offsets[selected]]
+    values: np.ndarray = sums / (width * (width - 1))
+    return values
 
 
 def ioc2(text: Sequence[object], cut: int = 0) -> float:
@@ -8,16 +8,26 @@ AABC AACB ABAC ABBC ABCA ABCB ABCC ABCA ABCB ABCC | ABCD
 """
 
 import random
-import statistics
 from collections import Counter, defaultdict
 from collections.abc import Sequence
-from typing import TypeVar
+from functools import partial
+from typing import TYPE_CHECKING, TypeVar
 
+import numpy as np
+
+from aldegonde.stats.encoded import EncodedText
+from aldegonde.stats.kernels import isomorph_distincts, isomorph_duplicates, with_kernel
 from aldegonde.stats.ngrams import iterngrams
+from aldegonde.stats.resample import monte_carlo_map
 from aldegonde.stats.zscore import z_score
 
+if TYPE_CHECKING:
+    from aldegonde.stats.context import TextAnalysis
+
 T = TypeVar("T")
 
+PATTERN_CHUNK = 1 << 20
+
 
 def isomorph(text: Sequence[object]) -> str:
     """Input is a piece of text as a sequence
@@ -25,6 +35,12 @@ def isomorph(text: Sequence[object]) -> str:
     Example ATTACK and EFFECT both normalize to ABBACD
     TODO: raise exception when we go beyond Z.
     """
+    if isinstance(text, EncodedText):
+        letters: dict[int, str] = {}
+        return "".join(
+            letters.setdefault(c, chr(ord("A") + len(letters)))
+            for c in text.codes.tolist()
+        )
     output: str = ""
     letter: str = "A"
     mapping: dict[str, str] = {}
@@ -36,12 +52,50 @@ def isomorph(text: Sequence[object]) -> str:
     return output
 
 
+def _encoded_isomorph_distribution(
+    text: EncodedText[object], length: int
+) -> dict[str, int]:
+    """isomorph_distribution of an encoded text, one pattern array per window.
+
+    A window's pattern holds, for every offset, the first offset in the window
+    with the same symbol; windows are isomorphs exactly when their patterns
+    are equal, so patterns are keyed as base-length integers and only the
+    distinct ones are spelled out as letters.
+    """
+    windows = np.lib.stride_tricks.sliding_window_view(text.codes, length)
+    rows = max(PATTERN_CHUNK // (length * length), 1)
+    patterns = np.concatenate(
+        [
+            np.argmax(chunk[:, :, None] == chunk[:, None, :], axis=-1).astype(
+                np.min_scalar_type(length)
+            )
+            for chunk in (windows[i : i + rows] for i in range(0, len(windows), rows))
+        ]
+    )
+    keys: np.ndarray
+    if length**length < 2**62:
+        keys = patterns.astype(np.int64) @ (length ** np.arange(length - 1, -1, -1))
+    else:
+        width = length * patterns.itemsize
+        keys = np.ascontiguousarray(patterns).view(np.dtype((np.void, width)))[:, 0]
+    _, first, counts = np.unique(keys, return_index=True, return_counts=True)
+    order = np.argsort(first)
+    distinct = patterns[first[order]].astype(np.int64)
+    # letter of each offset: the rank of its first offset among first offsets
+    ranks = np.cumsum(distinct == np.arange(length), axis=1) - 1
+    letters = ord("A") + np.take_along_axis(ranks, distinct, axis=1)
+    words = np.ascontiguousarray(letters.astype(np.uint32)).view(f"U{length}")[:, 0]
+    return dict(zip(words.tolist(), counts[order].tolist()))
+
+
 def isomorph_distribution(
     ciphertext: Sequence[object],
     length: int,
     cut: int = 0,
 ) -> dict[str, int]:
     """Return all isomorphs of a particular length from a sequence with their count."""
+    if isinstance(ciphertext, EncodedText) and len(ciphertext) >= length:
+        return _encoded_isomorph_distribution(ciphertext, length)
     return Counter([isomorph(x) for x in iterngrams(ciphertext, length=length)])
 
 
@@ -66,39 +120,88 @@ def isomorph_statistics(dist: dict[str, int]) -> tuple[int, int]:
     return (distinct, duplicate)
 
 
+def _isomorph_distincts(
+    sample: Sequence[object], lengths: list[int]
+) -> dict[int, float]:
+    """Distinct isomorphs per length."""
+    return {
+        length: float(isomorph_statistics(isomorph_distribution(sample, length))[0])
+        for length in lengths
+    }
+
+
+def _isomorph_duplicates(
+    sample: Sequence[object], lengths: list[int]
+) -> dict[int, float]:
+    """Duplicate isomorphs per length."""
+    return {
+        length: float(isomorph_statistics(isomorph_distribution(sample, length))[1])
+        for length in lengths
+    }
+
+
+def _uniform_symbols(
+    alphabetlen: int, length: int, data: Sequence[int], rng: random.Random
+) -> list[int]:
+    """Null model: `length` uniform random symbols, whatever the data."""
+    return [rng.randrange(0, alphabetlen) for _ in range(length)]
+
+
 def random_isomorph_statistics(
     sequencelength: int,
     isomorphlength: int,
     samples: int = 20,
     alphabetlen: int = 29,
     *,
+    seed: int = 0,
     trace: bool = False,
 ) -> tuple[float, float, float, float]:
-    """Return the mean and stdev of distinct isomorphs and mean and stdev of duplicate isomorphs."""
-    distincts: list[int] = []
-    duplicates: list[int] = []
-
-    for _ in range(samples):
-        rand: list[int] = [
-            random.randrange(0, alphabetlen) for _ in range(sequencelength)
-        ]
-        isos = isomorph_distribution(rand, isomorphlength)
-        (distinct, duplicate) = isomorph_statistics(isos)
-        distincts.append(distinct)
-        duplicates.append(duplicate)
+    """Return the mean and stdev of distinct isomorphs and mean and stdev of duplicate isomorphs.
 
-    meandistinct = statistics.mean(distincts)
-    stdevdistinct = statistics.stdev(distincts)
-    meanduplicate = statistics.mean(duplicates)
-    stdevduplicate = statistics.stdev(duplicates)
-    return (meandistinct, stdevdistinct, meanduplicate, stdevduplicate)
+    The random sequences are drawn by the resampling harness, sample i from
+    random.Random(seed + i), and scored in bulk by the isomorph kernels.
+    """
+    lengths = [isomorphlength]
+    null = partial(_uniform_symbols, alphabetlen, sequencelength)
+    # only the null distribution is reported, so the observed text is a stub
+    placeholder = [0]
+    distinct = monte_carlo_map(
+        with_kernel(partial(_isomorph_distincts, lengths=lengths), isomorph_distincts),
+        null,
+        placeholder,
+        keys=lengths,
+        trials=samples,
+        seed=seed,
+    )[isomorphlength]
+    duplicate = monte_carlo_map(
+        with_kernel(
+            partial(_isomorph_duplicates, lengths=lengths), isomorph_duplicates
+        ),
+        null,
+        placeholder,
+        keys=lengths,
+        trials=samples,
+        seed=seed,
+    )[isomorphlength]
+    return (
+        distinct.null_mean,
+        distinct.null_sd,
+        duplicate.null_mean,
+        duplicate.null_sd,
+    )
 
 
-def print_isomorph_statistics(seq: Sequence[object], *, trace: bool = False) -> None:
+def print_isomorph_statistics(
+    seq: Sequence[object],
+    *,
+    trace: bool = False,
+    analysis: "TextAnalysis | None" = None,
+) -> None:
     """Look for isomorphs in the sequence.
     Isomorphs are sequences that have the same number of unique characters:
     CDDE and LKKY are isomorphs, that can be generalized to the pattern ABBC
-    This function collects all isomorphs.
+    This function collects all isomorphs. Pass `analysis`, a TextAnalysis of
+    the sequence, to reuse its cached isomorph distributions.
     """
     startlength = 4
     endlength = 40
@@ -109,7 +212,11 @@ def print_isomorph_statistics(seq: Sequence[object], *, trace: bool = False) ->
         "(isomorph counts from random data); z = standard deviations from this null"
     )
     for length in range(startlength, endlength + 1):
-        isos = isomorph_distribution(seq, length)
+        isos = (
+            isomorph_distribution(seq, length)
+            if analysis is None
+            else analysis.isomorph_distribution(length)
+        )
         (distinct, duplicate) = isomorph_statistics(isos)
         (
             avgdistinct,
@@ -6,13 +6,22 @@ to detect repeated digraphs, trigraphs, etc.
 """
 
 from collections.abc import Sequence
+from functools import partial
 from math import sqrt
-from typing import TypeVar
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
 
+import numpy as np
+
+from aldegonde.stats.encoded import EncodedText
+from aldegonde.stats.kernels import _ngram_ids, kappa_counts, with_kernel
+from aldegonde.stats.ngrams import _rolling_codes, _symbol_codes
 from aldegonde.stats.nulls import NullModel
 from aldegonde.stats.resample import monte_carlo_map
 from aldegonde.stats.zscore import z_score
 
+if TYPE_CHECKING:
+    from aldegonde.stats.context import TextAnalysis
+
 T = TypeVar("T")
 
 
@@ -54,6 +63,13 @@ def doublets(
     if num_comparisons <= 0:
         return ([], 0)
 
+    if isinstance(text, EncodedText) and skip >= 0 and not trace:
+        equal = text.codes[skip:] == text.codes[: n - skip]
+        if length > 1:
+            window = _rolling_codes(equal.astype(np.int64), length, 1)
+            equal = window[:num_comparisons] == length
+        return (np.flatnonzero(equal).tolist(), num_comparisons)
+
     for index in range(num_comparisons):
         # Compare n-gram starting at index with n-gram starting at index + skip
         ngram1 = tuple(text[index : index + length])
@@ -111,6 +127,135 @@ def kappa4(text: Sequence[object], skip: int = 1, *, trace: bool = False) -> flo
     return kappa(text, skip=skip, length=4, trace=trace)
 
 
+class KappaSpectrum(NamedTuple):
+    """Coincidence counts for every skip, indexed by skip.
+
+    Attributes:
+        counts: counts[skip] is the number of doublets at that skip, the same
+            as len(doublets(text, skip, length)[0]); counts[0] is the number
+            of n-grams
+        comparisons: comparisons[skip] is the number of comparisons made
+    """
+
+    counts: np.ndarray
+    comparisons: np.ndarray
+
+    @property
+    def kappa(self) -> np.ndarray:
+        """kappa(text, skip, length) for every skip; 0.0 where nothing is compared."""
+        values: np.ndarray = np.divide(
+            self.counts,
+            self.comparisons,
+            out=np.zeros(len(self.counts)),
+            where=self.comparisons > 0,
+        )
+        return values
+
+
+FFT_ROWS = 16
+"""Symbols transformed together in one batched FFT."""
+
+
+def _lag_coincidences(codes: np.ndarray, max_skip: int) -> np.ndarray:
+    """counts[s] = #{i : codes[i] == codes[i + s]} for s in 0..max_skip.
+
+    The count is a sum over symbols of the autocorrelation of the symbol's
+    indicator sequence. Frequent symbols, where the pairs of occurrences
+    outnumber the positions, are autocorrelated by FFT; rare ones, typical
+    of long n-grams, contribute their pairwise distances directly.
+    """
+    counts: np.ndarray = _batch_lag_coincidences(np.asarray(codes)[None, :], max_skip)[
+        0
+    ]
+    return counts
+
+
+def _batch_lag_coincidences(codes: np.ndarray, max_skip: int) -> np.ndarray:
+    """_lag_coincidences of every row of a (K x M) array, shape (K, max_skip + 1).
+
+    Symbols are shared between rows, so each frequent symbol is transformed
+    for all rows in one FFT, and the rare pairs of all rows are walked
+    together.
+    """
+    rows, m = codes.shape
+    counts = np.zeros((rows, max_skip + 1), dtype=np.int64)
+    if m == 0 or rows == 0:
+        return counts
+    counts[:, 0] = m
+    if max_skip == 0:
+        return counts
+    _, inverse, occurrences = np.unique(codes, return_inverse=True, return_counts=True)
+    inverse = inverse.reshape(rows, m)
+    frequent = (occurrences.astype(np.float64) / rows) ** 2 > 8 * m
+
+    dense = np.flatnonzero(frequent)
+    if len(dense):
+        size = 1 << (2 * m - 1).bit_length()
+        power = np.zeros((rows, size // 2 + 1))
+        step = max(FFT_ROWS // rows, 1)
+        for start in range(0, len(dense), step):
+            symbols = dense[start : start + step]
+            indicator = (inverse[None, :, :] == symbols[:, None, None]).astype(
+                np.float64
+            )
+            spectrum = np.fft.rfft(indicator, n=size, axis=-1)
+            power += (spectrum.real**2 + spectrum.imag**2).sum(axis=0)
+        top = min(max_skip, m - 1)
+        autocorrelation = np.fft.irfft(power, n=size, axis=-1)[:, 1 : top + 1]
+        counts[:, 1 : top + 1] += np.rint(autocorrelation).astype(np.int64)
+
+    # positions of the rare symbols, grouped by symbol and row, ascending
+    # within a group
+    row, position = np.nonzero(~frequent[inverse])
+    if len(position):
+        groups = inverse[row, position]
+        order = np.lexsort((position, row, groups))
+        position, row, groups = position[order], row[order], groups[order]
+        width = max_skip + 1
+        for offset in range(1, len(position)):
+            distances = position[offset:] - position[:-offset]
+            same = (groups[offset:] == groups[:-offset]) & (
+                row[offset:] == row[:-offset]
+            )
+            near = same & (distances <= max_skip)
+            if not near.any():
+                # later offsets within a group only get further apart
+                break
+            cells = row[offset:][near] * width + distances[near]
+            counts += np.bincount(cells, minlength=rows * width).reshape(rows, width)
+    return counts
+
+
+def kappa_spectrum(
+    text: Sequence[object] | np.ndarray, max_skip: int | None = None, length: int = 1
+) -> KappaSpectrum:
+    """Doublet counts at every skip from 1 to max_skip in one pass.
+
+    Equivalent to calling doublets(text, skip, length) for every skip, but in
+    O(|A| N log N) rather than O(N) Python comparisons per skip: monographic
+    coincidences are summed per-symbol autocorrelations computed by FFT, and
+    n-grams are first reduced to rolling integer codes.
+
+    Args:
+        text: Sequence to analyze
+        max_skip: Largest skip; None for every skip at which a comparison
+            can be made
+        length: Size of n-gram (1=monographic, 2=digraphic, etc.)
+
+    Returns:
+        KappaSpectrum with counts and comparisons for skips 0..max_skip
+    """
+    assert length >= 1
+    grams = max(len(text) - length + 1, 0)
+    if max_skip is None:
+        max_skip = max(grams - 1, 0)
+    assert max_skip >= 0
+    codes = _ngram_ids(_symbol_codes(text)[None, :], length)[0] if grams else []
+    counts = _lag_coincidences(np.asarray(codes, dtype=np.int64), max_skip)
+    comparisons = np.maximum(grams - np.arange(max_skip + 1), 0)
+    return KappaSpectrum(counts, comparisons)
+
+
 # def doublets(
 #    inp: Iterator[T], skip: int = 1, *, trace: bool = False
 # ) -> tuple[list[int], int]:
@@ -157,6 +302,7 @@ def print_kappa(
     trials: int = 1000,
     seed: int = 0,
     trace: bool = False,
+    analysis: "TextAnalysis | None" = None,
 ) -> None:
     """Kappa test for a range of skip values, against a null hypothesis.
 
@@ -179,13 +325,17 @@ def print_kappa(
         trials: Monte Carlo surrogates when null is given
         seed: Base seed for the Monte Carlo surrogates
         trace: Print debug information (analytic null only)
+        analysis: TextAnalysis of the ciphertext whose cached kappa spectrum
+            and doublets are reused (analytic null only)
     """
     assert maximum >= 0
     assert minimum >= 1
     assert length >= 1
 
     if alphabetsize == 0:
-        alphabetsize = len(set(ciphertext))
+        alphabetsize = (
+            len(set(ciphertext)) if analysis is None else len(analysis.ngram_counts())
+        )
     if maximum == 0:
         maximum = int(len(ciphertext) / 2)
     elif maximum > len(ciphertext):
@@ -209,9 +359,15 @@ def print_kappa(
             f"(kappa = 1/{effective_alphabet} by chance, Poisson); "
             f"z = standard deviations from this null"
         )
+        top = max(skips, default=0)
+        spectrum = (
+            kappa_spectrum(ciphertext, top, length)
+            if analysis is None
+            else analysis.kappa_spectrum(top, length)
+        )
         for skip in skips:
-            dbl, num_comparisons = doublets(ciphertext, skip=skip, length=length)
-            count = len(dbl)
+            count = int(spectrum.counts[skip])
+            num_comparisons = int(spectrum.comparisons[skip])
             normalized_ioc = effective_alphabet * count / num_comparisons
             mu = num_comparisons / effective_alphabet
             z = z_score(count, mu, sqrt(mu))
@@ -220,6 +376,11 @@ def print_kappa(
                 f"expected={mu:<6.2f} z={z:+5.2f} ioc={normalized_ioc:1.3f}",
             )
             if trace and count > 0:
+                dbl = (
+                    doublets(ciphertext, skip=skip, length=length)[0]
+                    if analysis is None
+                    else analysis.doublets(skip, length)
+                )
                 for pos in dbl:
                     ngram = "".join(str(x) for x in ciphertext[pos : pos + length])
                     print(f"  pos {pos}: {ngram}")
@@ -237,6 +398,7 @@ def print_kappa(
             for skip in skips
         }
 
+    with_kernel(statistic, partial(kappa_counts, length=length))
     results = monte_carlo_map(
         statistic, null, ciphertext, keys=skips, trials=trials, seed=seed
     )
@@ -261,6 +423,7 @@ def print_kappa_statistics(
     max_length: int = 4,
     *,
     trace: bool = False,
+    analysis: "TextAnalysis | None" = None,
 ) -> None:
     """Print kappa statistics for monographic through multigraphic analysis.
 
@@ -271,6 +434,7 @@ def print_kappa_statistics(
         maximum: Maximum skip value to test
         max_length: Maximum n-gram length to analyze (1-4)
         trace: Print debug information
+        analysis: TextAnalysis of the ciphertext shared by every table
     """
     for length in range(1, max_length + 1):
         print_kappa(
@@ -280,4 +444,5 @@ def print_kappa_statistics(
             maximum=maximum,
             length=length,
             trace=trace,
+            analysis=analysis,
         )
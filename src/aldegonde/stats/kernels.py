@@ -0,0 +1,210 @@
+"""Array kernels evaluating statistics on a whole batch of surrogates.
+
+A kernel takes a (K x N) matrix of integer-encoded sequences, one surrogate
+per row, and returns the statistic for every row at once: a (K x len(keys))
+matrix for a statistic keyed by skip, cell or length. The kernels reproduce
+their pure-Python counterparts exactly; they are label invariant, so any
+encoding of the symbols as small non-negative integers gives the same result.
+
+    kappa_counts        doublets(...) count per skip       (stats.kappa)
+    kappa_values        kappa(...) per skip                (stats.kappa)
+    nioc_grid           nioc(...).nioc per (length, cut)   (stats.ioc)
+    repeat_counts       n-grams occurring more than once   (stats.repeats)
+    isomorph_distincts  distinct isomorphs per length      (stats.isomorph)
+    isomorph_duplicates duplicate isomorphs per length     (stats.isomorph)
+
+A statistic handed to the resampling harness carries its kernel as a `batch`
+attribute, attached with with_kernel(); the harness then stacks the
+surrogates of a chunk of trials into a matrix and evaluates them in one call.
+Scalar statistics take batch(matrix); keyed statistics take
+batch(matrix, keys) and return one column per key.
+"""
+
+from collections.abc import Callable, Sequence
+from typing import TypeVar
+
+import numpy as np
+
+from aldegonde.stats.ngrams import _rolling_codes
+
+F = TypeVar("F", bound=Callable[..., object])
+
+Kernel = Callable[..., np.ndarray]
+"""A batched statistic: batch(matrix) or batch(matrix, keys)."""
+
+PATTERN_CHUNK = 1 << 24
+"""Window-offset comparisons made at once by the isomorph kernels."""
+
+
+def with_kernel(statistic: F, kernel: Kernel) -> F:
+    """Attach an array kernel to a statistic for the resampling harness.
+
+    Args:
+        statistic: A scalar or keyed statistic (function or functools.partial)
+        kernel: Its batched counterpart
+
+    Returns:
+        The same statistic, now carrying `kernel` as its `batch` attribute
+    """
+    statistic.batch = kernel  # type: ignore[attr-defined]
+    return statistic
+
+
+def kernel_of(statistic: object) -> Kernel | None:
+    """The array kernel attached to a statistic, if any."""
+    kernel = getattr(statistic, "batch", None)
+    return kernel if callable(kernel) else None
+
+
+def _ngram_ids(batch: np.ndarray, length: int, cut: int = 0) -> np.ndarray:
+    """An integer id per n-gram, equal ids for equal n-grams, shape (K, M).
+
+    Sliding n-grams for cut=0, non-overlapping ones starting at cut - 1 for
+    cut > 0, as in ngrams.iterngram_positions. Ids are base-|A| codes while
+    they fit in an int64, and ids from a row-wise unique otherwise.
+    """
+    base = int(batch.max()) + 1 if batch.size else 1
+    if base**length < 2**62:
+        codes = _rolling_codes(batch.astype(np.int64), length, base)
+    else:
+        windows = np.lib.stride_tricks.sliding_window_view(batch, length, axis=1)
+        flat = windows.reshape(-1, length)
+        _, inverse = np.unique(flat, axis=0, return_inverse=True)
+        codes = inverse.reshape(windows.shape[:2])
+    if cut > 0:
+        codes = codes[:, cut - 1 :: length]
+    return codes
+
+
+def _runs(ids: np.ndarray) -> np.ndarray:
+    """For each element of the row-sorted ids, its offset within its run."""
+    ordered = np.sort(ids, axis=1)
+    index = np.broadcast_to(np.arange(ordered.shape[1]), ordered.shape)
+    new_run = np.ones(ordered.shape, dtype=bool)
+    new_run[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    start = np.maximum.accumulate(np.where(new_run, index, 0), axis=1)
+    offsets: np.ndarray = index - start
+    return offsets
+
+
+def kappa_counts(
+    batch: np.ndarray, skips: Sequence[int], length: int = 1
+) -> np.ndarray:
+    """Number of n-grams equal to the n-gram `skip` positions on, per skip.
+
+    The batched form of len(doublets(text, skip, length)[0]).
+    """
+    rows, n = batch.shape
+    out = np.zeros((rows, len(skips)))
+    for j, skip in enumerate(skips):
+        comparisons = n - skip - length + 1
+        if skip < 1 or comparisons <= 0:
+            continue
+        equal = (batch[:, skip:] == batch[:, :-skip]).astype(np.int64)
+        if length == 1:
+            out[:, j] = equal.sum(axis=1)
+        else:
+            window = _rolling_codes(equal, length, 1)
+            out[:, j] = (window[:, :comparisons] == length).sum(axis=1)
+    return out
+
+
+def kappa_values(
+    batch: np.ndarray, skips: Sequence[int], length: int = 1
+) -> np.ndarray:
+    """kappa(text, skip, length) per skip: doublets over comparisons made."""
+    comparisons = np.array([batch.shape[1] - skip - length + 1 for skip in skips])
+    counts = kappa_counts(batch, skips, length)
+    values: np.ndarray = np.divide(
+        counts,
+        comparisons,
+        out=np.zeros_like(counts),
+        where=comparisons > 0,
+    )
+    return values
+
+
+def nioc_grid(
+    batch: np.ndarray,
+    keys: Sequence[int],
+    cells: Sequence[tuple[int, int]],
+    alphabetsize: int,
+) -> np.ndarray:
+    """nioc(text, alphabetsize, length, cut).nioc for the cells indexed by keys."""
+    out = np.zeros((batch.shape[0], len(keys)))
+    for j, key in enumerate(keys):
+        length, cut = cells[key]
+        ids = _ngram_ids(batch, length, cut)
+        total = ids.shape[1]
+        if total < 2:
+            continue
+        freqsum = 2 * _runs(ids).sum(axis=1)
+        out[:, j] = pow(alphabetsize, length) * (freqsum / (total * (total - 1)))
+    return out
+
+
+def repeat_counts(
+    batch: np.ndarray, lengths: Sequence[int], cut: int = 0
+) -> np.ndarray:
+    """Number of distinct n-grams occurring more than once, per length."""
+    out = np.zeros((batch.shape[0], len(lengths)))
+    for j, length in enumerate(lengths):
+        if batch.shape[1] < length:
+            continue
+        out[:, j] = (_runs(_ngram_ids(batch, length, cut)) == 1).sum(axis=1)
+    return out
+
+
+def _isomorph_runs(batch: np.ndarray, length: int) -> np.ndarray:
+    """_runs() of the isomorphs of every sliding window, shape (K, N - length + 1).
+
+    A window's isomorph is encoded as, for every offset, the first offset in
+    the window holding the same symbol, which is the pattern isomorph() spells
+    with letters; patterns are compared as base-length integers while they fit
+    in an int64, and as raw bytes otherwise.
+    """
+    windows = np.lib.stride_tricks.sliding_window_view(batch, length, axis=1)
+    step = max(PATTERN_CHUNK // (windows.shape[1] * length * length), 1)
+    pattern = np.concatenate(
+        [
+            np.argmax(chunk[..., :, None] == chunk[..., None, :], axis=-1)
+            for chunk in (windows[i : i + step] for i in range(0, len(windows), step))
+        ]
+    )
+    ids: np.ndarray
+    if length**length < 2**62:
+        ids = pattern @ (length ** np.arange(length - 1, -1, -1))
+    else:
+        flat = np.ascontiguousarray(pattern.astype(np.min_scalar_type(length)))
+        ids = flat.view(np.dtype((np.void, length * flat.itemsize)))[..., 0]
+        ids = np.unique(ids, return_inverse=True)[1].reshape(pattern.shape[:2])
+    return _runs(ids)
+
+
+def isomorph_distincts(batch: np.ndarray, lengths: Sequence[int]) -> np.ndarray:
+    """Distinct isomorphs of the sliding windows, per length.
+
+    The batched form of isomorph_statistics(isomorph_distribution(text, L))[0].
+    """
+    rows, n = batch.shape
+    out = np.zeros((rows, len(lengths)))
+    for j, length in enumerate(lengths):
+        if n < length:
+            continue
+        out[:, j] = (_isomorph_runs(batch, length) == 0).sum(axis=1)
+    return out
+
+
+def isomorph_duplicates(batch: np.ndarray, lengths: Sequence[int]) -> np.ndarray:
+    """Sliding windows whose isomorph occurs more than once, per length.
+
+    The batched form of isomorph_statistics(isomorph_distribution(text, L))[1].
+    """
+    rows, n = batch.shape
+    out = np.zeros((rows, len(lengths)))
+    for j, length in enumerate(lengths):
+        if n < length:
+            continue
+        offsets = _isomorph_runs(batch, length)
+        out[:, j] = (offsets >= 1).sum(axis=1) + (offsets == 1).sum(axis=1)
+    return out
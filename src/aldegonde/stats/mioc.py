@@ -2,7 +2,10 @@ from collections.abc import Sequence
 from math import sqrt
 from typing import NamedTuple
 
-from aldegonde.stats.ngrams import ngram_distribution
+import numpy as np
+
+from aldegonde.stats.encoded import EncodedText
+from aldegonde.stats.ngrams import _encoded_ngram_ids, ngram_distribution
 from aldegonde.stats.zscore import z_score
 
 # --- Mutual Index of Coincidence (MIOC) Implementation ---
@@ -16,6 +19,24 @@ class MiocTuple(NamedTuple):
     z_score: float
 
 
+def _encoded_mioc(
+    text1: EncodedText[object], text2: EncodedText[object], length: int, cut: int
+) -> float:
+    """MIOC of two texts encoded over the same alphabet."""
+    ids1, counts1 = np.unique(
+        _encoded_ngram_ids(text1, length, cut)[1], return_counts=True
+    )
+    ids2, counts2 = np.unique(
+        _encoded_ngram_ids(text2, length, cut)[1], return_counts=True
+    )
+    L1, L2 = int(counts1.sum()), int(counts2.sum())
+    if L1 < 2 or L2 < 2:
+        return 0.0
+    _, in1, in2 = np.intersect1d(ids1, ids2, assume_unique=True, return_indices=True)
+    sum_prod = int((counts1[in1].astype(np.int64) * counts2[in2]).sum())
+    return sum_prod / (L1 * L2)
+
+
 def mioc(
     text1: Sequence[object],
     text2: Sequence[object],
@@ -35,6 +56,13 @@ def mioc(
     Returns:
         The Mutual Index of Coincidence as a float.
     """
+    if (
+        isinstance(text1, EncodedText)
+        and isinstance(text2, EncodedText)
+        and text1.alphabet == text2.alphabet
+    ):
+        return _encoded_mioc(text1, text2, length, cut)
+
     freqs1: dict[str, int] = ngram_distribution(text1, length=length, cut=cut)
     freqs2: dict[str, int] = ngram_distribution(text2, length=length, cut=cut)
 
@@ -4,8 +4,16 @@ from collections import Counter, defaultdict
 from collections.abc import Generator, Sequence
 from typing import TypeVar
 
+import numpy as np
+
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.stats.encoded import Alphabet, EncodedText
+
 T = TypeVar("T")
 
+DENSE_NGRAM_LIMIT = 1 << 24
+"""Largest |A| ** length for which ngram_counts returns a dense histogram."""
+
 
 def iterngram_positions(
     runes: Sequence[T],
@@ -108,6 +116,14 @@ def ngram_distribution(
     cut: int = 0,
 ) -> dict[str, int]:
     """Return ngrams by count."""
+    if isinstance(text, EncodedText):
+        starts, ids = _encoded_ngram_ids(text, length, cut)
+        _, first, counts = np.unique(ids, return_index=True, return_counts=True)
+        order = np.argsort(first)
+        return {
+            str(text[p : p + length]): c
+            for p, c in zip(starts[first[order]].tolist(), counts[order].tolist())
+        }
     return Counter([str(g) for g in iterngrams(text, length=length, cut=cut)])
 
 
@@ -118,6 +134,150 @@ def ngram_positions(
 ) -> dict[str, list[int]]:
     """Return each ngram and its starting locations in the source text."""
     out: dict[str, list[int]] = defaultdict(list)
+    if isinstance(text, EncodedText):
+        starts, ids = _encoded_ngram_ids(text, length, cut)
+        _, first, inverse = np.unique(ids, return_index=True, return_inverse=True)
+        grouped = starts[np.argsort(inverse, kind="stable")]
+        groups = np.split(grouped, np.cumsum(np.bincount(inverse))[:-1])
+        for g in np.argsort(first).tolist():
+            positions = groups[g].tolist()
+            out[str(text[positions[0] : positions[0] + length])] = positions
+        return out
     for i, e in iterngram_positions(text, length=length, cut=cut):
         out[str(e)].append(i)
     return out
+
+
+def _rolling_codes(encoded: np.ndarray, length: int, base: int) -> np.ndarray:
+    """Base-`base` code of every sliding n-gram along the last axis.
+
+    Works on a single integer-encoded text or on a (K x N) batch; the code of
+    the n-gram starting at i is sum(encoded[i + k] * base ** (length - 1 - k)).
+    """
+    count = max(encoded.shape[-1] - length + 1, 0)
+    codes = np.zeros((*encoded.shape[:-1], count), dtype=np.int64)
+    for k in range(length):
+        codes = codes * base + encoded[..., k : k + count]
+    return codes
+
+
+def _symbol_codes(text: Sequence[object] | np.ndarray) -> np.ndarray:
+    """Number the symbols of a text in order of first appearance.
+
+    An EncodedText keeps its own symbol indices.
+    """
+    if isinstance(text, EncodedText):
+        return text.codes.astype(np.int64)
+    if isinstance(text, np.ndarray) and text.dtype.kind in "iu":
+        values, first, inverse = np.unique(text, return_index=True, return_inverse=True)
+        rank = np.empty(len(values), dtype=np.int64)
+        rank[np.argsort(first)] = np.arange(len(values))
+        codes: np.ndarray = rank[inverse.reshape(-1)]
+        return codes
+    index: dict[object, int] = {}
+    return np.fromiter(
+        (index.setdefault(symbol, len(index)) for symbol in text),
+        dtype=np.int64,
+        count=len(text),
+    )
+
+
+def _ngram_starts(size: int, length: int, cut: int = 0) -> np.ndarray:
+    """The n-gram start positions of iterngram_positions."""
+    last = max(size - length + 1, 0)
+    if cut == 0:
+        return np.arange(last)
+    if 0 < cut <= length:
+        return np.arange(cut - 1, last, length)
+    return np.zeros(0, dtype=np.int64)
+
+
+def _encoded_ngram_ids(
+    text: EncodedText[T], length: int, cut: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """Start positions and ids of the n-grams of an encoded text.
+
+    Ids are the ngram_codes while they fit in an int64, and otherwise the
+    n-gram bytes as a void scalar; either way equal n-grams over the same
+    alphabet get equal ids, also across texts.
+    """
+    starts = _ngram_starts(len(text), length, cut)
+    if text.alphabet.size**length <= 2**63:
+        return starts, ngram_codes(text, length, cut)
+    windows = np.lib.stride_tricks.sliding_window_view(text.codes, length)[starts]
+    width = length * text.codes.itemsize
+    ids = np.ascontiguousarray(windows).view(np.dtype((np.void, width)))[:, 0]
+    return starts, ids
+
+
+def _encoded_ngram_counts(
+    text: EncodedText[T], length: int, cut: int = 0
+) -> np.ndarray:
+    """Occurrence count of each distinct n-gram of an encoded text."""
+    _, ids = _encoded_ngram_ids(text, length, cut)
+    counts: np.ndarray = np.unique(ids, return_counts=True)[1]
+    return counts
+
+
+def ngram_codes(text: EncodedText[T], length: int, cut: int = 0) -> np.ndarray:
+    """Integer code of every n-gram of an encoded text, in text order.
+
+    The code of the n-gram starting at i is the base-|A| number
+    sum(codes[i + k] * |A| ** (length - 1 - k)), built with one array pass
+    per symbol of the n-gram instead of one slice per n-gram. Equal n-grams
+    over the same alphabet get equal codes, also across texts, and codes
+    sort n-grams by their symbol indices.
+
+    Args:
+        text: Encoded text
+        length: Size of n-gram
+        cut: 0 for sliding n-grams, else non-overlapping ones starting at
+            cut - 1, as in iterngram_positions
+
+    Returns:
+        int64 array of codes, one per n-gram
+
+    Raises:
+        InvalidInputError: If length is not positive or |A| ** length does
+            not fit in an int64
+    """
+    base = text.alphabet.size
+    if length < 1 or base**length > 2**63:
+        msg = f"{length}-grams over {base} symbols do not fit in int64 codes"
+        raise InvalidInputError(msg, input_value=length)
+    starts = _ngram_starts(len(text), length, cut)
+    codes: np.ndarray = _rolling_codes(text.codes.astype(np.int64), length, base)
+    return codes if cut == 0 else codes[starts]
+
+
+def ngram_counts(text: EncodedText[T], length: int = 1, cut: int = 0) -> np.ndarray:
+    """Count of every possible n-gram, indexed by its ngram_codes code.
+
+    A dense np.bincount histogram of |A| ** length entries, for short n-grams
+    where every cell fits in memory; see ngram_code_distribution otherwise.
+
+    Raises:
+        InvalidInputError: If |A| ** length exceeds DENSE_NGRAM_LIMIT
+    """
+    cells = text.alphabet.size**length
+    if cells > DENSE_NGRAM_LIMIT:
+        msg = f"{cells} possible {length}-grams exceed {DENSE_NGRAM_LIMIT} cells"
+        raise InvalidInputError(msg, input_value=length)
+    return np.bincount(ngram_codes(text, length, cut), minlength=cells)
+
+
+def ngram_code_distribution(
+    text: EncodedText[T], length: int = 1, cut: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """Distinct n-gram codes in ascending order with their counts (np.unique)."""
+    codes, counts = np.unique(ngram_codes(text, length, cut), return_counts=True)
+    return codes, counts
+
+
+def decode_ngram(code: int, length: int, alphabet: Alphabet[T]) -> list[T]:
+    """The n-gram of a given ngram_codes code."""
+    indices: list[int] = []
+    for _ in range(length):
+        code, index = divmod(code, alphabet.size)
+        indices.append(index)
+    return alphabet.decode(reversed(indices))
@@ -0,0 +1,207 @@
+"""Dense n-gram log-probability tables for fast text scoring.
+
+An n-gram frequency map is compiled once into a flat array of log10
+probabilities indexed by the base-|alphabet| code of the n-gram, 26**4 floats
+for English quadgrams. A text is integer-encoded over the table's alphabet and
+scored by computing all its n-gram codes with a rolling sum and summing one
+gather from the table, so there is no per-n-gram string or dict lookup. A
+(K x N) batch of encoded texts is scored the same way in one pass.
+
+N-grams that are absent from the frequency map, or that contain a symbol
+outside the alphabet, score the floor value log10(0.01 / total).
+
+A compiled table can be saved as a .npy file with a small JSON sidecar and
+loaded back memory-mapped, so processes scoring against the same language
+model share its pages instead of each parsing the frequency file; see
+compare.load_scorer for the on-disk cache of the packaged models.
+"""
+
+import json
+import os
+from collections.abc import Sequence
+from math import log10
+from pathlib import Path
+
+import numpy as np
+
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.stats.ngrams import _rolling_codes
+
+
+def _table_files(path: Path) -> tuple[Path, Path]:
+    """The .npy table and .json sidecar of a saved scorer.
+
+    The extensions are appended rather than substituted, as cache names
+    contain dots.
+    """
+    return path.with_name(path.name + ".npy"), path.with_name(path.name + ".json")
+
+
+class DenseNgramScorer:
+    """Score texts against a dense n-gram log-probability table.
+
+    Example:
+    -------
+        >>> fitness = DenseNgramScorer(english.quadgrams)
+        >>> fitness("THEM")
+        -2.9345243271212107
+        >>> fitness.score_batch(fitness.encode_batch(["THEM", "QXZJ"]))
+        array([ -2.93452433, -11.62573706])
+
+    Attributes:
+        alphabet: The symbols of the table, in index order
+        index: Symbol to index map
+        length: The n-gram size
+        floor: Log probability of unseen n-grams
+        table: Log10 probability per n-gram code, shape (len(alphabet) ** length,)
+    """
+
+    alphabet: list[str]
+    index: dict[str, int]
+    length: int
+    floor: float
+    table: np.ndarray
+
+    def __init__(
+        self,
+        frequency_map: dict[str, int],
+        alphabet: Sequence[str] | None = None,
+    ) -> None:
+        if not frequency_map:
+            msg = "frequency map must not be empty"
+            raise InvalidInputError(msg)
+        self.length = len(next(iter(frequency_map)))
+        if alphabet is None:
+            alphabet = sorted({symbol for gram in frequency_map for symbol in gram})
+        self.alphabet = list(alphabet)
+        self.index = {symbol: i for i, symbol in enumerate(self.alphabet)}
+
+        total = sum(frequency_map.values())
+        # 0.01 is a magic number. Needs to be better than that.
+        self.floor = log10(0.01 / total)
+        self.table = np.full(len(self.alphabet) ** self.length, self.floor)
+        for gram, count in frequency_map.items():
+            if len(gram) != self.length:
+                msg = f"n-gram '{gram}' does not have length {self.length}"
+                raise InvalidInputError(msg, input_value=gram)
+            self.table[self.code(gram)] = log10(count / total)
+
+    @classmethod
+    def from_counts(
+        cls,
+        codes: np.ndarray,
+        counts: np.ndarray,
+        alphabet: Sequence[str],
+        length: int,
+    ) -> "DenseNgramScorer":
+        """Build the table from n-gram codes over an alphabet and their counts.
+
+        Equivalent to the constructor on the decoded frequency map, without
+        materializing it; codes are base-len(alphabet) as in code().
+
+        Raises:
+            InvalidInputError: If there are no counts or a code is out of range
+        """
+        total = int(np.sum(counts))
+        if total <= 0:
+            msg = "counts must not be empty"
+            raise InvalidInputError(msg)
+        codes = np.asarray(codes, dtype=np.int64)
+        size = len(alphabet) ** length
+        if len(codes) and (codes.min() < 0 or codes.max() >= size):
+            msg = f"n-gram codes must lie in 0..{size - 1}"
+            raise InvalidInputError(msg, input_value=length)
+        scorer = cls.__new__(cls)
+        scorer.alphabet = list(alphabet)
+        scorer.index = {symbol: i for i, symbol in enumerate(scorer.alphabet)}
+        scorer.length = length
+        scorer.floor = log10(0.01 / total)
+        scorer.table = np.full(size, scorer.floor)
+        scorer.table[codes] = np.log10(np.asarray(counts, dtype=np.float64) / total)
+        return scorer
+
+    def save(self, path: Path) -> None:
+        """Write the table to <path>.npy and its metadata to <path>.json.
+
+        Both files are written under temporary names and renamed into place,
+        so concurrent writers and readers never see a partial file.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {"alphabet": self.alphabet, "length": self.length, "floor": self.floor}
+        suffix = f".{os.getpid()}.tmp"
+        table, sidecar = _table_files(path)
+        with open(str(table) + suffix, "wb") as f:
+            np.save(f, self.table)
+        Path(str(sidecar) + suffix).write_text(json.dumps(meta))
+        os.replace(str(table) + suffix, table)
+        os.replace(str(sidecar) + suffix, sidecar)
+
+    @classmethod
+    def load(cls, path: Path, *, mmap: bool = True) -> "DenseNgramScorer":
+        """Read a table written by save(), memory-mapped read-only by default.
+
+        Raises:
+            OSError: If either file is missing or unreadable
+            ValueError: If the files do not describe a consistent table
+        """
+        table_file, sidecar = _table_files(path)
+        meta = json.loads(sidecar.read_text())
+        table = np.load(table_file, mmap_mode="r" if mmap else None)
+        scorer = cls.__new__(cls)
+        scorer.alphabet = list(meta["alphabet"])
+        scorer.index = {symbol: i for i, symbol in enumerate(scorer.alphabet)}
+        scorer.length = int(meta["length"])
+        scorer.floor = float(meta["floor"])
+        scorer.table = table
+        if table.shape != (len(scorer.alphabet) ** scorer.length,):
+            msg = f"table {path} does not match its metadata"
+            raise ValueError(msg)
+        return scorer
+
+    def code(self, gram: Sequence[str]) -> int:
+        """Table code of a single n-gram."""
+        value = 0
+        for symbol in gram:
+            value = value * len(self.alphabet) + self.index[symbol]
+        return value
+
+    def encode(self, text: Sequence[str]) -> np.ndarray:
+        """Integer-encode a text over the table alphabet, -1 for other symbols."""
+        return np.fromiter((self.index.get(e, -1) for e in text), dtype=np.intp)
+
+    def encode_batch(self, texts: Sequence[Sequence[str]]) -> np.ndarray:
+        """Integer-encode equal-length texts into a (K x N) matrix."""
+        return np.array([self.encode(text) for text in texts], dtype=np.intp)
+
+    def ngram_scores(self, encoded: np.ndarray) -> np.ndarray:
+        """Log probability of every sliding n-gram of one or more encoded texts.
+
+        Args:
+            encoded: Symbol indices, shape (N,) or (K, N); -1 marks symbols
+                outside the alphabet
+
+        Returns:
+            Per-n-gram log probabilities, shape (N - length + 1,) or
+            (K, N - length + 1)
+        """
+        unknown = encoded < 0
+        codes = _rolling_codes(
+            np.where(unknown, 0, encoded), self.length, len(self.alphabet)
+        )
+        scores: np.ndarray = self.table[codes]
+        if unknown.any():
+            hit = _rolling_codes(unknown.astype(np.int64), self.length, 2) > 0
+            scores[hit] = self.floor
+        return scores
+
+    def score(self, encoded: np.ndarray) -> float:
+        """Total log probability of one integer-encoded text."""
+        return float(self.ngram_scores(encoded).sum())
+
+    def score_batch(self, encoded: np.ndarray) -> np.ndarray:
+        """Total log probability of every row of a (K x N) encoded batch."""
+        scores: np.ndarray = self.ngram_scores(np.atleast_2d(encoded)).sum(axis=-1)
+        return scores
+
+    def __call__(self, text: Sequence[str]) -> float:
+        return self.score(self.encode(text))
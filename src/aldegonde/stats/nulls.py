@@ -17,6 +17,16 @@ The nulls implemented here both preserve the exact multiset of symbols:
 
 Randomness is injected as a random.Random so a seeded run is reproducible and
 trials are independent; the resampler is a pure function of (data, rng).
+
+Matrix nulls are the array-native counterparts for integer-encoded texts:
+given the encoded observed sequence, a trial count and a numpy Generator they
+return a (trials x N) matrix with one surrogate per row, for statistics that
+evaluate a whole batch of surrogates at once:
+
+    shuffle_matrix            row-wise permutations, via argsort of random keys
+    no_doublet_shuffle_matrix no_doublet_shuffle, all rows filled together
+    doublet_shuffle_matrix    doublet_shuffle, all rows filled together
+    stacked                   any null model above, one row per surrogate
 """
 
 from __future__ import annotations
@@ -24,8 +34,11 @@ from __future__ import annotations
 import random
 from collections import Counter
 from collections.abc import Callable, Sequence
+from functools import partial
 from typing import TypeVar
 
+import numpy as np
+
 from aldegonde.exceptions import InvalidInputError
 
 T = TypeVar("T")
@@ -33,6 +46,9 @@ T = TypeVar("T")
 NullModel = Callable[[Sequence[T], random.Random], Sequence[T]]
 """A resampler: (observed sequence, random source) -> surrogate sequence."""
 
+MatrixNullModel = Callable[[np.ndarray, int, np.random.Generator], np.ndarray]
+"""A batched resampler: (encoded sequence, trials, generator) -> (trials x N)."""
+
 
 def shuffle(data: Sequence[T], rng: random.Random) -> list[T]:
     """Return a uniform random permutation of the observed sequence.
@@ -92,14 +108,16 @@ def doublet_shuffle(rate: float) -> NullModel[T]:
         A null model whose surrogates approximate the target doublet rate
     """
 
-    def model(data: Sequence[T], rng: random.Random) -> list[T]:
-        counts = Counter(data)
-        n = len(data)
-        chance = sum((count / n) ** 2 for count in counts.values()) if n else 0.0
-        factor = rate / chance if chance > 0 else 0.0
-        return _doublet_fill(data, rng, factor)
+    return partial(_rate_matched_fill, rate)
+
 
-    return model
+def _rate_matched_fill(rate: float, data: Sequence[T], rng: random.Random) -> list[T]:
+    """doublet_shuffle's model, kept at module level so it pickles."""
+    counts = Counter(data)
+    n = len(data)
+    chance = sum((count / n) ** 2 for count in counts.values()) if n else 0.0
+    factor = rate / chance if chance > 0 else 0.0
+    return _doublet_fill(data, rng, factor)
 
 
 def _doublet_fill(data: Sequence[T], rng: random.Random, factor: float) -> list[T]:
@@ -151,3 +169,148 @@ def _weighted_choice(items: list[T], weights: Sequence[float], rng: random.Rando
         if target < cumulative:
             return item
     return items[-1]
+
+
+def shuffle_matrix(
+    data: np.ndarray, trials: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Return `trials` uniform random permutations of an encoded sequence.
+
+    The array counterpart of shuffle: each row is `data` permuted by the
+    argsort of a row of independent uniform keys, so all rows are drawn in
+    one vectorized pass.
+
+    Args:
+        data: Observed integer-encoded sequence, shape (N,)
+        trials: Number of surrogates
+        rng: Injected numpy random generator
+
+    Returns:
+        Surrogates, shape (trials, N)
+    """
+    data = np.asarray(data)
+    order = np.argsort(rng.random((trials, len(data))), axis=1)
+    surrogates: np.ndarray = data[order]
+    return surrogates
+
+
+def stacked(null_model: NullModel[int]) -> MatrixNullModel:
+    """Adapt a per-surrogate null model into a matrix null model.
+
+    Each row is drawn by `null_model` from its own random.Random, seeded from
+    the generator, so any null above can feed a batched statistic. This costs
+    as much as calling the null model per trial; it only saves the statistic.
+
+    Args:
+        null_model: A null model over integer sequences
+
+    Returns:
+        A matrix null model stacking one surrogate per row
+    """
+    return partial(_stacked_rows, null_model)
+
+
+def _stacked_rows(
+    null_model: NullModel[int],
+    data: np.ndarray,
+    trials: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """stacked's model, kept at module level so it pickles."""
+    observed = np.asarray(data).tolist()
+    seeds = rng.integers(0, 2**63, size=trials)
+    rows = [null_model(observed, random.Random(int(seed))) for seed in seeds]
+    return np.array(rows, dtype=np.asarray(data).dtype).reshape(trials, len(observed))
+
+
+def no_doublet_shuffle_matrix(
+    data: np.ndarray, trials: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Return `trials` doublet-free arrangements of an encoded sequence.
+
+    The array counterpart of no_doublet_shuffle, drawn from the same law.
+
+    Raises:
+        InvalidInputError: If no doublet-free arrangement exists
+    """
+    return _doublet_fill_matrix(data, trials, rng, 0.0)
+
+
+def doublet_shuffle_matrix(rate: float) -> MatrixNullModel:
+    """Build the array counterpart of doublet_shuffle(rate).
+
+    Args:
+        rate: Target fraction of adjacent positions holding equal symbols
+
+    Returns:
+        A matrix null model drawing rows from the same law as doublet_shuffle
+    """
+    return partial(_rate_matched_fill_matrix, rate)
+
+
+def _rate_matched_fill_matrix(
+    rate: float, data: np.ndarray, trials: int, rng: np.random.Generator
+) -> np.ndarray:
+    """doublet_shuffle_matrix's model, kept at module level so it pickles."""
+    data = np.asarray(data)
+    n = len(data)
+    _, counts = np.unique(data, return_counts=True)
+    chance = float(((counts / n) ** 2).sum()) if n else 0.0
+    factor = rate / chance if chance > 0 else 0.0
+    return _doublet_fill_matrix(data, trials, rng, factor)
+
+
+def _doublet_fill_matrix(
+    data: np.ndarray, trials: int, rng: np.random.Generator, factor: float
+) -> np.ndarray:
+    """_doublet_fill for `trials` rows at once, over per-row count vectors.
+
+    Every row follows the sequential law of _doublet_fill: at each slot a
+    symbol whose remaining count exceeds half the remaining slots is forced
+    (the first in order of first appearance, as dict order does there),
+    otherwise a symbol is drawn with weight equal to its remaining count,
+    times factor for the previous symbol. The loop runs over the N slots and
+    each step is one vectorized draw across all rows, so the cost per
+    surrogate falls with the batch size instead of paying a Python loop over
+    the alphabet per symbol.
+    """
+    data = np.asarray(data)
+    n = len(data)
+    symbols, first, codes = np.unique(data, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    alphabet = symbols[order]
+    initial = np.bincount(rank[codes], minlength=len(alphabet))
+    if factor == 0.0 and n and initial.max() > (n + 1) // 2:
+        msg = "no doublet-free arrangement exists: a symbol exceeds ceil(n/2)"
+        raise InvalidInputError(msg)
+
+    largest = int(initial.max()) if n else 0
+    rows = np.arange(trials)
+    remaining = np.tile(initial, (trials, 1))
+    out = np.empty((trials, n), dtype=np.intp)
+    previous = np.zeros(trials, dtype=np.intp)
+    for position, slots in enumerate(range(n, 0, -1)):
+        weights = remaining.astype(np.float64)
+        if position > 0:
+            weights[rows, previous] *= factor
+        cumulative = weights.cumsum(axis=1)
+        target = rng.random(trials) * cumulative[:, -1]
+        above = cumulative > target[:, None]
+        chosen = np.argmax(above, axis=1)
+        missed = ~above[rows, chosen]
+        if missed.any():
+            # target rounded up to the total: take the last positive weight
+            last = len(alphabet) - 1 - np.argmax(weights[:, ::-1] > 0, axis=1)
+            chosen = np.where(missed, last, chosen)
+        # remaining counts never exceed the initial ones, so no symbol can be
+        # forced while the largest initial count fits in half the slots
+        if largest > slots // 2:
+            forced = remaining > slots // 2
+            chosen = np.where(forced.any(axis=1), np.argmax(forced, axis=1), chosen)
+        out[:, position] = chosen
+        remaining[rows, chosen] -= 1
+        previous = chosen
+    surrogates: np.ndarray = alphabet[out]
+    return surrogates
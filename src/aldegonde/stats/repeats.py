@@ -1,20 +1,34 @@
 import math
 from collections import Counter
 from collections.abc import Sequence
-from typing import TypeVar
+from functools import partial
+from typing import TYPE_CHECKING, TypeVar
 
+import numpy as np
 from scipy.stats import poisson
 
-from aldegonde.stats.ngrams import iterngrams, ngram_distribution, ngram_positions
+from aldegonde.stats.encoded import EncodedText
+from aldegonde.stats.kernels import repeat_counts, with_kernel
+from aldegonde.stats.ngrams import (
+    _encoded_ngram_counts,
+    iterngrams,
+    ngram_distribution,
+)
 from aldegonde.stats.nulls import NullModel
 from aldegonde.stats.resample import monte_carlo_map
+from aldegonde.stats.suffix import RepeatIndex
 from aldegonde.stats.zscore import z_score
 
+if TYPE_CHECKING:
+    from aldegonde.stats.context import TextAnalysis
+
 T = TypeVar("T")
 
 
 def _repeat_count(text: Sequence[object], length: int, cut: int) -> int:
     """Number of distinct n-grams of a given length that occur more than once."""
+    if isinstance(text, EncodedText):
+        return int(np.count_nonzero(_encoded_ngram_counts(text, length, cut) > 1))
     counts = Counter(str(gram) for gram in iterngrams(text, length=length, cut=cut))
     return sum(1 for occurrences in counts.values() if occurrences > 1)
 
@@ -31,6 +45,7 @@ def print_repeat_statistics(
     trials: int = 1000,
     seed: int = 0,
     trace: bool = False,
+    analysis: "TextAnalysis | None" = None,
 ) -> None:
     """Count repeated n-grams per length with z-scores against a null hypothesis.
 
@@ -38,7 +53,8 @@ def print_repeat_statistics(
     standard score. Pass `null` (a resampler) to compare instead against a Monte
     Carlo null, for example one that preserves frequencies and the doublet rate;
     z and the expected count are then taken from that null's distribution, in the
-    same format, and `null_label` names it in the header.
+    same format, and `null_label` names it in the header. Pass `analysis`, a
+    TextAnalysis of the ciphertext, to reuse its suffix array (analytic null).
     """
     lengths = list(range(minimum, maximum + 1))
     if null is None:
@@ -46,8 +62,9 @@ def print_repeat_statistics(
             f"null hypothesis: uniform random text over {alphabetsize} symbols "
             f"(Poisson repeat counts); z = standard deviations from this null"
         )
+        index = RepeatIndex(ciphertext) if analysis is None else analysis.repeat_index()
         for length in lengths:
-            num = _repeat_count(ciphertext, length, cut)
+            num = index.repeat_count(length, cut)
             mu: float = len(ciphertext) / pow(alphabetsize, length)
             expected = pow(alphabetsize, length) * poisson.sf(k=1, mu=mu, loc=0)
             var = poisson.stats(mu, loc=0, moments="v") * pow(alphabetsize, length)
@@ -64,8 +81,10 @@ def print_repeat_statistics(
     )
 
     def statistic(sample: Sequence[object]) -> dict[int, float]:
-        return {length: float(_repeat_count(sample, length, cut)) for length in lengths}
+        index = RepeatIndex(sample)
+        return {length: float(index.repeat_count(length, cut)) for length in lengths}
 
+    with_kernel(statistic, partial(repeat_counts, cut=cut))
     results = monte_carlo_map(
         statistic, null, ciphertext, keys=lengths, trials=trials, seed=seed
     )
@@ -96,10 +115,16 @@ def print_repeat_positions(
     ciphertext: Sequence[object],
     minimum: int = 2,
     maximum: int = 10,
+    *,
+    analysis: "TextAnalysis | None" = None,
 ) -> None:
-    """Print repeating sequences in the list, up to `maximum`. Max defaults to 10."""
+    """Print repeating sequences in the list, up to `maximum`. Max defaults to 10.
+
+    Pass `analysis`, a TextAnalysis of the ciphertext, to reuse its suffix array.
+    """
+    index = RepeatIndex(ciphertext) if analysis is None else analysis.repeat_index()
     for length in range(minimum, maximum + 1):
-        pos = repeat_positions(ciphertext, length=length)
+        pos = _repeat_positions(index, ciphertext, length, 0)
         print(f"repeats length {length}: {pos}")
 
 
@@ -109,10 +134,16 @@ def repeat_positions(
     cut: int = 0,
 ) -> dict[str, list[int]]:
     """Repeat positions are just ngrams where each list has at least 2 entries."""
+    return _repeat_positions(RepeatIndex(ciphertext), ciphertext, length, cut)
+
+
+def _repeat_positions(
+    index: RepeatIndex, ciphertext: Sequence[object], length: int, cut: int
+) -> dict[str, list[int]]:
+    """repeat_positions() read off a prebuilt index, keyed as ngram_positions()."""
     return {
-        k: v
-        for k, v in ngram_positions(ciphertext, length=length, cut=cut).items()
-        if len(v) > 1
+        str(ciphertext[group[0] : group[0] + length]): group.tolist()
+        for group in index.repeat_groups(length, cut)
     }
 
 
@@ -122,12 +153,11 @@ def odd_spaced_repeats(
     maximum: int = 6,
 ) -> None:
     """ROD = percentage of odd-spaced repeats to all repeats."""
-    d = []
+    index = RepeatIndex(ciphertext)
+    d: list[int] = []
     for length in range(minimum, maximum + 1):
-        rep = repeat_positions(ciphertext, length=length)
-        for v in rep.values():
-            for l in range(1, len(v)):
-                d.append(v[l] - v[l - 1])
+        for group in index.repeat_groups(length):
+            d.extend(np.diff(group).tolist())
 
     even = 0
     odd = 0
@@ -10,7 +10,18 @@ harness serves every test and any null.
 
 Randomness is reproducible and trial-independent by construction: trial i uses
 random.Random(seed + i), so a run is deterministic given the seed and trials
-may be evaluated in any order or in parallel.
+may be evaluated in any order or in parallel. The executor argument does the
+latter: "thread" or "process" evaluates chunks of consecutive trials on a
+pool, and the per-trial values are folded in trial order, so the result is
+bit-for-bit identical to a serial run for any worker count. A process pool
+needs the statistic, the null model and the observed sequence to be
+picklable (module-level functions or functools.partial, not closures).
+
+A statistic carrying an array kernel (see stats.kernels.with_kernel) is
+evaluated in bulk: the surrogates of a chunk of trials, still drawn from
+random.Random(seed + i), are stacked into an integer matrix and the kernel
+scores them in one call. Kernels reproduce their statistics exactly, so the
+result is the same as without one.
 
 Empirical p-values use the (count + 1) / (trials + 1) convention, which is
 never zero and is conservative under ties. Both one-sided tails are reported so
@@ -18,23 +29,44 @@ the caller chooses direction at report time: doublet suppression is a lower-tail
 question, periodicity an upper-tail one, and the right tail differs per test.
 The z field is a standardized effect size, not the inferential quantity; under
 a skewed null it is only indicative, and the p-values are authoritative.
+
+The batch_ harnesses are the array-native path for integer-encoded texts: a
+matrix null model draws a (batch x N) matrix of surrogates from a numpy
+Generator seeded with `seed`, and a batched statistic maps it to one value (or
+one row of keyed values) per surrogate. Batches are drawn one after another
+from the same generator, so memory is bounded by batch_size * N and, for a
+null whose draws do not depend on the batch shape, the run does not depend on
+batch_size. These draws differ from the random.Random(seed + i) ones of the
+per-trial harnesses.
 """
 
 from __future__ import annotations
 
+import os
 import random
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from math import sqrt
-from typing import TYPE_CHECKING, TypeVar
+from functools import partial
+from itertools import chain
+from math import ceil, sqrt
+from typing import TYPE_CHECKING, Literal, TypeVar
+
+import numpy as np
 
 from aldegonde.exceptions import InvalidInputError
+from aldegonde.stats.kernels import Kernel, kernel_of
 from aldegonde.stats.zscore import z_score
 
 if TYPE_CHECKING:
-    from aldegonde.stats.nulls import NullModel
+    from aldegonde.stats.nulls import MatrixNullModel, NullModel
 
 T = TypeVar("T")
+V = TypeVar("V")
+
+ExecutorKind = Literal["serial", "thread", "process"]
+"""How surrogate trials are evaluated: in-line, on a thread pool, or on a
+process pool."""
 
 Statistic = Callable[[Sequence[T]], float]
 """A scalar statistic: a pure function from a sequence to a number."""
@@ -42,6 +74,10 @@ Statistic = Callable[[Sequence[T]], float]
 KeyedStatistic = Callable[[Sequence[T]], Mapping[int, float]]
 """A vector statistic keyed by an integer lag, period, or separation."""
 
+BatchStatistic = Callable[[np.ndarray], np.ndarray]
+"""A batched statistic: (K x N) encoded surrogates -> K values, or a (K x keys)
+matrix for a keyed statistic with one column per key."""
+
 
 @dataclass(frozen=True)
 class NullComparison:
@@ -122,12 +158,28 @@ class _Accumulator:
         )
 
 
+def _finalize_values(
+    values: np.ndarray, observed: float, trials: int
+) -> NullComparison:
+    """A NullComparison from a vector of per-trial surrogate values."""
+    sd = float(values.std(ddof=1)) if len(values) > 1 else 0.0
+    mean = float(values.mean())
+    return NullComparison(
+        observed=observed,
+        null_mean=mean,
+        null_sd=sd,
+        z=z_score(observed, mean, sd),
+        p_upper=(int((values >= observed).sum()) + 1) / (trials + 1),
+        p_lower=(int((values <= observed).sum()) + 1) / (trials + 1),
+    )
+
+
 def _max_over_keys(values: Mapping[int, float]) -> float:
     """Default family reduction: the largest value across the key set."""
     return max(values.values())
 
 
-def _validate_run(observed: Sequence[object], trials: int) -> None:
+def _validate_run(observed: Sequence[object] | np.ndarray, trials: int) -> None:
     """Reject runs that cannot produce a null distribution."""
     if trials < 1:
         msg = f"trials must be at least 1, got {trials}"
@@ -137,6 +189,152 @@ def _validate_run(observed: Sequence[object], trials: int) -> None:
         raise InvalidInputError(msg)
 
 
+KERNEL_CHUNK = 256
+"""Trials stacked per kernel call on the serial path."""
+
+
+def _stack(surrogates: Sequence[Sequence[object]]) -> np.ndarray | None:
+    """Surrogates as a (K x N) matrix of symbol indices, or None if ragged.
+
+    Each surrogate is split into its symbols, so str surrogates stack too.
+    Symbols are numbered in sorted order; the kernels are label invariant.
+    """
+    if len({len(surrogate) for surrogate in surrogates}) != 1:
+        return None
+    try:
+        symbols = np.asarray([list(surrogate) for surrogate in surrogates])
+        if symbols.ndim != 2:
+            return None
+        _, inverse = np.unique(symbols, return_inverse=True)
+    except (TypeError, ValueError):
+        return None
+    matrix: np.ndarray = inverse.reshape(symbols.shape[:2])
+    return matrix
+
+
+def _evaluate_trials(
+    evaluate: Callable[[Sequence[T]], V],
+    kernel: Callable[[np.ndarray], list[V]] | None,
+    null_model: NullModel[T],
+    observed: Sequence[T],
+    seed: int,
+    trials: range,
+) -> list[V]:
+    """Evaluate a contiguous block of trials; trial i uses Random(seed + i).
+
+    With a kernel the block's surrogates are stacked and evaluated in one
+    call, falling back to `evaluate` per surrogate if they cannot be stacked.
+    """
+    if kernel is None:
+        return [
+            evaluate(null_model(observed, random.Random(seed + trial)))
+            for trial in trials
+        ]
+    surrogates = [null_model(observed, random.Random(seed + trial)) for trial in trials]
+    matrix = _stack(surrogates)
+    if matrix is None:
+        return [evaluate(surrogate) for surrogate in surrogates]
+    return kernel(matrix)
+
+
+def _surrogate_values(
+    evaluate: Callable[[Sequence[T]], V],
+    null_model: NullModel[T],
+    observed: Sequence[T],
+    trials: int,
+    seed: int,
+    executor: ExecutorKind,
+    workers: int | None,
+    chunksize: int | None,
+    kernel: Callable[[np.ndarray], list[V]] | None = None,
+) -> Iterator[V]:
+    """Per-trial values of `evaluate` on the surrogates, in trial order.
+
+    The serial path without a kernel is lazy and holds one surrogate at a
+    time; with a kernel it evaluates KERNEL_CHUNK trials per call. The pooled
+    paths split the trials into contiguous chunks, one task each, and yield
+    the chunk results in submission order.
+    """
+    if executor not in ("serial", "thread", "process"):
+        msg = f"executor must be 'serial', 'thread' or 'process', got {executor!r}"
+        raise InvalidInputError(msg, input_value=executor)
+    if workers is not None and workers < 1:
+        msg = f"workers must be at least 1, got {workers}"
+        raise InvalidInputError(msg, input_value=workers)
+    if chunksize is not None and chunksize < 1:
+        msg = f"chunksize must be at least 1, got {chunksize}"
+        raise InvalidInputError(msg, input_value=chunksize)
+
+    task = partial(_evaluate_trials, evaluate, kernel, null_model, observed, seed)
+    if executor == "serial":
+        if kernel is None:
+            for trial in range(trials):
+                rng = random.Random(seed + trial)
+                yield evaluate(null_model(observed, rng))
+            return
+        size = chunksize or KERNEL_CHUNK
+        for start in range(0, trials, size):
+            yield from task(range(start, min(start + size, trials)))
+        return
+
+    pool_size = workers or os.cpu_count() or 1
+    size = chunksize or max(1, ceil(trials / (4 * pool_size)))
+    chunks = [
+        range(start, min(start + size, trials)) for start in range(0, trials, size)
+    ]
+    pool: Executor = (
+        ThreadPoolExecutor(max_workers=pool_size)
+        if executor == "thread"
+        else ProcessPoolExecutor(max_workers=pool_size)
+    )
+    with pool:
+        yield from chain.from_iterable(pool.map(task, chunks))
+
+
+def _keyed_values(
+    statistic: KeyedStatistic[T], keys: tuple[int, ...], sample: Sequence[T]
+) -> tuple[float, ...]:
+    """A keyed statistic on one surrogate, as values over the pinned keys."""
+    values = statistic(sample)
+    return tuple(values.get(key, 0.0) for key in keys)
+
+
+def _reduced_value(
+    statistic: KeyedStatistic[T],
+    keys: tuple[int, ...],
+    reduce: Callable[[Mapping[int, float]], float],
+    sample: Sequence[T],
+) -> float:
+    """A keyed statistic on one surrogate, reduced over the pinned keys."""
+    values = statistic(sample)
+    return reduce({key: values.get(key, 0.0) for key in keys})
+
+
+def _scalar_rows(kernel: Kernel, matrix: np.ndarray) -> list[float]:
+    """A scalar kernel's per-row values."""
+    return [float(value) for value in kernel(matrix)]
+
+
+def _keyed_rows(
+    kernel: Kernel, keys: tuple[int, ...], matrix: np.ndarray
+) -> list[tuple[float, ...]]:
+    """A keyed kernel's per-row values over the pinned keys."""
+    return [tuple(float(value) for value in row) for row in kernel(matrix, keys)]
+
+
+def _reduced_rows(
+    kernel: Kernel,
+    keys: tuple[int, ...],
+    reduce: Callable[[Mapping[int, float]], float],
+    matrix: np.ndarray,
+) -> list[float]:
+    """A keyed kernel's per-row values, reduced over the pinned keys."""
+    return [
+        reduce({key: float(value) for key, value in zip(keys, row)})
+        for row in kernel(matrix, keys)
+    ]
+
+
 def monte_carlo(
     statistic: Statistic[T],
     null_model: NullModel[T],
@@ -144,6 +342,9 @@ def monte_carlo(
     *,
     trials: int = 1000,
     seed: int = 0,
+    executor: ExecutorKind = "serial",
+    workers: int | None = None,
+    chunksize: int | None = None,
 ) -> NullComparison:
     """Compare a scalar statistic against a null model by resampling.
 
@@ -153,6 +354,10 @@ def monte_carlo(
         observed: The observed sequence
         trials: Number of surrogates to draw
         seed: Base seed; trial i uses random.Random(seed + i)
+        executor: "serial", "thread" or "process"; the result does not
+            depend on it
+        workers: Pool size; None for os.cpu_count()
+        chunksize: Trials per pool task; None for about four tasks per worker
 
     Returns:
         A NullComparison locating the observed value in the null distribution
@@ -160,9 +365,19 @@ def monte_carlo(
     _validate_run(observed, trials)
     observed_value = statistic(observed)
     accumulator = _Accumulator()
-    for trial in range(trials):
-        rng = random.Random(seed + trial)
-        accumulator.update(statistic(null_model(observed, rng)), observed_value)
+    kernel = kernel_of(statistic)
+    for value in _surrogate_values(
+        statistic,
+        null_model,
+        observed,
+        trials,
+        seed,
+        executor,
+        workers,
+        chunksize,
+        None if kernel is None else partial(_scalar_rows, kernel),
+    ):
+        accumulator.update(value, observed_value)
     return accumulator.finalize(observed_value, trials)
 
 
@@ -174,6 +389,9 @@ def monte_carlo_map(
     keys: Sequence[int],
     trials: int = 1000,
     seed: int = 0,
+    executor: ExecutorKind = "serial",
+    workers: int | None = None,
+    chunksize: int | None = None,
 ) -> dict[int, NullComparison]:
     """Compare a keyed statistic against a null model, key by key.
 
@@ -188,6 +406,10 @@ def monte_carlo_map(
         keys: The fixed set of keys to compare
         trials: Number of surrogates to draw
         seed: Base seed; trial i uses random.Random(seed + i)
+        executor: "serial", "thread" or "process"; the result does not
+            depend on it
+        workers: Pool size; None for os.cpu_count()
+        chunksize: Trials per pool task; None for about four tasks per worker
 
     Returns:
         A NullComparison per key
@@ -195,14 +417,21 @@ def monte_carlo_map(
     _validate_run(observed, trials)
     observed_values = statistic(observed)
     accumulators = {key: _Accumulator() for key in keys}
-    for trial in range(trials):
-        rng = random.Random(seed + trial)
-        surrogate_values = statistic(null_model(observed, rng))
-        for key in keys:
-            accumulators[key].update(
-                surrogate_values.get(key, 0.0),
-                observed_values.get(key, 0.0),
-            )
+    evaluate = partial(_keyed_values, statistic, tuple(keys))
+    kernel = kernel_of(statistic)
+    for surrogate_values in _surrogate_values(
+        evaluate,
+        null_model,
+        observed,
+        trials,
+        seed,
+        executor,
+        workers,
+        chunksize,
+        None if kernel is None else partial(_keyed_rows, kernel, tuple(keys)),
+    ):
+        for key, value in zip(keys, surrogate_values):
+            accumulators[key].update(value, observed_values.get(key, 0.0))
     return {
         key: accumulators[key].finalize(observed_values.get(key, 0.0), trials)
         for key in keys
@@ -218,6 +447,9 @@ def family_pvalue(
     reduce: Callable[[Mapping[int, float]], float] = _max_over_keys,
     trials: int = 1000,
     seed: int = 0,
+    executor: ExecutorKind = "serial",
+    workers: int | None = None,
+    chunksize: int | None = None,
 ) -> FamilyResult:
     """Test the strongest peak across a key set with one family-wise p-value.
 
@@ -236,6 +468,10 @@ def family_pvalue(
             maximum over keys
         trials: Number of surrogates to draw
         seed: Base seed; trial i uses random.Random(seed + i)
+        executor: "serial", "thread" or "process"; the result does not
+            depend on it
+        workers: Pool size; None for os.cpu_count()
+        chunksize: Trials per pool task; None for about four tasks per worker
 
     Returns:
         A FamilyResult with the observed reduction, its key, and the
@@ -251,10 +487,19 @@ def family_pvalue(
         else None
     )
     at_or_above = 0
-    for trial in range(trials):
-        rng = random.Random(seed + trial)
-        surrogate_stat = statistic(null_model(observed, rng))
-        surrogate_reduced = reduce({k: surrogate_stat.get(k, 0.0) for k in keys})
+    evaluate = partial(_reduced_value, statistic, tuple(keys), reduce)
+    kernel = kernel_of(statistic)
+    for surrogate_reduced in _surrogate_values(
+        evaluate,
+        null_model,
+        observed,
+        trials,
+        seed,
+        executor,
+        workers,
+        chunksize,
+        None if kernel is None else partial(_reduced_rows, kernel, tuple(keys), reduce),
+    ):
         if surrogate_reduced >= observed_reduced:
             at_or_above += 1
     return FamilyResult(
@@ -262,3 +507,98 @@ def family_pvalue(
         key=key,
         p_value=(at_or_above + 1) / (trials + 1),
     )
+
+
+def _batch_values(
+    statistic: BatchStatistic,
+    null_model: MatrixNullModel,
+    observed: np.ndarray,
+    trials: int,
+    seed: int,
+    batch_size: int,
+) -> np.ndarray:
+    """Batched statistic over `trials` matrix surrogates, stacked in draw order."""
+    if batch_size < 1:
+        msg = f"batch_size must be at least 1, got {batch_size}"
+        raise InvalidInputError(msg, input_value=batch_size)
+    rng = np.random.default_rng(seed)
+    parts = [
+        np.asarray(
+            statistic(null_model(observed, min(batch_size, trials - start), rng))
+        )
+        for start in range(0, trials, batch_size)
+    ]
+    return np.concatenate(parts)
+
+
+def _encoded(observed: Sequence[int] | np.ndarray) -> np.ndarray:
+    """The observed sequence as a 1-D integer array."""
+    encoded = np.asarray(observed)
+    if encoded.ndim != 1 or not np.issubdtype(encoded.dtype, np.integer):
+        msg = "observed must be a 1-D integer-encoded sequence"
+        raise InvalidInputError(msg, input_value=observed)
+    return encoded
+
+
+def batch_monte_carlo(
+    statistic: BatchStatistic,
+    null_model: MatrixNullModel,
+    observed: Sequence[int] | np.ndarray,
+    *,
+    trials: int = 1000,
+    seed: int = 0,
+    batch_size: int = 1000,
+) -> NullComparison:
+    """Compare a batched scalar statistic against a matrix null model.
+
+    Args:
+        statistic: Maps a (K x N) surrogate matrix to K values
+        null_model: The matrix resampler producing surrogate rows
+        observed: The observed integer-encoded sequence
+        trials: Number of surrogates to draw
+        seed: Seed of the numpy generator drawing the surrogates
+        batch_size: Surrogates drawn and evaluated per pass
+
+    Returns:
+        A NullComparison locating the observed value in the null distribution
+    """
+    encoded = _encoded(observed)
+    _validate_run(encoded, trials)
+    observed_value = float(np.asarray(statistic(encoded[None, :]))[0])
+    values = _batch_values(statistic, null_model, encoded, trials, seed, batch_size)
+    return _finalize_values(values, observed_value, trials)
+
+
+def batch_monte_carlo_map(
+    statistic: BatchStatistic,
+    null_model: MatrixNullModel,
+    observed: Sequence[int] | np.ndarray,
+    *,
+    keys: Sequence[int],
+    trials: int = 1000,
+    seed: int = 0,
+    batch_size: int = 1000,
+) -> dict[int, NullComparison]:
+    """Compare a batched keyed statistic against a matrix null model, key by key.
+
+    Args:
+        statistic: Maps a (K x N) surrogate matrix to a (K x len(keys)) matrix,
+            column j holding the value for keys[j]
+        null_model: The matrix resampler producing surrogate rows
+        observed: The observed integer-encoded sequence
+        keys: The keys labelling the statistic's columns
+        trials: Number of surrogates to draw
+        seed: Seed of the numpy generator drawing the surrogates
+        batch_size: Surrogates drawn and evaluated per pass
+
+    Returns:
+        A NullComparison per key
+    """
+    encoded = _encoded(observed)
+    _validate_run(encoded, trials)
+    observed_values = np.asarray(statistic(encoded[None, :]))[0]
+    values = _batch_values(statistic, null_model, encoded, trials, seed, batch_size)
+    return {
+        key: _finalize_values(values[:, j], float(observed_values[j]), trials)
+        for j, key in enumerate(keys)
+    }
@@ -0,0 +1,247 @@
+"""Suffix array and LCP index answering repeat queries for every n-gram length.
+
+The suffix array of a text lists its suffixes in sorted order, and the LCP
+array holds the length of the longest common prefix of each suffix with the
+one before it. Two positions start the same n-gram of length L exactly when
+their suffixes fall in one run of the suffix array whose LCP values are all
+at least L, so one index built in O(N log N) answers repeat questions for
+every length: which n-grams repeat and where, how many there are, and the
+distances between their occurrences.
+
+The suffix array is built by prefix doubling, and the LCP array by binary
+lifting over the rank arrays of that construction; both run as array
+operations rather than per-suffix Python loops.
+
+Example:
+-------
+    >>> index = RepeatIndex("ABCXABCYABC")
+    >>> [group.tolist() for group in index.repeat_groups(3)]
+    [[0, 4, 8]]
+    >>> index.repeat_count(2)
+    2
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from aldegonde.stats.kappa import _lag_coincidences
+from aldegonde.stats.ngrams import _symbol_codes
+
+
+def _prefix_doubling(codes: np.ndarray) -> tuple[np.ndarray, list[np.ndarray]]:
+    """Suffix array of an integer text, with the rank arrays of each round.
+
+    ranks[j][i] orders the substrings text[i : i + 2**j] (shorter at the end
+    of the text), equal ranks meaning equal substrings. Rounds stop once all
+    suffixes are told apart, so every LCP is below 2 ** len(ranks).
+    """
+    n = len(codes)
+    rank = np.unique(codes, return_inverse=True)[1].astype(np.int64)
+    ranks: list[np.ndarray] = []
+    k = 1
+    while n and int(rank.max()) + 1 < n:
+        ranks.append(rank)
+        second = np.full(n, -1, dtype=np.int64)
+        second[: n - k] = rank[k:]
+        order = np.lexsort((second, rank))
+        changed = (np.diff(rank[order]) != 0) | (np.diff(second[order]) != 0)
+        rank = np.empty(n, dtype=np.int64)
+        rank[order] = np.concatenate(([0], np.cumsum(changed)))
+        k *= 2
+    suffixes: np.ndarray = np.argsort(rank, kind="stable")
+    return suffixes, ranks
+
+
+def _adjacent_lcp(suffixes: np.ndarray, ranks: list[np.ndarray]) -> np.ndarray:
+    """LCP of every suffix with its predecessor in the suffix array; lcp[0] = 0.
+
+    For each adjacent pair the common prefix is extended by 2**j whenever the
+    next 2**j symbols agree, from the largest power down, which is one rank
+    comparison per round for all pairs at once.
+    """
+    n = len(suffixes)
+    first, second = suffixes[:-1], suffixes[1:]
+    common = np.zeros(max(n - 1, 0), dtype=np.int64)
+    for j in reversed(range(len(ranks))):
+        k = 1 << j
+        a, b = first + common, second + common
+        agree = (a + k <= n) & (b + k <= n)
+        agree[agree] = ranks[j][a[agree]] == ranks[j][b[agree]]
+        common += k * agree
+    lcp = np.zeros(n, dtype=np.int64)
+    lcp[1:] = common
+    return lcp
+
+
+def suffix_array(text: Sequence[object] | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Suffix array and LCP array of a text.
+
+    Symbols are ordered by first appearance rather than by value, which
+    leaves every repeat query unchanged.
+
+    Args:
+        text: Sequence to index
+
+    Returns:
+        (suffixes, lcp): suffixes[i] is the start of the i-th smallest suffix,
+        lcp[i] the length of its common prefix with suffix i - 1 (lcp[0] = 0)
+    """
+    suffixes, ranks = _prefix_doubling(_symbol_codes(text))
+    return suffixes, _adjacent_lcp(suffixes, ranks)
+
+
+def _pair_distances(positions: np.ndarray, max_distance: int | None) -> np.ndarray:
+    """Distances between all pairs of ascending positions, first-major order."""
+    cap = np.inf if max_distance is None else max_distance
+    firsts: list[np.ndarray] = []
+    offsets: list[np.ndarray] = []
+    distances: list[np.ndarray] = []
+    for offset in range(1, len(positions)):
+        gaps = positions[offset:] - positions[:-offset]
+        near = np.flatnonzero(gaps <= cap)
+        if not len(near):
+            # later offsets only reach further
+            break
+        firsts.append(near)
+        offsets.append(np.full(len(near), offset))
+        distances.append(gaps[near])
+    if not distances:
+        return np.zeros(0, dtype=np.int64)
+    order = np.lexsort((np.concatenate(offsets), np.concatenate(firsts)))
+    pairs: np.ndarray = np.concatenate(distances)[order]
+    return pairs
+
+
+class RepeatIndex:
+    """Repeated n-grams of a text, for every length, from one suffix array.
+
+    N-grams follow ngrams.iterngram_positions: sliding for cut=0, and for
+    cut > 0 non-overlapping n-grams starting at cut - 1. Positions and
+    distances are always source text positions.
+
+    Attributes:
+        size: Length of the text
+        suffixes: The suffix array
+        lcp: LCP of each suffix with its predecessor in the suffix array
+    """
+
+    def __init__(self, text: Sequence[object] | np.ndarray) -> None:
+        self.size = len(text)
+        self.suffixes, self.lcp = suffix_array(text)
+
+    def ngram_ids(self, length: int) -> np.ndarray:
+        """An id per n-gram start 0..size - length, equal for equal n-grams."""
+        starts = np.cumsum(self.lcp < length) - 1
+        ids = np.empty(self.size, dtype=np.int64)
+        ids[self.suffixes] = starts
+        return ids[: max(self.size - length + 1, 0)]
+
+    def _starts(self, length: int, cut: int) -> np.ndarray:
+        """The n-gram starts for a length and cut."""
+        last = self.size - length + 1
+        if cut == 0:
+            return np.arange(max(last, 0))
+        if cut > length:
+            return np.zeros(0, dtype=np.int64)
+        return np.arange(cut - 1, max(last, 0), length)
+
+    def repeat_groups(self, length: int, cut: int = 0) -> list[np.ndarray]:
+        """Ascending positions of each n-gram occurring more than once.
+
+        Groups are ordered by their first occurrence.
+        """
+        starts = self._starts(length, cut)
+        ids = self.ngram_ids(length)[starts]
+        order = np.lexsort((starts, ids))
+        ids, positions = ids[order], starts[order]
+        bounds = np.flatnonzero(np.diff(ids)) + 1
+        groups = [group for group in np.split(positions, bounds) if len(group) > 1]
+        groups.sort(key=lambda group: int(group[0]))
+        return groups
+
+    def repeat_count(self, length: int, cut: int = 0) -> int:
+        """Number of distinct n-grams occurring more than once."""
+        if cut == 0:
+            # a run of LCP >= length opens a group of two or more suffixes
+            opens = (self.lcp[1:] >= length) & (self.lcp[:-1] < length)
+            return int(np.count_nonzero(opens))
+        return len(self.repeat_groups(length, cut))
+
+    def distance_spectrum(
+        self, length: int, cut: int = 0, max_distance: int | None = None
+    ) -> np.ndarray:
+        """Number of pairs of equal n-grams at every distance.
+
+        Element d counts the pairs of occurrences of the same n-gram exactly d
+        positions apart; element 0 is 0. The counts are lag coincidences of
+        the n-gram ids, so frequent n-grams cost an FFT rather than a pair
+        loop.
+
+        Args:
+            length: Size of n-gram
+            cut: 0 for sliding n-grams, else non-overlapping from cut - 1
+            max_distance: Largest distance; None for the largest possible
+
+        Returns:
+            Array of pair counts indexed by distance, 0..max_distance
+        """
+        top = max(self.size - length, 0) if max_distance is None else max_distance
+        spectrum = np.zeros(top + 1, dtype=np.int64)
+        ids = self.ngram_ids(length)
+        if cut == 0:
+            spectrum[1:] = _lag_coincidences(ids, top)[1:]
+        elif cut <= length:
+            counts = _lag_coincidences(ids[cut - 1 :: length], top // length)
+            spectrum[length::length] = counts[1:]
+        return spectrum
+
+    def pair_distances(
+        self, length: int, cut: int = 0, max_distance: int | None = None
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Pairwise distances between the occurrences of each repeated n-gram.
+
+        Returns:
+            (positions, distances) per repeated n-gram in first-occurrence
+            order, distances over all pairs i < j in order of i then j, capped
+            at max_distance; n-grams with no pair within the cap are left out
+        """
+        out: list[tuple[np.ndarray, np.ndarray]] = []
+        for positions in self.repeat_groups(length, cut):
+            distances = _pair_distances(positions, max_distance)
+            if len(distances):
+                out.append((positions, distances))
+        return out
+
+    def maximal_repeats(self, min_length: int = 1) -> list[tuple[int, np.ndarray]]:
+        """Repeats that cannot be extended to the left or right.
+
+        A repeat is maximal when its occurrences are not all followed by the
+        same symbol, nor all preceded by the same symbol; every other repeat
+        is a substring of a maximal one with the same occurrence count.
+
+        Args:
+            min_length: Shortest repeat to report
+
+        Returns:
+            (length, ascending positions) per maximal repeat, longest first
+        """
+        codes = np.full(self.size + 1, -1, dtype=np.int64)
+        codes[1:] = self.ngram_ids(1)  # codes[p] is the symbol before p
+        before = codes[self.suffixes]
+        out: list[tuple[int, np.ndarray]] = []
+        # lcp intervals: stack of (lcp value, left boundary)
+        stack: list[tuple[int, int]] = [(0, 0)]
+        lcp = self.lcp.tolist() + [0]
+        for i in range(1, self.size + 1):
+            left = i - 1
+            while lcp[i] < stack[-1][0]:
+                value, left = stack.pop()
+                if value >= min_length:
+                    preceding = before[left:i]
+                    if preceding.min() < 0 or preceding.min() != preceding.max():
+                        out.append((value, np.sort(self.suffixes[left:i])))
+            if lcp[i] > stack[-1][0]:
+                stack.append((lcp[i], left))
+        out.sort(key=lambda repeat: (-repeat[0], int(repeat[1][0])))
+        return out
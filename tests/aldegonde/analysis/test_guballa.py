@@ -2,8 +2,11 @@
 Jens Guballa's algorithm using piecemeal bigram scoring to break PASC
 """
 
+import pytest
+
 from aldegonde import masc, pasc
 from aldegonde.analysis import guballa
+from aldegonde.exceptions import InvalidInputError
 
 ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
@@ -55,3 +58,16 @@ def test_kryptos2():
     # plaintext = "".join(pasc.pasc_decrypt(K2, password, KRYPTOSTR))
     # score = compare.quadgramscore(plaintext)
     assert password == "ABSCISSA"
+
+
+def test_symbols_outside_tabula_recta():
+    tr = pasc.vigenere_tr(ALPHABET)
+    with pytest.raises(InvalidInputError):
+        guballa.bigram_break_pasc("ATTACK?ATDAWN", tr, 3)
+    del tr["Z"]
+    with pytest.raises(InvalidInputError):
+        guballa.bigram_break_pasc("ATTACKATDAWN", tr, 3)
+    partial = pasc.vigenere_tr(ALPHABET)
+    del partial["C"]["B"]
+    with pytest.raises(InvalidInputError):
+        guballa.bigram_break_pasc("ATTACKATDAWN", partial, 3)
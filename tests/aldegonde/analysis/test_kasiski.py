@@ -2,17 +2,22 @@
 
 import random
 
+import numpy as np
 import pytest
 
 from aldegonde import c3301, pasc
 from aldegonde.analysis.kasiski import (
+    _batch_pooled_spectrum,
+    _pooled_spectrum,
     distance_spectrum,
     kasiski_examination,
+    kasiski_significance,
     print_kasiski_statistics,
     repeat_distances,
 )
 from aldegonde.exceptions import InsufficientDataError, InvalidInputError
 from aldegonde.stats.kappa import doublets
+from aldegonde.stats.suffix import RepeatIndex
 
 ABC = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
@@ -181,3 +186,48 @@ def test_print_kasiski_no_repeats(capsys: pytest.CaptureFixture[str]) -> None:
     print_kasiski_statistics("ABCDEFGHIJ", min_length=3, max_length=4)
     out = capsys.readouterr().out
     assert "no repeated ngrams" in out
+
+
+def test_kasiski_long_period_range() -> None:
+    """Scoring thousands of periods matches direct divisibility counting."""
+    rng = random.Random(7)
+    text = [rng.choice("ABCDE") for _ in range(3000)]
+    scores = kasiski_examination(
+        text, min_length=3, max_length=4, min_period=2, max_period=2000
+    )
+    spectrum = distance_spectrum(text, length=3) + distance_spectrum(text, length=4)
+    total = sum(spectrum.values())
+    for period in (2, 17, 999, 2000):
+        count = sum(c for d, c in spectrum.items() if d % period == 0)
+        assert scores[period] == pytest.approx(count * period / total)
+
+
+def test_kasiski_significance_flags_vigenere_period() -> None:
+    key = "MUSKETS"
+    tr = pasc.vigenere_tr(ABC)
+    ciphertext = list(pasc.pasc_encrypt(PLAINTEXT, keyword=key, tr=tr))
+    results = kasiski_significance(
+        ciphertext, min_length=3, max_length=4, max_period=10, trials=50
+    )
+    assert sorted(results) == list(range(2, 11))
+    assert results[7].p_upper == pytest.approx(1 / 51)
+    assert max(results, key=lambda period: results[period].z) == 7
+
+
+@pytest.mark.parametrize(
+    ("symbols", "min_length", "max_length", "max_distance"),
+    [(5, 1, 5, None), (29, 3, 5, 60), (3, 2, 4, 10), (29, 1, 14, None)],
+)
+def test_batch_pooled_spectrum_matches_rows(
+    symbols: int, min_length: int, max_length: int, max_distance: int | None
+) -> None:
+    rng = np.random.default_rng(symbols)
+    batch = rng.integers(0, symbols, (6, 300))
+    expected = np.stack(
+        [
+            _pooled_spectrum(RepeatIndex(row), min_length, max_length, max_distance)
+            for row in batch
+        ]
+    )
+    spectrum = _batch_pooled_spectrum(batch, min_length, max_length, max_distance)
+    assert (spectrum == expected).all()
@@ -0,0 +1,89 @@
+import random
+
+import numpy as np
+import pytest
+
+from aldegonde.analysis.krakup import (
+    autocorrelation_score,
+    column_ioc,
+    compute_spectrogram,
+    differential_entropy_score,
+    krakup,
+    text_to_numeric,
+)
+from aldegonde.exceptions import InvalidInputError
+
+
+def _reference_cell(
+    text: list[str],
+    numeric: np.ndarray,
+    start: int,
+    window: int,
+    period: int,
+    alphabet: int,
+) -> float:
+    """The spectrogram cell as the per-cell scoring functions compute it."""
+    numbers = numeric[start : start + window]
+    return (
+        0.4 * column_ioc(text[start : start + window], period)
+        + 0.3 * autocorrelation_score(numbers, period)
+        + 0.3 * (1.0 - differential_entropy_score(numbers, period, alphabet))
+    )
+
+
+@pytest.mark.parametrize(("window", "step"), [(60, 7), (41, 1), (100, 10)])
+def test_spectrogram_matches_cell_scores(window: int, step: int) -> None:
+    rng = random.Random(window)
+    text = [rng.choice("AAABBCDEFG") for _ in range(400)]
+    numeric = text_to_numeric(text)
+    spectrogram, profile = compute_spectrogram(text, numeric, 2, 30, window, step, 7)
+    assert spectrogram.shape == ((400 - window) // step + 1, 29)
+    for row, (start, period, strength) in enumerate(profile):
+        assert start == row * step
+        for p_idx, p in enumerate(range(2, 31)):
+            expected = (
+                _reference_cell(text, numeric, start, window, p, 7)
+                if p < window // 2
+                else 0
+            )
+            assert spectrogram[row, p_idx] == pytest.approx(expected)
+        assert strength == pytest.approx(spectrogram[row].max())
+        assert period == 2 + int(np.argmax(spectrogram[row]))
+
+
+def test_spectrogram_column_ioc_counts_text() -> None:
+    rng = random.Random(5)
+    text = [rng.choice("ABCDEFGHIJ") for _ in range(300)]
+    # a coarser numeric form than the text: the column IoC still sees text
+    numeric = text_to_numeric(text) % 3
+    spectrogram, profile = compute_spectrogram(text, numeric, 2, 10, 80, 20, 3)
+    for row, (start, _, _) in enumerate(profile):
+        for p_idx, p in enumerate(range(2, 11)):
+            expected = _reference_cell(text, numeric, start, 80, p, 3)
+            assert spectrogram[row, p_idx] == pytest.approx(expected)
+    with pytest.raises(InvalidInputError):
+        compute_spectrogram(text, numeric[:-1], 2, 10, 80, 20, 3)
+
+
+def test_spectrogram_pools_agree() -> None:
+    rng = random.Random(1)
+    text = [rng.randrange(29) for _ in range(1500)]
+    numeric = text_to_numeric(text)
+    serial = compute_spectrogram(text, numeric, 2, 20, 100, 10, 29)
+    for executor in ("thread", "process"):
+        pooled = compute_spectrogram(
+            text, numeric, 2, 20, 100, 10, 29, executor=executor, workers=2
+        )
+        assert np.array_equal(pooled[0], serial[0])
+        assert pooled[1] == serial[1]
+    with pytest.raises(InvalidInputError):
+        compute_spectrogram(text, numeric, 2, 20, 100, 10, 29, executor="gpu")  # type: ignore[arg-type]
+
+
+def test_krakup_finds_period() -> None:
+    rng = random.Random(5)
+    key = [rng.randrange(26) for _ in range(7)]
+    plain = [rng.choice([0, 0, 0, 4, 4, 8, 13, 14, 17, 18, 19]) for _ in range(1400)]
+    text = [(p + key[i % 7]) % 26 for i, p in enumerate(plain)]
+    result = krakup(text, min_period=2, max_period=20)
+    assert result.dominant_periods[0][0] in (7, 14)
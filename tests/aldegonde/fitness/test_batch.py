@@ -0,0 +1,92 @@
+import random
+
+import numpy as np
+import pytest
+
+from aldegonde import pasc
+from aldegonde.exceptions import InsufficientDataError, InvalidInputError
+from aldegonde.fitness.batch import (
+    BatchFitness,
+    UnigramChiSquareFitness,
+    WeightedFitness,
+)
+from aldegonde.fitness.ioc import ENGLISH, IocFitness
+from aldegonde.stats.compare import loadgrams, quadgramscore
+
+ABC = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+PLAINTEXT = (
+    "ITWASTHEBESTOFTIMESITWASTHEWORSTOFTIMESITWASTHEAGEOFWISDOM"
+    "ITWASTHEAGEOFFOOLISHNESSITWASTHEEPOCHOFBELIEF"
+)
+UNIGRAMS = loadgrams("aldegonde.data.ngrams.english", "unigrams.txt")
+
+
+def _candidates(count: int = 6) -> list[str]:
+    rng = random.Random(0)
+    texts = [PLAINTEXT]
+    for _ in range(count - 1):
+        texts.append("".join(rng.choice(ABC) for _ in PLAINTEXT))
+    return texts
+
+
+def _chi_square(text: str) -> float:
+    total = sum(UNIGRAMS.values())
+    return -sum(
+        (text.count(c) - len(text) * UNIGRAMS[c] / total) ** 2
+        / (len(text) * UNIGRAMS[c] / total)
+        for c in ABC
+    )
+
+
+def test_fitnesses_follow_protocol() -> None:
+    for fitness in (
+        quadgramscore,
+        IocFitness(ENGLISH),
+        UnigramChiSquareFitness(UNIGRAMS),
+        WeightedFitness([(1.0, quadgramscore)]),
+    ):
+        assert isinstance(fitness, BatchFitness)
+
+
+def test_ioc_batch_matches_single_text() -> None:
+    texts = _candidates()
+    fitness = IocFitness(ENGLISH)
+    batch = quadgramscore.encode_batch(texts)
+    assert fitness.score_batch(batch).tolist() == pytest.approx(
+        [fitness(text) for text in texts]
+    )
+    with pytest.raises(InsufficientDataError):
+        fitness.score_batch(np.zeros((3, 1), dtype=np.intp))
+
+
+def test_chi_square_batch_matches_single_text() -> None:
+    texts = _candidates()
+    fitness = UnigramChiSquareFitness(UNIGRAMS)
+    scores = fitness.score_batch(fitness.encode_batch(texts))
+    assert scores.tolist() == pytest.approx([_chi_square(text) for text in texts])
+    assert fitness(texts[1]) == pytest.approx(scores[1])
+    assert int(np.argmax(scores)) == 0
+    with pytest.raises(InvalidInputError):
+        UnigramChiSquareFitness({})
+
+
+def test_weighted_batch_over_decrypt_batch() -> None:
+    tr = pasc.vigenere_tr(ABC)
+    compiled = pasc.compile_tr(tr)
+    ciphertext = compiled.encode(pasc.pasc_encrypt(PLAINTEXT, "KEY", tr))
+    rng = np.random.default_rng(1)
+    keywords = rng.integers(0, 26, size=(20, 3))
+    keywords[7] = compiled.encode_keyword("KEY")
+    plaintexts = compiled.decrypt_batch(ciphertext, keywords)
+
+    ioc = IocFitness(ENGLISH)
+    fitness = WeightedFitness([(1.0, quadgramscore), (50.0, ioc)])
+    scores = fitness.score_batch(plaintexts)
+    expected = [
+        quadgramscore.score(row) + 50.0 * ioc.score_batch(row)[0] for row in plaintexts
+    ]
+    assert scores.tolist() == pytest.approx(expected)
+    assert int(np.argmax(scores)) == 7
+    assert fitness.score(plaintexts[7]) == pytest.approx(scores[7])
+    with pytest.raises(InvalidInputError):
+        WeightedFitness([])
@@ -0,0 +1,110 @@
+import random
+
+import numpy as np
+import pytest
+
+from aldegonde import masc, pasc
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.fitness.incremental import MascSwapFitness, PascPeriodicFitness
+from aldegonde.stats.compare import quadgramscore
+
+ABC = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+PLAINTEXT = (
+    "ITWASTHEBESTOFTIMESITWASTHEWORSTOFTIMESITWASTHEAGEOFWISDOM"
+    "ITWASTHEAGEOFFOOLISHNESSITWASTHEEPOCHOFBELIEF"
+)
+
+
+def _full_score(ciphertext: str, key: dict[str, str]) -> float:
+    return quadgramscore("".join(masc.masc_decrypt(ciphertext, key)))
+
+
+def test_masc_swap_fitness_initial_score() -> None:
+    key = masc.randomkey(ABC)
+    ciphertext = "".join(masc.masc_encrypt(PLAINTEXT, key))
+    fitness = MascSwapFitness.from_text(ciphertext, key, quadgramscore)
+    assert fitness.score == pytest.approx(_full_score(ciphertext, key))
+
+
+def test_masc_swap_fitness_delta_matches_full_rescore() -> None:
+    rng = random.Random(0)
+    key = masc.randomkey(ABC)
+    ciphertext = "".join(masc.masc_encrypt(PLAINTEXT, key))
+    fitness = MascSwapFitness.from_text(ciphertext, key, quadgramscore)
+    for _ in range(50):
+        a, b = rng.sample(range(len(ABC)), 2)
+        before = fitness.score
+        delta = fitness.propose(a, b)
+        swapped = dict(key)
+        swapped[ABC[a]], swapped[ABC[b]] = key[ABC[b]], key[ABC[a]]
+        assert before + delta == pytest.approx(_full_score(ciphertext, swapped))
+        if delta > 0 or rng.random() < 0.3:
+            fitness.accept()
+            key = swapped
+        else:
+            fitness.reject()
+        assert fitness.score == pytest.approx(_full_score(ciphertext, key))
+        expected_plaintext = np.array(
+            [ABC.index(e) for e in masc.masc_decrypt(ciphertext, key)]
+        )
+        assert (fitness.plaintext == expected_plaintext).all()
+
+
+def test_masc_swap_fitness_rejects_bad_key() -> None:
+    with pytest.raises(InvalidInputError):
+        MascSwapFitness(np.array([0, 1, 2]), np.zeros(26, dtype=int), quadgramscore)
+
+
+def test_masc_swap_fitness_accept_without_proposal() -> None:
+    fitness = MascSwapFitness(np.arange(26), np.arange(26), quadgramscore)
+    with pytest.raises(InvalidInputError):
+        fitness.accept()
+
+
+def _full_pasc_score(ciphertext: str, keyword: list[str], tr: pasc.TR[str]) -> float:
+    return quadgramscore("".join(pasc.pasc_decrypt(ciphertext, keyword, tr)))
+
+
+@pytest.mark.parametrize("tr", [pasc.vigenere_tr(ABC), pasc.beaufort_tr(ABC)])
+def test_pasc_periodic_fitness_delta_matches_full_rescore(tr: pasc.TR[str]) -> None:
+    rng = random.Random(1)
+    keyword = list("LEMON")
+    ciphertext = "".join(pasc.pasc_encrypt(PLAINTEXT, keyword, tr))
+    keyword = [rng.choice(ABC) for _ in keyword]
+    fitness = PascPeriodicFitness.from_text(ciphertext, keyword, tr, quadgramscore)
+    assert fitness.score == pytest.approx(_full_pasc_score(ciphertext, keyword, tr))
+    for _ in range(50):
+        position = rng.randrange(len(keyword))
+        letter = rng.choice(ABC)
+        before = fitness.score
+        delta = fitness.propose(position, fitness.compiled.key_index[letter])
+        changed = list(keyword)
+        changed[position] = letter
+        assert before + delta == pytest.approx(
+            _full_pasc_score(ciphertext, changed, tr)
+        )
+        if delta > 0 or rng.random() < 0.3:
+            fitness.accept()
+            keyword = changed
+        else:
+            fitness.reject()
+        assert fitness.score == pytest.approx(_full_pasc_score(ciphertext, keyword, tr))
+    assert [fitness.compiled.keys[k] for k in fitness.keyword] == keyword
+
+
+def test_pasc_periodic_fitness_partial_tr() -> None:
+    """Undefined TR cells decrypt to -1 and score the floor."""
+    tr = {"A": {"A": "B", "B": "A"}, "B": {"A": "A", "B": "C"}}
+    fitness = PascPeriodicFitness.from_text("BCAB", "AB", tr, quadgramscore)
+    assert fitness.plaintext.tolist() == [0, 1, 1, -1]
+    assert fitness.score == quadgramscore.floor
+    fitness.propose(1, 0)
+    assert fitness.plaintext.tolist() == [0, -1, 1, 0]
+    fitness.reject()
+    assert fitness.plaintext.tolist() == [0, 1, 1, -1]
+
+
+def test_pasc_periodic_fitness_rejects_bad_keyword() -> None:
+    compiled = pasc.compile_tr(pasc.vigenere_tr(ABC))
+    with pytest.raises(InvalidInputError):
+        PascPeriodicFitness(np.arange(26), np.array([26]), compiled, quadgramscore)
@@ -0,0 +1,101 @@
+import random
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.lm.build import build_counts, write_frequency_file
+from aldegonde.lm.counts import NgramCounter, NgramCounts
+from aldegonde.stats.ngramscore import DenseNgramScorer
+
+
+def _reference(texts: list[str], order: int) -> Counter[str]:
+    counts: Counter[str] = Counter()
+    for text in texts:
+        for word in text.split("-"):
+            counts.update(word[i : i + order] for i in range(len(word) - order + 1))
+    return counts
+
+
+def _texts(seed: int) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice("ABCDE-") for _ in range(rng.randrange(500, 2000)))
+        for _ in range(3)
+    ]
+
+
+@pytest.mark.parametrize("max_entries", [1 << 22, 50])
+def test_counter_matches_reference(max_entries: int, tmp_path: Path) -> None:
+    texts = _texts(max_entries)
+    counter = NgramCounter("ABCDE", 6, max_entries=max_entries, workdir=tmp_path)
+    rng = random.Random(0)
+    for text in texts:
+        cuts = sorted(rng.sample(range(1, len(text)), 25))
+        for a, b in zip([0, *cuts], [*cuts, len(text)]):
+            counter.update(text[a:b])
+        counter.boundary()
+    counts = counter.counts()
+    for order in range(1, 7):
+        assert counts.frequency_map(order) == _reference(texts, order)
+        assert np.all(np.diff(counts.codes(order)) > 0)
+    assert counter.symbols == sum(c != "-" for text in texts for c in text)
+    counter.close()
+    assert not list(tmp_path.iterdir())
+
+
+def test_write_streams_and_loads_memory_mapped(tmp_path: Path) -> None:
+    texts = _texts(1)
+    counter = NgramCounter("ABCDE", 4, max_entries=40)
+    for text in texts:
+        counter.update(text)
+        counter.boundary()
+    counts = counter.write(tmp_path / "model")
+    counter.close()
+    assert isinstance(counts.codes(4), np.memmap)
+    for order in range(1, 5):
+        assert counts.frequency_map(order) == _reference(texts, order)
+    copy = tmp_path / "copy"
+    counts.save(copy)
+    loaded = NgramCounts.load(copy, mmap=False)
+    assert loaded.frequency_map(3) == counts.frequency_map(3)
+
+
+def test_scorer_and_frequency_file(tmp_path: Path) -> None:
+    texts = _texts(2)
+    counter = NgramCounter("ABCDE", 3)
+    for text in texts:
+        counter.update(text)
+    counts = counter.counts()
+    write_frequency_file(counts, 3, tmp_path / "trigrams.txt")
+    lines = (tmp_path / "trigrams.txt").read_text().splitlines()
+    frequencies = [int(line.split()[1]) for line in lines]
+    assert frequencies == sorted(frequencies, reverse=True)
+    assert {
+        gram: int(count) for gram, count in (line.split() for line in lines)
+    } == counts.frequency_map(3)
+    expected = DenseNgramScorer(counts.frequency_map(3), alphabet="ABCDE")
+    scorer = counts.scorer(3)
+    assert np.allclose(scorer.table, expected.table)
+    assert scorer("ABCDEAB") == pytest.approx(expected("ABCDEAB"))
+
+
+def test_build_counts_from_files(tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text("The thing, the king.\n", encoding="utf-8")
+    (tmp_path / "b.txt").write_text("AB", encoding="utf-8")
+    counts = build_counts(
+        [tmp_path / "a.txt", tmp_path / "b.txt"], "ABEGHIKNT", 2, chunk_size=3
+    )
+    expected = _reference(["THETHINGTHEKING", "AB"], 2)
+    assert counts.frequency_map(2) == expected
+
+
+def test_counter_validation() -> None:
+    with pytest.raises(InvalidInputError):
+        NgramCounter("AB", 0)
+    with pytest.raises(InvalidInputError):
+        NgramCounter(["AB", "C"], 2)
+    with pytest.raises(InvalidInputError):
+        NgramCounter("ABCDEFGHIJ", 20)
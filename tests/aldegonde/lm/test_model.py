@@ -0,0 +1,109 @@
+import random
+from math import log10
+
+import numpy as np
+import pytest
+
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.fitness.batch import BatchFitness
+from aldegonde.lm.counts import NgramCounter, NgramCounts
+from aldegonde.lm.model import kneser_ney, stupid_backoff
+
+ALPHABET = "ABCDE"
+
+
+def _counts(order: int, seed: int = 0, size: int = 5000) -> NgramCounts:
+    rng = random.Random(seed)
+    words = ["ABC", "BAD", "CAB", "DEAD", "BEAD", "ACE", "EBB"]
+    text = "".join(rng.choice(words) for _ in range(size // 3))
+    counter = NgramCounter(ALPHABET, order)
+    counter.update(text)
+    return counter.counts()
+
+
+@pytest.mark.parametrize("history", ["", "A", "AB", "DEA", "EEE", "CEDB"])
+def test_kneser_ney_normalizes(history: str) -> None:
+    model = kneser_ney(_counts(4))
+    texts = [history + symbol for symbol in ALPHABET]
+    last = model.ngram_scores(model.encode_batch(texts))[:, -1]
+    assert (10.0**last).sum() == pytest.approx(1.0)
+
+
+def test_stupid_backoff_matches_reference() -> None:
+    counts = _counts(3)
+    model = stupid_backoff(counts, alpha=0.4)
+    frequencies = {k: counts.frequency_map(k) for k in (1, 2, 3)}
+    total = counts.total(1)
+
+    def reference(text: str) -> float:
+        score = 0.0
+        for i in range(len(text)):
+            penalty = 0.0
+            for k in range(min(3, i + 1), 0, -1):
+                gram = text[i - k + 1 : i + 1]
+                if k == 1:
+                    score += penalty + log10(frequencies[1].get(gram, 0.01) / total)
+                elif gram in frequencies[k]:
+                    score += penalty + log10(
+                        frequencies[k][gram] / frequencies[k - 1][gram[:-1]]
+                    )
+                    break
+                else:
+                    penalty += log10(0.4)
+                    continue
+                break
+        return score
+
+    for text in ["ABCABD", "EEEEE", "DEADBEAD", "A"]:
+        assert model(text) == pytest.approx(reference(text), rel=1e-5)
+
+
+def test_batch_matches_single_and_unknown_symbols() -> None:
+    model = kneser_ney(_counts(5))
+    texts = ["ABCDEABCDE", "DEADBEADCA", "AB?CDEA?BC"]
+    batch = model.score_batch(model.encode_batch(texts))
+    for text, score in zip(texts, batch):
+        assert model(text) == pytest.approx(score)
+    assert isinstance(model, BatchFitness)
+    # an unknown symbol scores the floor and cuts the history
+    assert model("AB?C") == pytest.approx(model("AB") + model.floor + model("C"))
+
+
+def test_higher_order_prefers_corpus_text() -> None:
+    model = kneser_ney(_counts(5))
+    rng = random.Random(9)
+    plain = "DEADBEADCABACEBADEBB"
+    shuffled = "".join(rng.sample(plain, len(plain)))
+    assert model(plain) > model(shuffled)
+
+
+def test_pruning_fits_budget() -> None:
+    counts = _counts(6, size=20000)
+    full = kneser_ney(counts)
+    budget = full.nbytes // 3
+    pruned = kneser_ney(counts, max_bytes=budget)
+    assert pruned.nbytes <= budget
+    assert pruned.entries(1) == len(ALPHABET)
+    assert 0 < pruned.entries(6) < full.entries(6)
+    assert np.isfinite(pruned("DEADBEADCABACEBADEBB"))
+    assert stupid_backoff(counts, max_bytes=budget).nbytes <= budget
+
+
+@pytest.mark.parametrize("history", ["", "A", "AB", "DAB", "EEE", "ADBC"])
+def test_pruned_kneser_ney_normalizes(history: str) -> None:
+    rng = random.Random(3)
+    counter = NgramCounter(ALPHABET, 4)
+    counter.update("".join(rng.choice(ALPHABET) for _ in range(20000)))
+    model = kneser_ney(counter.counts(), max_bytes=3000)
+    assert model.nbytes <= 3000
+    texts = [history + symbol for symbol in ALPHABET]
+    last = model.ngram_scores(model.encode_batch(texts))[:, -1]
+    assert (10.0**last).sum() == pytest.approx(1.0, rel=1e-5)
+
+
+def test_model_validation() -> None:
+    counts = _counts(2)
+    with pytest.raises(InvalidInputError):
+        kneser_ney(counts, 3)
+    with pytest.raises(InvalidInputError):
+        stupid_backoff(counts, alpha=0.0)
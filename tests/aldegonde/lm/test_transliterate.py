@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.lm.transliterate import RUNEGLISH, Transliterator
+
+
+def test_runeglish_digraphs_win() -> None:
+    assert RUNEGLISH("The king") == "ᚦᛖᚳᛝ"
+    assert RUNEGLISH("sea, oe!") == "ᛋᛠᛟ"
+    assert RUNEGLISH("VQZ") == "ᚢᚳᛋ"
+
+
+def test_rules_apply_in_order() -> None:
+    assert Transliterator([("a", "1"), ("ab", "2")])("ab") == "1"
+    assert Transliterator([("ab", "2"), ("a", "1")])("ab") == "2"
+    assert Transliterator([("a", "1")], ignore_case=False)("Aa") == "1"
+
+
+def test_from_alphabet_keeps_symbols() -> None:
+    english = Transliterator.from_alphabet("ABC")
+    assert english("a-b c.d") == "ABC"
+
+
+def test_stream_matches_whole_text() -> None:
+    rng = random.Random(3)
+    for letters in ("thingeaoi xq", "thingeaoixq"):
+        text = "".join(rng.choice(letters) for _ in range(3000))
+        for _ in range(10):
+            cuts = sorted(rng.sample(range(1, len(text)), 40))
+            chunks = [text[a:b] for a, b in zip([0, *cuts], [*cuts, len(text)])]
+            assert "".join(RUNEGLISH.transliterate_stream(chunks)) == RUNEGLISH(text)
+    assert "".join(RUNEGLISH.transliterate_stream("thing")) == "ᚦᛝ"
+
+
+def test_invalid_rules() -> None:
+    with pytest.raises(InvalidInputError):
+        Transliterator([])
+    with pytest.raises(InvalidInputError):
+        Transliterator([("", "x")])
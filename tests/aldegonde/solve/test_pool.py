@@ -0,0 +1,57 @@
+from functools import partial
+
+import pytest
+
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.solve import (
+    PascKeywordMoves,
+    Problem,
+    SolveResult,
+    anneal,
+    iter_restarts,
+    run_restarts,
+)
+
+ABC = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+TARGET = list("CRYPTOGRAM")
+
+
+def _distance(keyword: list[str]) -> float:
+    return float(sum(a != b for a, b in zip(keyword, TARGET, strict=True)))
+
+
+PROBLEM = Problem(PascKeywordMoves(ABC, len(TARGET)), _distance)
+
+
+def test_run_restarts_matches_serial_seeds() -> None:
+    solver = partial(anneal, PROBLEM, steps=300, tmax=2.0, tmin=0.05)
+    index, result = run_restarts(solver, 4, seed=10, workers=2)
+    serial = [solver(seed=10 + i) for i in range(4)]
+    expected = min(range(4), key=lambda i: (serial[i].energy, i))
+    assert index == expected
+    assert result.state == serial[expected].state
+    assert result.energy == serial[expected].energy
+
+
+def test_iter_restarts_streams_improvements() -> None:
+    solver = partial(anneal, PROBLEM, steps=300)
+    energies = [result.energy for _, result in iter_restarts(solver, 4, workers=2)]
+    assert energies == sorted(energies, reverse=True)
+
+
+def test_iter_restarts_threshold_stops_early() -> None:
+    solver = partial(anneal, PROBLEM, steps=5_000, tmax=2.0, tmin=0.05)
+    index, result = run_restarts(solver, 20, seed=1, workers=1, threshold=0.0)
+    assert result.energy == 0.0
+    assert result.state == TARGET
+
+
+def test_solver_stop_check() -> None:
+    result = anneal(PROBLEM, steps=1_000, stop=lambda: True)
+    assert isinstance(result, SolveResult)
+    assert result.iterations == 0
+
+
+def test_run_restarts_needs_restarts() -> None:
+    with pytest.raises(InvalidInputError):
+        run_restarts(partial(anneal, PROBLEM), 0)
@@ -0,0 +1,108 @@
+import random
+
+import numpy as np
+import pytest
+
+from aldegonde import pasc
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.fitness.incremental import PascPeriodicFitness
+from aldegonde.solve import (
+    AutokeyPrimerMoves,
+    MascKeyMoves,
+    PascKeywordMoves,
+    Problem,
+    QuagmireMoves,
+    anneal,
+    anneal_incremental,
+    hill_climb,
+    parallel_tempering,
+    pasc_keyword_proposal,
+)
+from aldegonde.stats.compare import quadgramscore
+
+ABC = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+TARGET = list("CRYPTOGRAM")
+PLAINTEXT = (
+    "ITWASTHEBESTOFTIMESITWASTHEWORSTOFTIMESITWASTHEAGEOFWISDOM"
+    "ITWASTHEAGEOFFOOLISHNESSITWASTHEEPOCHOFBELIEFITWASTHEEPOCH"
+    "OFINCREDULITYITWASTHESEASONOFLIGHTITWASTHESEASONOFDARKNESS"
+)
+
+
+def _distance(keyword: list[str]) -> float:
+    return float(sum(a != b for a, b in zip(keyword, TARGET, strict=True)))
+
+
+PROBLEM = Problem(PascKeywordMoves(ABC, len(TARGET)), _distance)
+
+
+def test_anneal_finds_keyword() -> None:
+    result = anneal(PROBLEM, steps=5_000, tmax=2.0, tmin=0.05, seed=1)
+    assert result.state == TARGET
+    assert result.energy == 0
+    assert result.iterations == 5_000
+    assert result.iterations_per_second > 0
+
+
+def test_anneal_is_reproducible() -> None:
+    first = anneal(PROBLEM, steps=200, seed=7)
+    second = anneal(PROBLEM, steps=200, seed=7)
+    assert first.state == second.state
+    assert first.energy == second.energy
+
+
+def test_hill_climb_finds_keyword() -> None:
+    result = hill_climb(PROBLEM, restarts=2, patience=500, seed=2)
+    assert result.state == TARGET
+    assert result.iterations >= 2 * 500
+
+
+def test_parallel_tempering_finds_keyword() -> None:
+    result = parallel_tempering(PROBLEM, steps=1_000, seed=3)
+    assert result.state == TARGET
+    assert result.iterations == 8 * 1_000
+
+
+def test_anneal_incremental_recovers_vigenere_keyword() -> None:
+    tr = pasc.vigenere_tr(ABC)
+    ciphertext = "".join(pasc.pasc_encrypt(PLAINTEXT, "LEMON", tr))
+    fitness = PascPeriodicFitness.from_text(ciphertext, "AAAAA", tr, quadgramscore)
+    result = anneal_incremental(
+        fitness, pasc_keyword_proposal(5, len(ABC)), steps=3_000, tmax=5.0, seed=4
+    )
+    assert "".join(fitness.compiled.keys[k] for k in result.state) == "LEMON"
+    assert result.energy == pytest.approx(
+        -quadgramscore("".join(pasc.pasc_decrypt(ciphertext, "LEMON", tr)))
+    )
+    assert isinstance(result.state, np.ndarray)
+
+
+def test_move_sets_stay_in_key_space() -> None:
+    rng = random.Random(5)
+    masc_moves = MascKeyMoves(ABC)
+    key = masc_moves.random_state(rng)
+    moved = masc_moves.move(key, rng)
+    assert sorted(moved.values()) == list(ABC)
+    assert sum(key[e] != moved[e] for e in ABC) == 2
+
+    primer_moves = AutokeyPrimerMoves(ABC, 4)
+    primer = primer_moves.random_state(rng)
+    assert sum(a != b for a, b in zip(primer, primer_moves.move(primer, rng))) == 1
+
+    quagmire_moves = QuagmireMoves(ABC, 6)
+    mixed, keyword = quagmire_moves.random_state(rng)
+    for _ in range(20):
+        mixed, keyword = quagmire_moves.move((mixed, keyword), rng)
+        assert sorted(mixed) == list(ABC)
+        assert len(keyword) == 6
+
+
+def test_invalid_parameters() -> None:
+    with pytest.raises(InvalidInputError):
+        anneal(PROBLEM, tmax=0.1, tmin=1.0)
+    with pytest.raises(InvalidInputError):
+        hill_climb(PROBLEM, restarts=0)
+    with pytest.raises(InvalidInputError):
+        parallel_tempering(PROBLEM, temperatures=[1.0, 0.0])
+    with pytest.raises(InvalidInputError):
+        PascKeywordMoves(ABC, 0)
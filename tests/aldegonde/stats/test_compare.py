@@ -1,4 +1,20 @@
-from aldegonde.stats.compare import quadgramscore
+from math import log10
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from aldegonde.cache import CACHE_ENV
+from aldegonde.stats import compare
+from aldegonde.stats.compare import (
+    ENGLISH,
+    NgramScorer,
+    bigramscore,
+    load_scorer,
+    quadgramscore,
+    trigramscore,
+)
+from aldegonde.stats.ngramscore import DenseNgramScorer
 
 am = "ABCDEFGHIJKLM"
 nz = "NOPQRSTUVWXYZ"
@@ -21,3 +37,111 @@ def test_quadgramscore() -> None:
     assert quadgramscore("TEST") > -3.7
     assert quadgramscore("THISISATESTOFTHEEMERGENCYBROADCASTSYSTEM") > -153.0
     assert quadgramscore("THISISATESTOFTHEEMERGENCYBROADCASTSYSTEM") < -152.0
+
+
+def test_quadgramscore_matches_per_ngram_lookup() -> None:
+    text = "THEQUICKBROWNFOXjumpsOVERTHELAZYDOG"
+    expected = sum(
+        quadgramscore.table[quadgramscore.code(text[i : i + 4])]
+        if all(c in quadgramscore.index for c in text[i : i + 4])
+        else quadgramscore.floor
+        for i in range(len(text) - 3)
+    )
+    assert quadgramscore(text) == pytest.approx(expected)
+
+
+def test_ngram_scorer_batch_matches_single() -> None:
+    texts = ["ATTACKATDAWN", "LXFOPVEFRNHR", "QQQQQQQQQQQQ"]
+    batch = bigramscore.score_batch(bigramscore.encode_batch(texts))
+    assert batch.shape == (3,)
+    for text, score in zip(texts, batch):
+        assert bigramscore(text) == pytest.approx(score)
+
+
+def test_ngram_scorer_short_text() -> None:
+    assert trigramscore("AB") == 0.0
+
+
+def test_ngram_scorer_custom_map() -> None:
+    scorer = NgramScorer({"AB": 3, "BA": 1})
+    assert scorer.alphabet == ["A", "B"]
+    assert scorer("AB") == pytest.approx(log10(3 / 4))
+    assert scorer("AA") == pytest.approx(log10(0.01 / 4))
+
+
+def test_scorer_save_load_round_trip(tmp_path: Path) -> None:
+    scorer = NgramScorer({"ABC": 3, "BCA": 1, "CAB": 2})
+    scorer.save(tmp_path / "model.v1")
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "model.v1.json",
+        "model.v1.npy",
+    ]
+    loaded = DenseNgramScorer.load(tmp_path / "model.v1")
+    assert isinstance(loaded.table, np.memmap)
+    assert loaded.alphabet == scorer.alphabet
+    assert loaded.length == 3
+    assert loaded.floor == scorer.floor
+    for text in ["ABCABC", "CCCBA", "AB"]:
+        assert loaded(text) == scorer(text)
+    in_memory = DenseNgramScorer.load(tmp_path / "model.v1", mmap=False)
+    assert not isinstance(in_memory.table, np.memmap)
+
+
+def test_scorer_load_rejects_inconsistent_table(tmp_path: Path) -> None:
+    NgramScorer({"AB": 1, "BA": 1}).save(tmp_path / "model")
+    np.save(tmp_path / "model.npy", np.zeros(3))
+    with pytest.raises(ValueError):
+        DenseNgramScorer.load(tmp_path / "model")
+
+
+def test_load_scorer_compiles_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(CACHE_ENV, str(tmp_path))
+    first = load_scorer.__wrapped__(ENGLISH, "bigrams.txt")
+    assert not isinstance(first.table, np.memmap)
+    assert len(list(tmp_path.glob("ngrams/*.npy"))) == 1
+    second = load_scorer.__wrapped__(ENGLISH, "bigrams.txt")
+    assert isinstance(second.table, np.memmap)
+    assert second("ATTACKATDAWN") == pytest.approx(bigramscore("ATTACKATDAWN"))
+
+
+def test_load_scorer_without_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(CACHE_ENV, "")
+    monkeypatch.chdir(tmp_path)
+    scorer = load_scorer.__wrapped__(ENGLISH, "bigrams.txt")
+    assert not isinstance(scorer.table, np.memmap)
+    assert not list(tmp_path.iterdir())
+
+
+def test_language_models_are_module_attributes() -> None:
+    assert compare.quadgramscore is quadgramscore
+    assert compare.quadgrams["TION"] > 0
+    with pytest.raises(AttributeError):
+        compare.fivegramscore  # noqa: B018
+
+
+def test_missing_language_model_is_attribute_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(compare._GRAMS, "pentagrams", "pentagrams-missing.txt")
+    assert not hasattr(compare, "pentagrams")
+    assert getattr(compare, "pentagrams", None) is None
+    with pytest.raises(AttributeError) as excinfo:
+        compare.pentagrams  # noqa: B018
+    assert isinstance(excinfo.value.__cause__, OSError)
+
+
+def test_load_scorer_unwritable_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # a regular file where the cache root should be cannot hold a cache
+    blocked = tmp_path / "cache"
+    blocked.write_text("")
+    monkeypatch.setenv(CACHE_ENV, str(blocked))
+    scorer = load_scorer.__wrapped__(ENGLISH, "bigrams.txt")
+    assert not isinstance(scorer.table, np.memmap)
+    assert scorer("ATTACKATDAWN") == pytest.approx(bigramscore("ATTACKATDAWN"))
+    assert list(tmp_path.iterdir()) == [blocked]
@@ -0,0 +1,90 @@
+import random
+from collections.abc import Callable
+from contextlib import redirect_stdout
+from io import StringIO
+
+import numpy as np
+import pytest
+
+from aldegonde.stats.context import TextAnalysis
+from aldegonde.stats.ioc import nioc, print_ioc_statistics
+from aldegonde.stats.isomorph import isomorph_distribution, print_isomorph_statistics
+from aldegonde.stats.kappa import doublets, kappa_spectrum, print_kappa_statistics
+from aldegonde.stats.ngrams import ngram_distribution
+from aldegonde.stats.repeats import print_repeat_positions, print_repeat_statistics
+
+
+def _text(size: int = 400, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [rng.choice("AAABBCDEFG") for _ in range(size)]
+
+
+def _printed(function: Callable[..., object], *args: object, **kwargs: object) -> str:
+    out = StringIO()
+    with redirect_stdout(out):
+        function(*args, **kwargs)
+    return out.getvalue()
+
+
+def test_structures_match_plain_functions() -> None:
+    text = _text()
+    analysis = TextAnalysis(text)
+    assert analysis.ngram_distribution(2, 1) == ngram_distribution(text, 2, 1)
+    assert analysis.nioc(7, 3, 0) == nioc(text, 7, 3, 0)
+    assert analysis.doublets(5, 2) == doublets(text, 5, 2)[0]
+    assert analysis.isomorph_distribution(4) == isomorph_distribution(text, 4)
+    spectrum = analysis.kappa_spectrum(50, 2)
+    assert np.array_equal(spectrum.counts, kappa_spectrum(text, 50, 2).counts)
+    smaller = analysis.kappa_spectrum(10, 2)
+    assert np.array_equal(smaller.counts, spectrum.counts[:11])
+    assert analysis.repeat_index() is analysis.repeat_index()
+
+
+def test_cache_hits_and_invalidation() -> None:
+    analysis = TextAnalysis(_text())
+    analysis.ngram_distribution(2)
+    analysis.ngram_distribution(2)
+    info = analysis.cache_info()
+    assert info.hits == 1
+    assert info.nbytes == analysis.nbytes > 0
+    analysis.invalidate("ngram_distribution")
+    assert analysis.cache_info().entries == 1  # the encoded text
+    analysis.text = _text(seed=1)
+    assert analysis.cache_info().entries == 0
+    assert analysis.nbytes == 0
+    assert analysis.ngram_distribution(2) == ngram_distribution(_text(seed=1), 2)
+
+
+def test_memory_cap_evicts_least_recently_used() -> None:
+    analysis = TextAnalysis(_text(2000), max_bytes=40_000)
+    first = analysis.repeat_index()
+    assert analysis.nbytes <= 40_000
+    analysis.kappa_spectrum(1500)
+    analysis.doublets(3)
+    assert analysis.nbytes <= 40_000
+    assert analysis.repeat_index() is not first
+    tiny = TextAnalysis(_text(), max_bytes=10)
+    assert tiny.ngram_distribution(1) == ngram_distribution(_text(), 1)
+    assert tiny.cache_info().entries == 0
+
+
+@pytest.mark.parametrize(
+    ("function", "kwargs"),
+    [
+        (print_ioc_statistics, {"alphabetsize": 7}),
+        (print_kappa_statistics, {"maximum": 20}),
+        (print_repeat_statistics, {"minimum": 2, "maximum": 5}),
+        (print_repeat_positions, {"minimum": 3, "maximum": 5}),
+        (print_isomorph_statistics, {}),
+    ],
+)
+def test_print_functions_share_analysis(
+    function: Callable[..., object], kwargs: dict[str, object]
+) -> None:
+    text = _text(300)
+    analysis = TextAnalysis(text)
+    random.seed(0)
+    expected = _printed(function, text, **kwargs)
+    random.seed(0)
+    assert _printed(function, text, analysis=analysis, **kwargs) == expected
+    assert analysis.cache_info().misses > 0
@@ -0,0 +1,146 @@
+import random
+from collections.abc import Callable, Sequence
+
+import numpy as np
+import pytest
+
+from aldegonde.analysis.delta import DeltaOp, delta, delta2
+from aldegonde.exceptions import AlphabetError
+from aldegonde.stats.encoded import Alphabet, EncodedText
+from aldegonde.stats.entropy import shannon_entropy
+from aldegonde.stats.ioc import ioc, nioc
+from aldegonde.stats.isomorph import isomorph, isomorph_distribution
+from aldegonde.stats.kappa import doublets, kappa
+from aldegonde.stats.mioc import mioc
+from aldegonde.stats.ngrams import ngram_distribution, ngram_positions
+from aldegonde.stats.repeats import repeat_distribution
+
+ALPHA = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _text(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return "".join(rng.choice("EEETTAOINSHRDLU") for _ in range(size))
+
+
+def test_alphabet() -> None:
+    alphabet = Alphabet("HELLO")
+    assert alphabet.symbols == ["H", "E", "L", "O"]
+    assert alphabet.size == 4
+    assert alphabet.dtype is np.uint8
+    assert alphabet.encode("LOL").tolist() == [2, 3, 2]
+    assert alphabet.decode([0, 1]) == ["H", "E"]
+    assert Alphabet(range(300)).dtype is np.uint16
+    with pytest.raises(AlphabetError):
+        alphabet.encode("HELP")
+
+
+def test_encoded_text_is_a_sequence() -> None:
+    text = EncodedText("ATTACKATDAWN", ALPHA)
+    assert len(text) == 12
+    assert text[1] == "T"
+    assert list(text) == list("ATTACKATDAWN")
+    assert isinstance(text[2:5], EncodedText)
+    assert str(text[2:5]) == "TAC"
+    assert str(EncodedText(list("ABC"))[1:]) == str(["B", "C"])
+    assert str(EncodedText(tuple("ABC"))[1:]) == str(("B", "C"))
+    assert str(EncodedText(tuple("ABC"))[2:]) == str(("C",))
+    assert text == EncodedText("ATTACKATDAWN", Alphabet(ALPHA))
+
+
+@pytest.mark.parametrize(("length", "cut"), [(1, 0), (2, 0), (2, 1), (2, 2), (3, 2)])
+def test_fast_paths_match_sequences(length: int, cut: int) -> None:
+    plain, other = _text(500), _text(300, seed=1)
+    encoded, encoded_other = EncodedText(plain, ALPHA), EncodedText(other, ALPHA)
+    assert ngram_distribution(encoded, length, cut) == ngram_distribution(
+        plain, length, cut
+    )
+    assert list(ngram_distribution(encoded, length, cut)) == list(
+        ngram_distribution(plain, length, cut)
+    )
+    assert ioc(encoded, length, cut) == ioc(plain, length, cut)
+    assert nioc(encoded, 26, length, cut) == nioc(plain, 26, length, cut)
+    assert mioc(encoded, encoded_other, length, cut) == pytest.approx(
+        mioc(plain, other, length, cut)
+    )
+
+
+@pytest.mark.parametrize("container", [str, list, tuple])
+@pytest.mark.parametrize(("length", "cut"), [(1, 0), (2, 0), (3, 1)])
+def test_fast_path_keys_match_sequences(
+    container: Callable[[str], Sequence[str]], length: int, cut: int
+) -> None:
+    plain = container(_text(200, seed=5))
+    encoded = EncodedText(plain)
+    assert list(ngram_distribution(encoded, length, cut).items()) == list(
+        ngram_distribution(plain, length, cut).items()
+    )
+    assert list(ngram_positions(encoded, length, cut).items()) == list(
+        ngram_positions(plain, length, cut).items()
+    )
+    assert repeat_distribution(encoded, length, cut) == repeat_distribution(
+        plain, length, cut
+    )
+    alphabet = encoded.alphabet.symbols
+    assert ngram_distribution(delta(encoded, alphabet), length) == ngram_distribution(
+        delta(plain, alphabet), length
+    )
+
+
+@pytest.mark.parametrize("length", [1, 2, 4])
+def test_kappa_fast_path(length: int) -> None:
+    plain = _text(300)
+    encoded = EncodedText(plain)
+    for skip in (0, 1, 5, 296, 299, 400):
+        assert doublets(encoded, skip, length) == doublets(plain, skip, length)
+        assert kappa(encoded, skip, length) == kappa(plain, skip, length)
+
+
+def test_entropy_and_isomorph_fast_paths() -> None:
+    plain = _text(400)
+    encoded = EncodedText(plain)
+    assert shannon_entropy(encoded) == pytest.approx(shannon_entropy(plain))
+    assert isomorph(EncodedText("ATTACK")) == isomorph("ATTACK") == "ABBACD"
+    for length in (1, 3, 6):
+        expected = isomorph_distribution(plain, length)
+        assert isomorph_distribution(encoded, length) == expected
+    assert isomorph_distribution(EncodedText("AB"), 3) == {}
+
+
+@pytest.mark.parametrize("plain", ["AAAAAA", "A", "ABABAB", _text(300, seed=4)])
+def test_entropy_matches_sequence_path(
+    plain: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    expected = shannon_entropy(plain)
+    printed = capsys.readouterr().out
+    assert shannon_entropy(EncodedText(plain)) == pytest.approx(expected)
+    assert capsys.readouterr().out == printed
+    assert "-0.000" not in printed
+
+
+def test_ngram_ids_beyond_int64() -> None:
+    """N-grams too long for base-|A| codes are keyed by their bytes."""
+    rng = random.Random(2)
+    plain = [rng.randrange(5) for _ in range(400)]
+    encoded = EncodedText(plain, range(1000))
+    assert ngram_distribution(encoded, 8) == ngram_distribution(plain, 8)
+    assert mioc(encoded, encoded[100:], 8) == pytest.approx(mioc(plain, plain[100:], 8))
+
+
+@pytest.mark.parametrize("op", list(DeltaOp))
+def test_delta_fast_path(op: DeltaOp) -> None:
+    alphabet = "ABCDE"
+    plain = "".join(random.Random(3).choice("BCDE") for _ in range(50))
+    encoded = EncodedText(plain, alphabet)
+    for skip in (1, 3):
+        result = delta(encoded, alphabet, skip, op)
+        assert isinstance(result, EncodedText)
+        assert list(result) == delta(plain, alphabet, skip, op)
+    if op not in (DeltaOp.DIV, DeltaOp.RDIV):
+        assert list(delta2(encoded, alphabet, 2, op)) == delta2(plain, alphabet, 2, op)
+
+
+def test_delta_fast_path_division_error() -> None:
+    encoded = EncodedText("BAB", "ABCDE")
+    with pytest.raises(ValueError, match="Division not defined"):
+        delta(encoded, "ABCDE", op=DeltaOp.DIV)
@@ -1,4 +1,8 @@
-from aldegonde.stats.ioc import ioc, ioc2, ioc3, ioc4
+import random
+
+import pytest
+
+from aldegonde.stats.ioc import ioc, ioc2, ioc3, ioc4, sliding_window_ioc
 
 nils = "A" * 300
 ones = "B" * 300
@@ -60,3 +64,24 @@ def test_ioc4_uniform() -> None:
     assert ioc4(nils, cut=1) == 1.0
     assert ioc4(ones, cut=2) == 1.0
     assert ioc4(nils, cut=2) == 1.0
+
+
+@pytest.mark.parametrize(
+    ("length", "cut", "window", "step"),
+    [(1, 0, 50, 1), (2, 0, 37, 3), (2, 1, 40, 1), (3, 2, 31, 2), (3, 3, 45, 5)],
+)
+def test_sliding_window_ioc_matches_ioc(
+    length: int, cut: int, window: int, step: int
+) -> None:
+    rng = random.Random(window)
+    text = "".join(rng.choice("AAAABBCDE") for _ in range(300))
+    expected = [
+        ioc(text[i : i + window], length=length, cut=cut)
+        for i in range(0, len(text) - window + 1, step)
+    ]
+    values = sliding_window_ioc(text, length=length, cut=cut, window=window, step=step)
+    assert values.tolist() == pytest.approx(expected)
+
+
+def test_sliding_window_ioc_uniform() -> None:
+    assert sliding_window_ioc(ones, window=20).tolist() == [1.0] * 281
@@ -1,6 +1,16 @@
 """tests for doublets.py."""
 
-from aldegonde.stats.isomorph import isomorph, isomorph_distribution
+import random
+import statistics
+
+import pytest
+
+from aldegonde.stats.isomorph import (
+    isomorph,
+    isomorph_distribution,
+    isomorph_statistics,
+    random_isomorph_statistics,
+)
 
 
 def test_isomorph() -> None:
@@ -19,3 +29,24 @@ def test_all_isomorphs() -> None:
         "AABC": 1,
         "ABCD": 1,
     }
+
+
+def test_random_isomorph_statistics() -> None:
+    distincts = []
+    duplicates = []
+    for i in range(10):
+        rng = random.Random(7 + i)
+        sample = [rng.randrange(0, 5) for _ in range(200)]
+        distinct, duplicate = isomorph_statistics(isomorph_distribution(sample, 4))
+        distincts.append(distinct)
+        duplicates.append(duplicate)
+    assert random_isomorph_statistics(
+        200, 4, samples=10, alphabetlen=5, seed=7
+    ) == pytest.approx(
+        (
+            statistics.mean(distincts),
+            statistics.stdev(distincts),
+            statistics.mean(duplicates),
+            statistics.stdev(duplicates),
+        )
+    )
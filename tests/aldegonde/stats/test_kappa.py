@@ -1,6 +1,18 @@
 """Tests for kappa analysis including multigraphic kappa."""
 
-from aldegonde.stats.kappa import doublets, kappa, kappa2, kappa3, kappa4, triplets
+import random
+
+import pytest
+
+from aldegonde.stats.kappa import (
+    doublets,
+    kappa,
+    kappa2,
+    kappa3,
+    kappa4,
+    kappa_spectrum,
+    triplets,
+)
 
 
 def test_kappa() -> None:
@@ -141,3 +153,31 @@ def test_kappa_empty_and_short_texts() -> None:
     # Text shorter than skip + length
     assert kappa("AB", skip=3, length=1) == 0.0
     assert kappa("ABC", skip=2, length=2) == 0.0
+
+
+@pytest.mark.parametrize("length", [1, 2, 3, 5])
+def test_kappa_spectrum_matches_doublets(length: int) -> None:
+    rng = random.Random(length)
+    # a skewed alphabet exercises both the FFT and the pairwise paths
+    text = "".join(rng.choice("EEEEEEEETTTAAB" + "XYZQ") for _ in range(400))
+    spectrum = kappa_spectrum(text, length=length)
+    assert len(spectrum.counts) == len(text) - length + 1
+    for skip in range(1, len(spectrum.counts)):
+        positions, comparisons = doublets(text, skip, length)
+        assert spectrum.counts[skip] == len(positions)
+        assert spectrum.comparisons[skip] == comparisons
+        assert spectrum.kappa[skip] == pytest.approx(kappa(text, skip, length))
+
+
+def test_kappa_spectrum_max_skip() -> None:
+    spectrum = kappa_spectrum("ABCABCABCXXX", max_skip=20)
+    assert len(spectrum.counts) == 21
+    assert spectrum.counts[3] == 6
+    assert spectrum.kappa[3] == 2 / 3
+    assert spectrum.counts[15:].tolist() == [0] * 6
+    assert spectrum.kappa[15:].tolist() == [0.0] * 6
+
+
+def test_kappa_spectrum_empty() -> None:
+    assert kappa_spectrum("").counts.tolist() == [0]
+    assert kappa_spectrum("AB", max_skip=3, length=3).kappa.tolist() == [0.0] * 4
@@ -0,0 +1,175 @@
+import random
+from collections.abc import Sequence
+from functools import partial
+
+import numpy as np
+import pytest
+
+from aldegonde.stats.ioc import nioc
+from aldegonde.stats.isomorph import isomorph_distribution, isomorph_statistics
+from aldegonde.stats.kappa import doublets, kappa
+from aldegonde.stats.kernels import (
+    isomorph_distincts,
+    isomorph_duplicates,
+    kappa_counts,
+    kappa_values,
+    kernel_of,
+    nioc_grid,
+    repeat_counts,
+    with_kernel,
+)
+from aldegonde.stats.nulls import NullModel, doublet_shuffle, shuffle
+from aldegonde.stats.repeats import _repeat_count
+from aldegonde.stats.resample import family_pvalue, monte_carlo, monte_carlo_map
+
+
+def _batch(rows: int, length: int, alphabet: int, seed: int = 0) -> np.ndarray:
+    """Low-entropy random rows so that repeats and isomorphs actually occur."""
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, alphabet, size=(rows, length))
+
+
+@pytest.mark.parametrize("length", [1, 2, 3])
+def test_kappa_counts_match_doublets(length: int) -> None:
+    batch = _batch(5, 80, 4)
+    skips = [0, 1, 2, 7, 78, 79, 200]
+    counts = kappa_counts(batch, skips, length=length)
+    for row, text in zip(counts, batch.tolist()):
+        expected = [
+            len(doublets(text, skip, length)[0]) if skip else 0 for skip in skips
+        ]
+        assert row.tolist() == expected
+
+
+def test_kappa_values_match_kappa() -> None:
+    batch = _batch(5, 60, 3)
+    skips = list(range(1, 65))
+    values = kappa_values(batch, skips, length=2)
+    for row, text in zip(values, batch.tolist()):
+        assert row.tolist() == pytest.approx(
+            [kappa(text, skip, length=2) for skip in skips]
+        )
+
+
+def test_nioc_grid_matches_nioc() -> None:
+    batch = _batch(4, 90, 5)
+    cells = [(1, 0), (2, 0), (2, 1), (2, 2), (3, 0), (3, 3)]
+    keys = list(range(len(cells)))
+    grid = nioc_grid(batch, keys, cells=cells, alphabetsize=5)
+    for row, text in zip(grid, batch.tolist()):
+        expected = [nioc(text, 5, length, cut).nioc for length, cut in cells]
+        assert row.tolist() == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("cut", [0, 1, 2])
+def test_repeat_counts_match_repeat_count(cut: int) -> None:
+    batch = _batch(5, 120, 3)
+    lengths = [2, 3, 4, 6]
+    counts = repeat_counts(batch, lengths, cut=cut)
+    for row, text in zip(counts, batch.tolist()):
+        assert row.tolist() == [_repeat_count(text, length, cut) for length in lengths]
+
+
+def test_repeat_counts_wide_alphabet() -> None:
+    """N-grams too long for int64 codes fall back to row-wise unique ids."""
+    batch = _batch(3, 200, 2) * 100_000
+    counts = repeat_counts(batch, [5])
+    for row, text in zip(counts, batch.tolist()):
+        assert row.tolist() == [_repeat_count(text, 5, 0)]
+
+
+def test_isomorph_kernels_match_isomorph_statistics() -> None:
+    batch = _batch(4, 100, 4)
+    lengths = [3, 4, 6, 18, 120]
+    distincts = isomorph_distincts(batch, lengths)
+    duplicates = isomorph_duplicates(batch, lengths)
+    for distinct, duplicate, text in zip(distincts, duplicates, batch.tolist()):
+        expected = [
+            isomorph_statistics(isomorph_distribution(text, length))
+            for length in lengths
+        ]
+        assert list(zip(distinct.tolist(), duplicate.tolist())) == expected
+
+
+def test_with_kernel() -> None:
+    def statistic(sample: Sequence[object]) -> float:
+        return 0.0
+
+    assert kernel_of(statistic) is None
+    assert with_kernel(statistic, kappa_values) is statistic
+    assert kernel_of(statistic) is kappa_values
+
+
+def _kappa_profile(sample: Sequence[object], skips: list[int]) -> dict[int, float]:
+    return {skip: kappa(sample, skip) for skip in skips}
+
+
+def _doublet_count(sample: Sequence[object]) -> float:
+    return float(len(doublets(sample, 1)[0]))
+
+
+def _doublet_kernel(batch: np.ndarray) -> np.ndarray:
+    counts: np.ndarray = kappa_counts(batch, [1])[:, 0]
+    return counts
+
+
+def test_harness_uses_kernel_with_identical_results() -> None:
+    rng = random.Random(3)
+    text = [rng.choice("ABCDE") for _ in range(150)]
+    skips = list(range(1, 12))
+    plain = partial(_kappa_profile, skips=skips)
+    batched = with_kernel(partial(_kappa_profile, skips=skips), kappa_values)
+
+    for kwargs in ({}, {"chunksize": 7}, {"executor": "thread", "workers": 2}):
+        expected = monte_carlo_map(
+            plain, shuffle, text, keys=skips, trials=40, **kwargs
+        )
+        results = monte_carlo_map(
+            batched, shuffle, text, keys=skips, trials=40, **kwargs
+        )
+        for skip in skips:
+            assert results[skip].null_mean == pytest.approx(expected[skip].null_mean)
+            assert results[skip].p_upper == expected[skip].p_upper
+
+    expected_family = family_pvalue(plain, shuffle, text, keys=skips[1:], trials=40)
+    family = family_pvalue(batched, shuffle, text, keys=skips[1:], trials=40)
+    assert family == expected_family
+
+    null: NullModel[str] = doublet_shuffle(0.1)
+    scalar = with_kernel(partial(_doublet_count), _doublet_kernel)
+    expected_scalar = monte_carlo(_doublet_count, null, text, trials=30, seed=5)
+    result = monte_carlo(scalar, null, text, trials=30, seed=5)
+    assert result == expected_scalar
+
+
+def test_harness_falls_back_on_ragged_surrogates() -> None:
+    def ragged(data: Sequence[str], rng: random.Random) -> list[str]:
+        return list(data[: rng.randrange(2, len(data))])
+
+    text = list("ABABCABCAB")
+    batched = with_kernel(partial(_kappa_profile, skips=[1, 2]), kappa_values)
+    expected = monte_carlo_map(
+        partial(_kappa_profile, skips=[1, 2]), ragged, text, keys=[1, 2], trials=20
+    )
+    results = monte_carlo_map(batched, ragged, text, keys=[1, 2], trials=20)
+    assert results[2].null_mean == pytest.approx(expected[2].null_mean)
+
+
+def _repeat_profile(sample: Sequence[object], lengths: list[int]) -> dict[int, float]:
+    return {length: float(_repeat_count(sample, length, 0)) for length in lengths}
+
+
+def _string_shuffle(data: Sequence[str], rng: random.Random) -> str:
+    return "".join(shuffle(data, rng))
+
+
+def test_harness_stacks_string_surrogates() -> None:
+    text = "ABCABDABCAADBCAB" * 4
+    lengths = [2, 3]
+    plain = partial(_repeat_profile, lengths=lengths)
+    batched = with_kernel(
+        partial(_repeat_profile, lengths=lengths), partial(repeat_counts, cut=0)
+    )
+    expected = monte_carlo_map(plain, _string_shuffle, text, keys=lengths, trials=30)
+    results = monte_carlo_map(batched, _string_shuffle, text, keys=lengths, trials=30)
+    assert results == expected
@@ -1,10 +1,22 @@
+import random
+
+import numpy as np
+import pytest
+
+from aldegonde.exceptions import InvalidInputError
+from aldegonde.stats.encoded import EncodedText
 from aldegonde.stats.ngrams import (
+    decode_ngram,
     iterngram_positions,
     iterngrams,
+    ngram_code_distribution,
+    ngram_codes,
+    ngram_counts,
     ngram_distribution,
     ngram_positions,
     ngrams,
 )
+from aldegonde.stats.repeats import _repeat_count
 
 uniq = [0, 1, 2, 3, 4]
 string = "ABCDEF"
@@ -55,3 +67,41 @@ def test_iterngram_positions() -> None:
     ]
     assert list(iterngram_positions("ABCD", length=2, cut=1)) == [(0, "AB"), (2, "CD")]
     assert list(iterngram_positions(uniq, length=4, cut=4)) == []
+
+
+@pytest.mark.parametrize(("length", "cut"), [(1, 0), (2, 0), (3, 0), (2, 1), (3, 3)])
+def test_ngram_codes(length: int, cut: int) -> None:
+    text = EncodedText("ABRACADABRA", "ABCDR")
+    codes = ngram_codes(text, length, cut)
+    assert codes.dtype == np.int64
+    grams = list(iterngrams("ABRACADABRA", length, cut))
+    assert len(codes) == len(grams)
+    for code, gram in zip(codes.tolist(), grams):
+        assert "".join(decode_ngram(code, length, text.alphabet)) == gram
+
+
+def test_ngram_code_distributions() -> None:
+    rng = random.Random(4)
+    plain = "".join(rng.choice("ABCDE") for _ in range(300))
+    text = EncodedText(plain, "ABCDE")
+    counts = ngram_counts(text, 2)
+    assert counts.shape == (25,)
+    codes, distinct = ngram_code_distribution(text, 2)
+    assert counts[codes].tolist() == distinct.tolist()
+    expected = ngram_distribution(plain, 2)
+    for code, count in zip(codes.tolist(), distinct.tolist()):
+        assert expected["".join(decode_ngram(code, 2, text.alphabet))] == count
+    assert ngram_positions(text, 3, 2) == ngram_positions(plain, 3, 2)
+    for length in (2, 5):
+        assert _repeat_count(text, length, 0) == _repeat_count(plain, length, 0)
+
+
+def test_ngram_codes_limits() -> None:
+    text = EncodedText(list(range(300)))
+    assert len(ngram_codes(text, 7)) == 294
+    with pytest.raises(InvalidInputError):
+        ngram_codes(text, 8)
+    with pytest.raises(InvalidInputError):
+        ngram_codes(text, 0)
+    with pytest.raises(InvalidInputError):
+        ngram_counts(text, 3)
@@ -2,11 +2,20 @@ import random
 import statistics
 from collections import Counter
 
+import numpy as np
 import pytest
 
 from aldegonde.exceptions import InvalidInputError
 from aldegonde.stats import kappa
-from aldegonde.stats.nulls import doublet_shuffle, no_doublet_shuffle, shuffle
+from aldegonde.stats.nulls import (
+    doublet_shuffle,
+    doublet_shuffle_matrix,
+    no_doublet_shuffle,
+    no_doublet_shuffle_matrix,
+    shuffle,
+    shuffle_matrix,
+    stacked,
+)
 
 
 def _doublet_rate(seq: list[object]) -> float:
@@ -93,3 +102,68 @@ def test_no_doublet_shuffle_has_no_long_range_structure() -> None:
             kappa(shuffle(data, random.Random(t)), skip=skip) for t in range(30)
         )
         assert abs(no_doublet - plain) < 0.01, f"skip {skip}: {no_doublet} vs {plain}"
+
+
+def test_shuffle_matrix_rows_are_permutations() -> None:
+    data = np.array([0, 0, 1, 1, 1, 2, 3, 3])
+    out = shuffle_matrix(data, 50, np.random.default_rng(0))
+    assert out.shape == (50, len(data))
+    assert (np.sort(out, axis=1) == np.sort(data)).all()
+    assert len({tuple(row) for row in out}) > 1
+
+
+def test_shuffle_matrix_batches_concatenate() -> None:
+    data = np.arange(12)
+    whole = shuffle_matrix(data, 10, np.random.default_rng(3))
+    rng = np.random.default_rng(3)
+    parts = np.vstack([shuffle_matrix(data, 4, rng), shuffle_matrix(data, 6, rng)])
+    assert (whole == parts).all()
+
+
+def test_stacked_null_rows_follow_model() -> None:
+    data = np.array([0, 0, 0, 1, 1, 1, 2, 2])
+    out = stacked(no_doublet_shuffle)(data, 20, np.random.default_rng(1))
+    assert out.shape == (20, len(data))
+    assert (np.sort(out, axis=1) == np.sort(data)).all()
+    assert not (out[:, 1:] == out[:, :-1]).any()
+
+
+def test_no_doublet_shuffle_matrix_has_no_doublets() -> None:
+    data = np.array([0] * 10 + [1] * 6 + [2] * 3)
+    out = no_doublet_shuffle_matrix(data, 200, np.random.default_rng(0))
+    assert (np.sort(out, axis=1) == np.sort(data)).all()
+    assert not (out[:, 1:] == out[:, :-1]).any()
+
+
+def test_no_doublet_shuffle_matrix_raises_when_infeasible() -> None:
+    with pytest.raises(InvalidInputError):
+        no_doublet_shuffle_matrix(np.array([0, 0, 0, 1]), 5, np.random.default_rng(0))
+
+
+def test_doublet_shuffle_matrix_matches_sequential_sampler() -> None:
+    """Same law as doublet_shuffle: compare doublet rate and symbol placement."""
+    source = random.Random(11)
+    data = [source.randrange(8) for _ in range(120)]
+    trials = 400
+    model = doublet_shuffle(0.03)
+    sequential = np.array([model(data, random.Random(i)) for i in range(trials)])
+    batched = doublet_shuffle_matrix(0.03)(
+        np.array(data), trials, np.random.default_rng(0)
+    )
+    assert (np.sort(batched, axis=1) == np.sort(data)).all()
+
+    def doublet_rates(rows: np.ndarray) -> np.ndarray:
+        return (rows[:, 1:] == rows[:, :-1]).mean(axis=1)
+
+    rates_seq, rates_batch = doublet_rates(sequential), doublet_rates(batched)
+    se = np.sqrt(rates_seq.var() / trials + rates_batch.var() / trials)
+    assert abs(rates_seq.mean() - rates_batch.mean()) < 4 * se
+    # the fill is sequential, so check where each symbol tends to land too
+    for symbol in range(8):
+        seq_pos = np.nonzero(sequential == symbol)[1].mean()
+        batch_pos = np.nonzero(batched == symbol)[1].mean()
+        assert abs(seq_pos - batch_pos) < 3.0
+    # and how often the first slot holds each symbol
+    first_seq = np.bincount(sequential[:, 0], minlength=8) / trials
+    first_batch = np.bincount(batched[:, 0], minlength=8) / trials
+    assert np.abs(first_seq - first_batch).max() < 0.08
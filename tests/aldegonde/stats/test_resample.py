@@ -2,10 +2,14 @@ import random
 import statistics
 from collections.abc import Mapping, Sequence
 
+import numpy as np
 import pytest
 
 from aldegonde.exceptions import InvalidInputError
+from aldegonde.stats.nulls import shuffle_matrix
 from aldegonde.stats.resample import (
+    batch_monte_carlo,
+    batch_monte_carlo_map,
     family_pvalue,
     monte_carlo,
     monte_carlo_map,
@@ -120,3 +124,84 @@ def test_family_pvalue_custom_reduce_has_no_key() -> None:
         seed=0,
     )
     assert fam.key is None
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+@pytest.mark.parametrize(("workers", "chunksize"), [(1, None), (3, 7), (2, 1000)])
+def test_executors_match_serial_exactly(
+    executor: str, workers: int, chunksize: int | None
+) -> None:
+    pooled = {"executor": executor, "workers": workers, "chunksize": chunksize}
+    assert monte_carlo(_scalar, _rng_null, [0.5], trials=60, seed=4) == monte_carlo(
+        _scalar, _rng_null, [0.5], trials=60, seed=4, **pooled
+    )
+    assert monte_carlo_map(
+        _stat_map, _rng_null, [0.5], keys=[1, 2], trials=60, seed=4
+    ) == monte_carlo_map(
+        _stat_map, _rng_null, [0.5], keys=[1, 2], trials=60, seed=4, **pooled
+    )
+    assert family_pvalue(
+        _stat_map, _rng_null, [0.9], keys=[1, 2], trials=60, seed=4
+    ) == family_pvalue(
+        _stat_map, _rng_null, [0.9], keys=[1, 2], trials=60, seed=4, **pooled
+    )
+
+
+def test_monte_carlo_rejects_unknown_executor() -> None:
+    with pytest.raises(InvalidInputError):
+        monte_carlo(_scalar, _rng_null, [0.5], trials=10, executor="gpu")  # type: ignore[arg-type]
+
+
+def test_monte_carlo_rejects_bad_chunksize() -> None:
+    with pytest.raises(InvalidInputError):
+        monte_carlo(_scalar, _rng_null, [0.5], trials=10, executor="thread", chunksize=0)
+
+
+def _doublets_batch(batch: np.ndarray) -> np.ndarray:
+    return (batch[:, 1:] == batch[:, :-1]).sum(axis=1)
+
+
+def _skips_batch(batch: np.ndarray) -> np.ndarray:
+    return np.stack(
+        [(batch[:, s:] == batch[:, :-s]).sum(axis=1) for s in (1, 2)], axis=1
+    )
+
+
+def test_batch_monte_carlo_matches_manual_draws() -> None:
+    observed = np.array([0, 0, 1, 1, 2, 2, 3, 3, 4, 4])
+    result = batch_monte_carlo(
+        _doublets_batch, shuffle_matrix, observed, trials=100, seed=5, batch_size=30
+    )
+    values = _doublets_batch(shuffle_matrix(observed, 100, np.random.default_rng(5)))
+    assert result.observed == 5.0
+    assert result.null_mean == pytest.approx(values.mean())
+    assert result.null_sd == pytest.approx(values.std(ddof=1))
+    assert result.p_upper == (int((values >= 5).sum()) + 1) / 101
+    assert result.p_upper < 0.05
+
+
+def test_batch_monte_carlo_is_batch_size_invariant() -> None:
+    observed = np.arange(20) % 7
+    first = batch_monte_carlo(
+        _doublets_batch, shuffle_matrix, observed, trials=50, seed=1, batch_size=7
+    )
+    second = batch_monte_carlo(
+        _doublets_batch, shuffle_matrix, observed, trials=50, seed=1, batch_size=50
+    )
+    assert first == second
+
+
+def test_batch_monte_carlo_map_columns_per_key() -> None:
+    observed = np.arange(30) % 5
+    result = batch_monte_carlo_map(
+        _skips_batch, shuffle_matrix, observed, keys=[1, 2], trials=200, seed=0
+    )
+    assert set(result) == {1, 2}
+    assert result[1].observed == 0.0
+    assert result[2].observed == 0.0
+    assert result[1].p_lower < 0.05
+
+
+def test_batch_monte_carlo_rejects_non_integer_observed() -> None:
+    with pytest.raises(InvalidInputError):
+        batch_monte_carlo(_doublets_batch, shuffle_matrix, [0.5, 0.25], trials=10)
@@ -0,0 +1,79 @@
+import random
+from collections import Counter, defaultdict
+
+import pytest
+
+from aldegonde.stats.ngrams import iterngram_positions
+from aldegonde.stats.suffix import RepeatIndex, suffix_array
+
+
+def _groups(text: str, length: int, cut: int) -> list[list[int]]:
+    positions: dict[str, list[int]] = defaultdict(list)
+    for index, gram in iterngram_positions(text, length=length, cut=cut):
+        positions[str(gram)].append(index)
+    return [v for v in positions.values() if len(v) > 1]
+
+
+def _text(seed: int, size: int = 300) -> str:
+    rng = random.Random(seed)
+    return "".join(rng.choice("AAABBC") for _ in range(size))
+
+
+def test_suffix_array_sorts_suffixes() -> None:
+    text = "MISSISSIPPI"
+    suffixes, lcp = suffix_array(text)
+    assert sorted(suffixes.tolist()) == list(range(len(text)))
+    for i in range(1, len(text)):
+        first, second = text[suffixes[i - 1] :], text[suffixes[i] :]
+        common = 0
+        while common < min(len(first), len(second)) and first[common] == second[common]:
+            common += 1
+        assert lcp[i] == common
+    assert suffix_array("")[0].tolist() == []
+
+
+@pytest.mark.parametrize("cut", [0, 1, 2, 3])
+def test_repeat_groups_and_counts(cut: int) -> None:
+    text = _text(cut)
+    index = RepeatIndex(text)
+    for length in range(1, 8):
+        if cut > length:
+            continue
+        expected = _groups(text, length, cut)
+        groups = index.repeat_groups(length, cut)
+        assert [group.tolist() for group in groups] == expected
+        assert index.repeat_count(length, cut) == len(expected)
+
+
+@pytest.mark.parametrize(("cut", "max_distance"), [(0, None), (0, 25), (2, 40)])
+def test_distance_spectrum_and_pairs(cut: int, max_distance: int | None) -> None:
+    text = _text(10 + cut, 200)
+    index = RepeatIndex(text)
+    for length in (1, 2, 4):
+        pairs = Counter[int]()
+        expected_pairs = []
+        for group in _groups(text, length, cut):
+            distances = [
+                second - first
+                for i, first in enumerate(group)
+                for second in group[i + 1 :]
+                if max_distance is None or second - first <= max_distance
+            ]
+            pairs.update(distances)
+            if distances:
+                expected_pairs.append((group, distances))
+        spectrum = index.distance_spectrum(length, cut, max_distance)
+        top = len(text) - length if max_distance is None else max_distance
+        assert spectrum.tolist() == [pairs[d] for d in range(top + 1)]
+        assert [
+            (positions.tolist(), distances.tolist())
+            for positions, distances in index.pair_distances(length, cut, max_distance)
+        ] == expected_pairs
+
+
+def test_maximal_repeats() -> None:
+    index = RepeatIndex("XABCYABCZABCQAB")
+    repeats = [
+        (length, positions.tolist()) for length, positions in index.maximal_repeats(2)
+    ]
+    assert repeats == [(3, [1, 5, 9]), (2, [1, 5, 9, 13])]
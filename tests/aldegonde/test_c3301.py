@@ -1,6 +1,9 @@
 import random
 from collections import Counter
 
+import numpy as np
+import pytest
+
 from aldegonde import c3301
 
 
@@ -30,6 +33,60 @@ def test_v2i() -> None:
     assert c3301.v2i(3) == 1
 
 
+def test_scalar_conversions_reject_unknown() -> None:
+    with pytest.raises(ValueError):
+        c3301.r2i("F")
+    with pytest.raises(ValueError):
+        c3301.r2v("ᛥ")
+    with pytest.raises(ValueError):
+        c3301.v2r(4)
+    with pytest.raises(ValueError):
+        c3301.v2i(113)
+
+
+def test_bulk_conversions() -> None:
+    runes = "".join(c3301.CICADA_ALPHABET) + "ᛋᚻᛖᚩᚷᛗᛡᚠ"
+    indices = c3301.runes_to_indices(runes)
+    assert indices.dtype == np.uint8
+    assert indices.tolist() == [c3301.r2i(r) for r in runes]
+    assert c3301.indices_to_runes(indices) == runes
+    assert c3301.indices_to_values(indices).tolist() == [c3301.r2v(r) for r in runes]
+    assert c3301.indices_to_values(range(29)).tolist() == list(c3301.CICADA_PRIMES)
+    assert len(c3301.runes_to_indices("")) == 0
+    assert c3301.indices_to_runes([]) == ""
+
+
+def test_code_points_to_indices() -> None:
+    points = [ord(c) for c in "ᚠ-ᛥᚢ\U0001f600ᛠ"] + [0x16A0 - 1, 0x1700]
+    indices = c3301.code_points_to_indices(points)
+    assert indices.dtype == np.uint8
+    assert indices.tolist() == [0, 255, 255, 1, 255, 28, 255, 255]
+    assert c3301.NOT_A_RUNE == 255
+
+
+@pytest.mark.parametrize("runes", ["ᚠ-ᚢ", "ᛥ", "ᚠ\U0001f600"])
+def test_runes_to_indices_rejects_other_characters(runes: str) -> None:
+    with pytest.raises(ValueError):
+        c3301.runes_to_indices(runes)
+
+
+def test_indices_out_of_range() -> None:
+    with pytest.raises(ValueError):
+        c3301.indices_to_runes([29])
+    with pytest.raises(ValueError):
+        c3301.indices_to_values([-1])
+
+
+@pytest.mark.parametrize("t", ["vigenere", "beaufort", "variantbeaufort"])
+def test_value_tr(t: str) -> None:
+    tr = c3301.valueTR(t)
+    for key in c3301.CICADA_ALPHABET:
+        for plaintext in c3301.CICADA_ALPHABET:
+            i, v = c3301.r2i(plaintext), c3301.r2v(key)
+            shift = {"vigenere": i + v, "beaufort": v - i, "variantbeaufort": i - v}
+            assert tr[key][plaintext] == c3301.i2r(shift[t] % 29)
+
+
 def test_low_doublet_null_preserves_length_and_alphabet() -> None:
     data = [i % 7 for i in range(200)]
     out = c3301.low_doublet_null()(data, random.Random(0))
@@ -67,3 +124,13 @@ def test_low_doublet_null_is_reproducible() -> None:
 
 def test_randomrunes_with_low_doublets_removed() -> None:
     assert not hasattr(c3301, "randomrunes_with_low_doublets")
+
+
+def test_missing_language_model_is_attribute_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(c3301._SCORERS, "pentagramscore", "pentagrams-missing.txt")
+    assert not hasattr(c3301, "pentagramscore")
+    with pytest.raises(AttributeError) as excinfo:
+        c3301.pentagramscore  # noqa: B018
+    assert isinstance(excinfo.value.__cause__, OSError)
@@ -0,0 +1,136 @@
+import re
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from aldegonde import c3301
+from aldegonde import corpus as corpus_module
+from aldegonde.cache import CACHE_ENV
+from aldegonde.corpus import UNITS, load_corpus, parse_corpus
+from aldegonde.exceptions import InvalidInputError
+
+LIBER_PRIMUS = Path(__file__).parents[2] / "data" / "page0-56.txt"
+
+SAMPLE = "ᚠᚢ-ᚦ/\nᚩᚱ-ᚳ.ᚷ&\n%\n(3)ᚹ-ᚻ$ᚾ-ᛁ§ᛄ-ᛇ/\n"
+
+
+def runes_only(text: str) -> str:
+    return "".join(c for c in text if c in c3301.CICADA_ALPHABET)
+
+
+def split_units(text: str, unit: str) -> list[str]:
+    return [runes_only(part) for part in re.split(f"[{re.escape(UNITS[unit])}]", text)]
+
+
+def test_parse_runes() -> None:
+    corpus = parse_corpus(SAMPLE.encode())
+    assert corpus.text() == runes_only(SAMPLE)
+    assert corpus.runes.dtype == np.uint8
+    assert corpus.runes.tolist() == [c3301.r2i(c) for c in runes_only(SAMPLE)]
+    assert len(corpus) == len(runes_only(SAMPLE))
+    encoded = SAMPLE.encode()
+    assert all(
+        encoded[offset:].decode(errors="ignore")[0] == rune
+        for offset, rune in zip(corpus.offsets.tolist(), corpus.text())
+    )
+
+
+@pytest.mark.parametrize("unit", list(UNITS))
+def test_units_match_split(unit: str) -> None:
+    corpus = parse_corpus(SAMPLE.encode())
+    assert corpus.strings(unit, keep_empty=True) == split_units(SAMPLE, unit)
+    assert corpus.strings(unit) == [s for s in split_units(SAMPLE, unit) if s]
+
+
+def test_units() -> None:
+    corpus = parse_corpus(SAMPLE.encode())
+    assert corpus.strings("word") == [
+        "ᚠᚢ",
+        "ᚦᚩᚱ",
+        "ᚳ",
+        "ᚷ",
+        "ᚹ",
+        "ᚻ",
+        "ᚾ",
+        "ᛁ",
+        "ᛄ",
+        "ᛇ",
+    ]
+    assert corpus.strings("page") == ["ᚠᚢᚦᚩᚱᚳᚷ", "ᚹᚻᚾᛁᛄᛇ"]
+    assert [u.tolist() for u in corpus.units("chapter")] == [
+        list(range(11)),
+        [11, 12],
+    ]
+    with pytest.raises(InvalidInputError):
+        corpus.units("sentence")
+
+
+def test_units_within_span() -> None:
+    corpus = parse_corpus(SAMPLE.encode())
+    assert corpus.span("segment", 0, 1) == (0, 9)
+    assert corpus.span("segment", 1) == (9, 13)
+    assert corpus.span("page", 5) == (13, 13)
+    start, stop = corpus.span("segment", 1, 2)
+    assert corpus.strings("word", start=start, stop=stop) == ["ᚾ", "ᛁ"]
+    assert corpus.strings("word", start=start, stop=stop, keep_empty=True) == [
+        "",
+        "ᚾ",
+        "ᛁ",
+        "",
+    ]
+    assert corpus.strings("line", start=start, stop=stop) == ["ᚾᛁ"]
+    start, stop = corpus.span("page", 0, 1)
+    assert corpus.strings("word", start=start, stop=stop) == corpus.strings("word")[:4]
+
+
+def test_parse_empty() -> None:
+    corpus = parse_corpus(b"")
+    assert len(corpus) == 0
+    assert corpus.units("word") == []
+
+
+def test_load_corpus_caches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(CACHE_ENV, str(tmp_path / "cache"))
+    source = tmp_path / "sample.txt"
+    source.write_text(SAMPLE, encoding="utf-8")
+    first = load_corpus(source)
+    assert len(list((tmp_path / "cache" / "corpus").iterdir())) == 1
+    second = load_corpus(source)
+    assert isinstance(second.runes, np.memmap)
+    assert second.text() == first.text() == runes_only(SAMPLE)
+    assert second.strings("line") == split_units(SAMPLE, "line")[:-1]
+
+
+def test_load_corpus_cache_key_follows_parser(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(CACHE_ENV, str(tmp_path / "cache"))
+    source = tmp_path / "sample.txt"
+    source.write_text(SAMPLE, encoding="utf-8")
+    load_corpus(source)
+    monkeypatch.setitem(UNITS, "word", "-")
+    assert load_corpus(source).strings("word") == ["ᚠᚢ", "ᚦᚩᚱ", "ᚳᚷᚹ", "ᚻᚾ", "ᛁᛄ", "ᛇ"]
+    monkeypatch.setattr(corpus_module, "CACHE_FORMAT", corpus_module.CACHE_FORMAT + 1)
+    load_corpus(source)
+    assert len(list((tmp_path / "cache" / "corpus").iterdir())) == 3
+
+
+def test_load_corpus_without_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(CACHE_ENV, str(tmp_path / "cache"))
+    source = tmp_path / "sample.txt"
+    source.write_text(SAMPLE, encoding="utf-8")
+    corpus = load_corpus(source, cache=False)
+    assert corpus.text() == runes_only(SAMPLE)
+    assert not (tmp_path / "cache").exists()
+
+
+def test_liber_primus(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(CACHE_ENV, str(tmp_path))
+    text = LIBER_PRIMUS.read_text(encoding="utf-8")
+    corpus = load_corpus(LIBER_PRIMUS)
+    assert corpus.runes.tolist() == [c3301.r2i(c) for c in runes_only(text)]
+    for unit in ("word", "line", "segment", "page"):
+        assert corpus.strings(unit, keep_empty=True) == split_units(text, unit)
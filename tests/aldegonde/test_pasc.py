@@ -1,4 +1,8 @@
+import numpy as np
+import pytest
+
 from aldegonde import masc, pasc
+from aldegonde.exceptions import CipherError
 
 ABC = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
@@ -263,3 +267,77 @@ Encipher the following Paul Brandt quote "Don’t let anyone tell you the sky is
     Plaintext:  dontlet anyonet ellyout heskyis thelimi twhenth erearef ootprin tsonthe moon
     Ciphertext: KFBIFIC EWQVIIC OSXRXNC SBLSNMQ LNDCSQJ LJEKIGI OVDDHIG YFANHMD LHJGKLF XFJG
 """
+
+
+def test_compiled_tr_matches_dict_lookup() -> None:
+    tr = pasc.quagmire4_tr(ABC, "PAULBRANDT", "BRANDT", "COUNTRY", "P")
+    compiled = pasc.compile_tr(tr)
+    for key, row in tr.items():
+        for e, c in row.items():
+            assert (
+                compiled.symbols[
+                    compiled.table[compiled.key_index[key], compiled.index[e]]
+                ]
+                == c
+            )
+
+
+def test_compiled_tr_integer_roundtrip() -> None:
+    compiled = pasc.compile_tr(pasc.beaufort_tr(ABC))
+    plaintext = compiled.encode("DEFENDTHEEASTWALLOFTHECASTLE")
+    keyword = compiled.encode_keyword("FORTIFICATION")
+    ciphertext = compiled.encrypt(plaintext, keyword)
+    assert "".join(compiled.decode(ciphertext)) == "CKMPVCPVWPIWUJOGIUAPVWRIWUUK"
+    assert (compiled.decrypt(ciphertext, keyword) == plaintext).all()
+
+
+def test_compiled_tr_partial_rows() -> None:
+    """Quagmire I only defines rows for the key letters."""
+    tr = pasc.quagmire1_tr(ABC, "PAULBRANDT", "BRANDT")
+    compiled = pasc.compile_tr(tr)
+    assert len(compiled.keys) == len(set("BRANDT"))
+    assert len(compiled.symbols) == len(ABC)
+
+
+def test_compiled_tr_ambiguous_inverse() -> None:
+    compiled = pasc.compile_tr({"A": {"X": "A", "Y": "A"}})
+    with pytest.raises(CipherError, match="ambiguous for key 'A'"):
+        _ = compiled.inverse
+
+
+def test_pasc_decrypt_unknown_symbol() -> None:
+    with pytest.raises(CipherError, match="Ciphertext symbol '1' not found"):
+        list(pasc.pasc_decrypt("HELLO1", "KEY", pasc.vigenere_tr(ABC)))
+
+
+def test_compiled_tr_decrypt_batch() -> None:
+    compiled = pasc.compile_tr(pasc.vigenere_tr(ABC))
+    ciphertext = compiled.encode("LXFOPVEFRNHR")
+    keywords = np.array(
+        [compiled.encode_keyword(k) for k in ("LEMON", "MELON", "AAAAA")]
+    )
+    plaintexts = compiled.decrypt_batch(ciphertext, keywords)
+    assert plaintexts.shape == (3, len(ciphertext))
+    assert "".join(compiled.decode(plaintexts[0])) == "ATTACKATDAWN"
+    for keyword, row in zip(keywords, plaintexts):
+        assert (compiled.decrypt(ciphertext, keyword) == row).all()
+
+
+def test_compile_tr_reuses_compiled_form() -> None:
+    tr = pasc.vigenere_tr(ABC)
+    compiled = pasc.compile_tr(tr)
+    assert pasc.compile_tr(tr) is compiled
+    assert pasc.compile_tr(compiled) is compiled
+    assert pasc.compile_tr(pasc.vigenere_tr(ABC)) is not compiled
+    plaintext = "ATTACKATDAWN"
+    ciphertext = "".join(pasc.pasc_encrypt(plaintext, "LEMON", tr))
+    assert "".join(pasc.pasc_encrypt(plaintext, "LEMON", compiled)) == ciphertext
+    assert "".join(pasc.pasc_decrypt(ciphertext, "LEMON", compiled)) == plaintext
+
+
+def test_compile_tr_sees_changes_in_place() -> None:
+    tr = pasc.vigenere_tr(ABC)
+    before = "".join(pasc.pasc_encrypt("ATTACK", "B", tr))
+    tr["B"] = tr["A"]
+    assert "".join(pasc.pasc_encrypt("ATTACK", "B", tr)) != before
+    assert "".join(pasc.pasc_encrypt("ATTACK", "B", tr)) == "ATTACK"